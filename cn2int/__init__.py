@@ -1,4 +1,18 @@
 from .cn2int import (int2roman, roman2int,
                      int2chinese, float2chinese, chinese2int, chinese2float,
-                     convert2int)
+                     convert2int,
+                     int2chinese_many, float2chinese_many,
+                     chinese2int_many, chinese2float_many,
+                     int2roman_many, roman2int_many, convert2int_many,
+                     convert2int_column,
+                     canonicalize, canonicalize_many, try_canonicalize,
+                     transcode, transcode_many, try_transcode,
+                     Status, try_roman2int, try_chinese2int, try_chinese2float,
+                     try_convert2int,
+                     Formatter, Parser, Cache, IncrementalParser)
+from .text import find_numerals, normalize_text
+from .files import convert_file
+from .validate import (is_chinese_numeral, is_roman_numeral,
+                       filter_chinese_numerals, filter_roman_numerals)
+from .parallel import parallel_convert
 from .performance import performance
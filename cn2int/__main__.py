@@ -0,0 +1,232 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""命令行工具: 逐行转换文件或标准输入中的数字, 写到标准输出.
+
+    python -m cn2int chinese2int numbers.txt
+    cat data.tsv | python -m cn2int int2chinese -f tsv -c 2 --upper --stats
+
+按块读写, 内存占用恒定. 输入格式: lines(每行一个数字), tsv, csv. 转换失败时按
+--errors处理: raise(报错退出), coerce(用--default代替), ignore(丢弃该行).
+"""
+
+import argparse
+import csv
+import io
+import itertools
+import sys
+from timeit import default_timer
+
+from .files import parsers, formatters, string_converter
+
+
+# 读写缓冲区的大小, 也是每批读取的字节数.
+BUFFER_SIZE = 1 << 20
+
+# csv每批处理的行数.
+BATCH_SIZE = 4096
+
+
+class ConversionError(Exception):
+    """--errors=raise时, 转换失败的行."""
+
+
+def make_converter(args):
+    """根据命令行参数, 返回convert(field) => string. 返回None表示转换失败."""
+    if args.mode not in ("int2chinese", "float2chinese"):
+        return string_converter(args.mode)
+    return string_converter(args.mode, lower=not args.upper,
+                            enumeration=args.enumeration,
+                            use_liang=args.liang,
+                            use_simple_ten=args.simple_ten,
+                            use_simple_zero_tail=args.simple_zero_tail,
+                            precision=args.precision)
+
+
+class Stats:
+    """行数、失败数和耗时."""
+
+    def __init__(self):
+        self.rows = 0
+        self.errors = 0
+        self.start = default_timer()
+
+    def report(self, stream):
+        cost = default_timer() - self.start
+        rate = self.rows / cost if cost > 0 else 0
+        stream.write("cn2int: %d rows, %d errors, %.3f s, %d rows/s\n"
+                     % (self.rows, self.errors, cost, rate))
+
+
+def convert_lines(source, name, output, convert, args, stats):
+    """lines, tsv格式. 每批读取约BUFFER_SIZE字节, 转换后一次写出."""
+    separator = "\t" if args.format == "tsv" else None
+    column = args.column - 1
+    errors = args.errors
+    default = args.default
+    lineno = 0
+    while True:
+        lines = source.readlines(BUFFER_SIZE)
+        if not lines:
+            break
+        result = []
+        for line in lines:
+            lineno += 1
+            body = line.rstrip("\r\n")
+            if args.header and lineno == 1:
+                result.append(line)
+                continue
+            stats.rows += 1
+            if separator is None:
+                value = convert(body)
+            else:
+                fields = body.split(separator)
+                value = convert(fields[column]) if column < len(fields) else None
+            if value is None:
+                stats.errors += 1
+                if errors == "raise":
+                    output.writelines(result)
+                    raise ConversionError("%s:%d: cannot convert %r" % (name, lineno, body))
+                if errors == "ignore":
+                    continue
+                value = default
+                if separator is not None and column >= len(fields):
+                    fields += [""] * (column + 1 - len(fields))
+            if separator is None:
+                result.append(value + line[len(body):])
+            else:
+                fields[column] = value
+                result.append(separator.join(fields) + line[len(body):])
+        output.writelines(result)
+
+
+def convert_csv(source, name, output, convert, args, stats):
+    """csv格式. 每批处理BATCH_SIZE行."""
+    reader = csv.reader(source)
+    writer = csv.writer(output, lineterminator="\n")
+    column = args.column - 1
+    if args.header:
+        for row in itertools.islice(reader, 1):
+            writer.writerow(row)
+    while True:
+        rows = list(itertools.islice(reader, BATCH_SIZE))
+        if not rows:
+            break
+        result = []
+        for row in rows:
+            stats.rows += 1
+            value = convert(row[column]) if column < len(row) else None
+            if value is None:
+                stats.errors += 1
+                if args.errors == "raise":
+                    writer.writerows(result)
+                    raise ConversionError("%s:%d: cannot convert %r"
+                                          % (name, reader.line_num, row))
+                if args.errors == "ignore":
+                    continue
+                value = args.default
+                if column >= len(row):
+                    row += [""] * (column + 1 - len(row))
+            row[column] = value
+            result.append(row)
+        writer.writerows(result)
+
+
+def open_stdin(encoding):
+    try:
+        raw = io.FileIO(sys.stdin.fileno(), "r", closefd=False)
+        stream = io.BufferedReader(raw, BUFFER_SIZE)
+    except (AttributeError, OSError, io.UnsupportedOperation):
+        stream = sys.stdin.buffer
+    return io.TextIOWrapper(stream, encoding=encoding, newline="")
+
+
+def open_stdout(encoding):
+    try:
+        raw = io.FileIO(sys.stdout.fileno(), "w", closefd=False)
+        stream = io.BufferedWriter(raw, BUFFER_SIZE)
+    except (AttributeError, OSError, io.UnsupportedOperation):
+        stream = sys.stdout.buffer
+    return io.TextIOWrapper(stream, encoding=encoding, newline="")
+
+
+def parse_args(argv):
+    parser = argparse.ArgumentParser(
+        prog="cn2int",
+        description="逐行转换文件或标准输入中的数字, 写到标准输出.")
+    parser.add_argument("mode", choices=sorted(parsers) + formatters,
+                        help="转换函数")
+    parser.add_argument("files", nargs="*", default=["-"],
+                        help='输入文件, "-"表示标准输入. 默认标准输入')
+    parser.add_argument("-f", "--format", choices=["lines", "tsv", "csv"],
+                        default="lines", help="输入格式. 默认lines")
+    parser.add_argument("-c", "--column", type=int, default=1,
+                        help="tsv, csv中要转换的列, 从1开始. 默认1")
+    parser.add_argument("--header", action="store_true",
+                        help="每个输入文件的第一行是表头, 原样输出")
+    parser.add_argument("-e", "--errors", choices=["raise", "coerce", "ignore"],
+                        default="raise",
+                        help="转换失败时: raise报错退出, coerce用--default代替, "
+                             "ignore丢弃该行. 默认raise")
+    parser.add_argument("--default", default="",
+                        help='--errors=coerce时代替的值. 默认""')
+    parser.add_argument("-o", "--output", help="输出文件. 默认标准输出")
+    parser.add_argument("--encoding", default="utf-8", help="输入输出的编码. 默认utf-8")
+    parser.add_argument("--stats", action="store_true",
+                        help="结束时向标准错误输出行数、失败数和吞吐量")
+
+    group = parser.add_argument_group("int2chinese, float2chinese的选项")
+    group.add_argument("--upper", action="store_true", help="使用大写中文数字")
+    group.add_argument("--enumeration", action="store_true", help="使用枚举表示")
+    group.add_argument("--liang", action="store_true", help='用"两"替代"二"')
+    group.add_argument("--simple-ten", action="store_true", help='省略开头"一十"的"一"')
+    group.add_argument("--simple-zero-tail", action="store_true", help="省略末尾的单位")
+    group.add_argument("--precision", type=int, default=6, help="小数点后的位数. 默认6")
+
+    args = parser.parse_intermixed_args(argv)
+    if args.column < 1:
+        parser.error("--column must be >= 1")
+    return args
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    convert = make_converter(args)
+    process = convert_csv if args.format == "csv" else convert_lines
+    stats = Stats()
+
+    if args.output:
+        output = open(args.output, "w", encoding=args.encoding, newline="",
+                      buffering=BUFFER_SIZE)
+    else:
+        output = open_stdout(args.encoding)
+    try:
+        for name in args.files:
+            if name == "-":
+                source = open_stdin(args.encoding)
+                process(source, "<stdin>", output, convert, args, stats)
+                source.detach()
+            else:
+                with open(name, encoding=args.encoding, newline="",
+                          buffering=BUFFER_SIZE) as source:
+                    process(source, name, output, convert, args, stats)
+    except ConversionError as error:
+        sys.stderr.write("cn2int: %s\n" % error)
+        return 1
+    except BrokenPipeError:
+        # 下游提前退出, e.g. `| head`
+        return 0
+    finally:
+        try:
+            output.flush()
+        except BrokenPipeError:
+            pass
+        if args.output:
+            output.close()
+        if args.stats:
+            stats.report(sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,120 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""pandas.Series的cn2int访问器. 需要安装pandas和NumPy.
+
+导入本模块后, 可以像使用`.str`一样使用`.cn2int`:
+
+    import cn2int.accessor
+    df["amount"].cn2int.chinese2int()
+
+按chunksize行分块调用cn2int.array中的向量化函数, 内存占用与chunksize成正比. 结果是
+与原Series索引相同的可空类型Series("Int64", "Float64", "string"), 输入中的缺失值和
+转换失败的项为<NA>.
+"""
+
+try:
+    import pandas as pd
+except ImportError:
+    pd = None
+
+from . import array
+from .array import np
+
+
+__all__ = ["SeriesAccessor"]
+
+
+def require_pandas():
+    if pd is None:
+        raise ImportError("cn2int.accessor requires pandas")
+    array.require_numpy()
+
+
+class SeriesAccessor:
+    """pandas.Series的cn2int访问器. 通过`series.cn2int`使用.
+
+    参数:
+        series (pandas.Series): 待转换的Series.
+    """
+
+    def __init__(self, series):
+        require_pandas()
+        self.series = series
+
+    def chunks(self, chunksize):
+        """生成(起始行, 切片, 缺失值掩码)."""
+        series = self.series
+        for i in range(0, len(series), chunksize):
+            piece = series.iloc[i:i + chunksize]
+            yield i, piece, piece.isna().to_numpy()
+
+    def strings(self, chunksize):
+        """生成(起始行, NumPy object数组, 缺失值掩码). 由cn2int.array按长度转换成"<U"数组."""
+        for i, piece, nulls in self.chunks(chunksize):
+            strings = piece.to_numpy(dtype=object)
+            strings[nulls] = ""
+            yield i, strings, nulls
+
+    def wrap(self, values):
+        return pd.Series(values, index=self.series.index, name=self.series.name)
+
+    def chinese2int(self, chunksize=65536):
+        """中文数字 => 整数. 结果与chinese2int逐个转换一致.
+
+        返回:
+            pandas.Series: "Int64"类型.
+        """
+        numbers = np.zeros(len(self.series), dtype=np.int64)
+        mask = np.zeros(len(self.series), dtype=bool)
+        for i, strings, nulls in self.strings(chunksize):
+            n, valid = array.chinese2int_array(strings)
+            numbers[i:i + len(n)] = n
+            mask[i:i + len(n)] = nulls | ~valid
+        return self.wrap(pd.arrays.IntegerArray(numbers, mask))
+
+    def chinese2float(self, chunksize=65536):
+        """中文数字 => 浮点数. 结果与chinese2float逐个转换一致.
+
+        返回:
+            pandas.Series: "Float64"类型.
+        """
+        numbers = np.zeros(len(self.series), dtype=np.float64)
+        mask = np.zeros(len(self.series), dtype=bool)
+        for i, strings, nulls in self.strings(chunksize):
+            n, valid = array.chinese2float_array(strings)
+            numbers[i:i + len(n)] = np.where(valid, n, 0.0)
+            mask[i:i + len(n)] = nulls | ~valid
+        return self.wrap(pd.arrays.FloatingArray(numbers, mask))
+
+    def int2chinese(self, chunksize=65536, **options):
+        """整数 => 中文数字. options是int2chinese的转换选项.
+
+        返回:
+            pandas.Series: "string"类型.
+        """
+        strings = np.empty(len(self.series), dtype=object)
+        for i, piece, nulls in self.chunks(chunksize):
+            numbers = piece.to_numpy(dtype=np.int64, na_value=0)
+            s = array.int2chinese_array(numbers, output="object", **options)
+            s[nulls] = None
+            strings[i:i + len(s)] = s
+        return self.wrap(pd.array(strings, dtype="string"))
+
+    def float2chinese(self, chunksize=65536, **options):
+        """浮点数 => 中文数字. options是float2chinese的转换选项.
+
+        返回:
+            pandas.Series: "string"类型.
+        """
+        strings = np.empty(len(self.series), dtype=object)
+        for i, piece, nulls in self.chunks(chunksize):
+            numbers = piece.to_numpy(dtype=np.float64, na_value=np.nan)
+            s = array.float2chinese_array(numbers, output="object", **options)
+            s[nulls] = None
+            strings[i:i + len(s)] = s
+        return self.wrap(pd.array(strings, dtype="string"))
+
+
+if pd is not None:
+    pd.api.extensions.register_series_accessor("cn2int")(SeriesAccessor)
@@ -0,0 +1,130 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""asyncio批量转换. 大批量的转换在事件循环中直接执行会阻塞其他协程, 因此把输入切成不超过
+chunksize项的块, 逐块交给executor转换, 每块之间回到事件循环.
+
+    numbers = await cn2int.aio.achinese2int_many(strings)
+    async for s in cn2int.aio.aint2chinese_many(numbers, lazy=True):
+        ...
+
+输入可以是可迭代对象或异步可迭代对象. lazy=True时返回异步生成器, 消费者取完一块的结果
+后才转换下一块, 同时最多只有一块在转换.
+"""
+
+import asyncio
+import functools
+import itertools
+
+from .cn2int import (Formatter, chinese2int_many, chinese2float_many,
+                     roman2int_many, convert2int_many, int2roman_many)
+
+
+__all__ = ["achinese2int_many", "achinese2float_many", "aroman2int_many",
+           "aconvert2int_many", "aint2chinese_many", "afloat2chinese_many",
+           "aint2roman_many"]
+
+
+async def chunks(items, chunksize):
+    """可迭代对象或异步可迭代对象 => 不超过chunksize项的list."""
+    if hasattr(items, "__aiter__"):
+        chunk = []
+        async for item in items:
+            chunk.append(item)
+            if len(chunk) >= chunksize:
+                yield chunk
+                chunk = []
+        if chunk:
+            yield chunk
+        return
+    iterator = iter(items)
+    while True:
+        chunk = list(itertools.islice(iterator, chunksize))
+        if not chunk:
+            return
+        yield chunk
+
+
+async def convert_chunks(convert, items, chunksize, executor):
+    """逐块在executor中调用convert(chunk) => list, 逐项生成结果."""
+    if chunksize < 1:
+        raise ValueError("chunksize must be >= 1")
+    loop = asyncio.get_running_loop()
+    async for chunk in chunks(items, chunksize):
+        for result in await loop.run_in_executor(executor, convert, chunk):
+            yield result
+
+
+async def collect(results):
+    return [result async for result in results]
+
+
+def convert_many(convert, items, chunksize, executor, lazy):
+    results = convert_chunks(convert, items, chunksize, executor)
+    return results if lazy else collect(results)
+
+
+def achinese2int_many(strings, errors="raise", default=None, lazy=False,
+                      chunksize=1024, executor=None):
+    """异步批量 中文数字 => 整数. 结果同chinese2int_many.
+
+    参数:
+        strings (iterable | async iterable): 中文数字序列.
+        errors, default: 同chinese2int_many.
+        lazy (bool): 为True时返回异步生成器, 否则返回可以await的协程, 结果是list.
+            默认False.
+        chunksize (int): 每块的项数, 决定每次占用事件循环之外的线程的时长. 默认1024.
+        executor (concurrent.futures.Executor): 默认使用事件循环的默认executor.
+
+    返回:
+        coroutine | async generator: 整数序列.
+    """
+    convert = functools.partial(chinese2int_many, errors=errors, default=default)
+    return convert_many(convert, strings, chunksize, executor, lazy)
+
+
+def achinese2float_many(strings, errors="raise", default=None, lazy=False,
+                        chunksize=1024, executor=None):
+    """异步批量 中文数字 => 浮点数. 结果同chinese2float_many, 参数同achinese2int_many."""
+    convert = functools.partial(chinese2float_many, errors=errors, default=default)
+    return convert_many(convert, strings, chunksize, executor, lazy)
+
+
+def aroman2int_many(strings, errors="raise", default=None, lazy=False,
+                    chunksize=1024, executor=None):
+    """异步批量 罗马数字 => 整数. 结果同roman2int_many, 参数同achinese2int_many."""
+    convert = functools.partial(roman2int_many, errors=errors, default=default)
+    return convert_many(convert, strings, chunksize, executor, lazy)
+
+
+def aconvert2int_many(strings, errors="raise", default=None, lazy=False,
+                      chunksize=1024, executor=None):
+    """异步批量 数字 => 整数. 结果同convert2int_many, 参数同achinese2int_many."""
+    convert = functools.partial(convert2int_many, errors=errors, default=default)
+    return convert_many(convert, strings, chunksize, executor, lazy)
+
+
+def aint2roman_many(numbers, lazy=False, chunksize=1024, executor=None):
+    """异步批量 整数 => 罗马数字. 结果同int2roman_many, 参数同achinese2int_many."""
+    return convert_many(int2roman_many, numbers, chunksize, executor, lazy)
+
+
+def aint2chinese_many(numbers, lazy=False, chunksize=1024, executor=None, **options):
+    """异步批量 整数 => 中文数字. 结果同int2chinese_many.
+
+    参数:
+        numbers (iterable | async iterable): 整数序列.
+        lazy, chunksize, executor: 同achinese2int_many.
+        options: int2chinese的转换选项, 只处理一次.
+
+    返回:
+        coroutine | async generator: 中文数字序列. 超出转换范围的项为None.
+    """
+    formatter = Formatter(**options)
+    return convert_many(formatter.format_many, numbers, chunksize, executor, lazy)
+
+
+def afloat2chinese_many(numbers, lazy=False, chunksize=1024, executor=None, **options):
+    """异步批量 浮点数 => 中文数字. 结果同float2chinese_many, 参数同aint2chinese_many."""
+    formatter = Formatter(**options)
+    return convert_many(formatter.format_float_many, numbers, chunksize, executor, lazy)
@@ -0,0 +1,608 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""NumPy数组 和 中文数字的相互转换. 需要安装NumPy.
+
+整数数组 => 中文数字: 按"万"分成3段, 每段查表得到中文数字, 再按段拼接. 查表和拼接都是
+数组运算, 结果与int2chinese逐个转换完全一致.
+
+中文数字数组 => 整数数组: 码位查表得到整数, 再逐列逆序扫描, 每一列对所有行同时做一步
+chinese2int_scan的状态转移. 结果和状态码与try_chinese2int逐个转换完全一致.
+
+浮点数数组 <=> 中文数字数组: 舍入和拆分按float_split的步骤逐步做数组运算, 整数部分和
+小数部分分别批量转换, 结果与float2chinese, try_chinese2float逐个转换完全一致.
+"""
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+from .cn2int import (Table, Status, segment_tables, int2chinese_converter,
+                     chinese_simple_ten, chinese_simple_zero_tail,
+                     chinese2int_signed, chinese2float_signed)
+
+
+__all__ = ["int2chinese_array", "chinese2int_array", "chinese2int_array_status",
+           "float2chinese_array", "chinese2float_array", "chinese2float_array_status"]
+
+
+# (选项) => 查找表. 每种选项组合只在首次使用时生成.
+tables = {}
+
+
+def require_numpy():
+    if np is None:
+        raise ImportError("cn2int.array requires NumPy")
+
+
+def int2chinese_tables(lower, enumeration, use_liang, use_simple_ten,
+                       use_simple_zero_tail, use_upper_zero):
+    """生成int2chinese_array的查找表.
+
+    返回:
+        tuple: (zero, minus, pieces). pieces是6个长度10000的字符串数组:
+            small: 小于1万的整数.
+            wan_top, yi_top: 最高分段, 已带"万"或"亿".
+            middle: "万"分段, 已带"万".
+            after: 紧跟在"万"之后的个位分段.
+            gap: "万"分段为零时, 紧跟在"亿"之后的个位分段.
+    """
+    if not enumeration:
+        use_upper_zero = False
+    else:
+        use_liang = use_simple_ten = use_simple_zero_tail = False
+    key = (lower, enumeration, use_liang, use_simple_ten,
+           use_simple_zero_tail, use_upper_zero)
+    result = tables.get(key)
+    if result is not None:
+        return result
+
+    if enumeration:
+        if lower:
+            digits = Table.lower_traditional if use_upper_zero else Table.lower_enumeration
+        else:
+            digits = Table.upper_enumeration
+        top = list(map(int2chinese_converter(lower, True, use_upper_zero=use_upper_zero),
+                       range(10000)))
+        padded = list(map(int2chinese_converter(lower, True, use_upper_zero=use_upper_zero,
+                                                width=4), range(10000)))
+        pieces = [top, top, top, padded, padded, padded]
+    else:
+        if lower:
+            digits = Table.lower_traditional
+            delimiters = Table.lower_delimiter
+        else:
+            digits = Table.upper_traditional
+            delimiters = Table.upper_delimiter
+        wan, yi = delimiters[1], delimiters[2]
+        low, high, low_zero, high_zero = segment_tables(lower, use_liang)
+
+        def head(s, p):
+            return chinese_simple_ten(s, p) if use_simple_ten else s
+
+        def tail(prefix, s):
+            # chinese_simple_zero_tail只看末尾的3个字符, 用前一个分隔符代替前面的部分.
+            if use_simple_zero_tail:
+                return chinese_simple_zero_tail(prefix + s, lower)[len(prefix):]
+            return s
+
+        # 小于1万的整数不需要拼接, 直接由int2chinese_converter生成.
+        small = list(map(int2chinese_converter(lower, False, use_liang, use_simple_ten,
+                                               use_simple_zero_tail), range(10000)))
+        wan_top = [head(high[p], p) + wan for p in range(10000)]
+        yi_top = [head(high[p], p) + yi for p in range(10000)]
+        middle = [high_zero[p] + wan if p else "" for p in range(10000)]
+        after = [tail(wan, low_zero[p]) for p in range(10000)]
+        gap = [tail(yi, "零" + low[p]) if p else "" for p in range(10000)]
+        pieces = [small, wan_top, yi_top, middle, after, gap]
+
+    pieces = tuple(np.array(piece, dtype=str) for piece in pieces)
+    result = (digits[0], digits[-1], pieces)
+    tables[key] = result
+    return result
+
+
+def int2chinese_array(numbers, lower=True, enumeration=False,
+                      use_liang=False,
+                      use_simple_ten=False,
+                      use_simple_zero_tail=False,
+                      use_upper_zero=False,
+                      width=0,
+                      output="array"):
+    """整数数组 => 中文数字数组. 结果与int2chinese逐个转换一致.
+
+    参数:
+        numbers (array_like): 整数数组, 会转换成一维int64数组.
+        output (string): 返回值的类型. "array": NumPy字符串数组, 超出转换范围的
+            项为""; "object": NumPy object数组, 超出转换范围的项为None; "list":
+            list, 超出转换范围的项为None. 默认"array".
+
+        其余参数同int2chinese.
+
+    返回:
+        numpy.ndarray | list: 中文数字.
+    """
+    require_numpy()
+    if output not in ("array", "object", "list"):
+        raise ValueError('output must be "array", "object" or "list"')
+    zero, minus, pieces = int2chinese_tables(
+        lower, enumeration, use_liang, use_simple_ten,
+        use_simple_zero_tail, use_upper_zero)
+    small, wan_top, yi_top, middle, after, gap = pieces
+    add = np.char.add
+
+    numbers = np.asarray(numbers, dtype=np.int64).ravel()
+    valid = (numbers > -1000000000000) & (numbers < 1000000000000)
+    negative = numbers < 0
+    n = np.where(valid, np.abs(numbers), 0)
+    high = n // 100000000
+    mid = n // 10000 % 10000
+    low = n % 10000
+
+    # 按位数分3种情况, 每种情况查表拼接, 最后合并.
+    strings = np.where(n < 10000, small[low], add(wan_top[mid], after[low]))
+    index = np.flatnonzero(n >= 100000000)
+    if len(index):
+        p, q, r = high[index], mid[index], low[index]
+        tail = np.where(q != 0, after[r], gap[r])
+        large = add(add(yi_top[p], middle[q]), tail)
+        strings = strings.astype(np.promote_types(strings.dtype, large.dtype))
+        strings[index] = large
+
+    if width > 0:
+        count = np.clip(width - np.char.str_len(strings), 0, width)
+        fill = np.array([zero * i for i in range(width + 1)])
+        strings = add(fill[count], strings)
+    if negative.any():
+        signs = np.array(["", minus])
+        strings = add(signs[negative.astype(np.intp)], strings)
+
+    if output == "array":
+        strings[~valid] = ""
+        return strings
+    strings = strings.astype(object)
+    strings[~valid] = None
+    if output == "list":
+        return strings.tolist()
+    return strings
+
+
+def chinese2int_lookup():
+    """生成 码位 => 整数 的稠密查找表. 不支持的字符对应INVALID."""
+    result = tables.get("chinese2int")
+    if result is None:
+        size = max(ord(c) for c in Table.chinese2int) + 2
+        result = np.full(size, INVALID, dtype=np.int64)
+        for c, p in Table.chinese2int.items():
+            result[ord(c)] = p
+        tables["chinese2int"] = result
+    return result
+
+
+# 不支持的字符
+INVALID = -(1 << 40)
+
+# 10的0-11次方, 枚举表示的每一位的权值.
+POWERS = [10**i for i in range(12)]
+
+# 字符串数组和码位矩阵的宽度都取最长的一项. 超过该长度的项不进入数组, 逐个用标量函数
+# 转换, 一个很长的字符串不会让整批的内存按它的长度分配.
+MAX_WIDTH = 32
+
+
+def unicode_array(strings):
+    """转换成一维NumPy字符串数组("<U")."""
+    strings = np.asarray(strings)
+    if strings.dtype.kind != "U":
+        strings = strings.astype(str)
+    return strings.ravel()
+
+
+def unicode_buckets(strings):
+    """按长度分成两部分: 不超过MAX_WIDTH个字符的项组成的一维"<U"数组, 和其余的项.
+
+    返回:
+        tuple: (short, index, long). short是"<U"数组; index是其余项的位置(升序),
+            long是这些项的字符串列表.
+    """
+    if not isinstance(strings, np.ndarray) or strings.dtype.kind == "O":
+        # 列表先检查长度, 避免先按最长的一项分配整个"<U"数组.
+        items = strings.ravel().tolist() if isinstance(strings, np.ndarray) else list(strings)
+        try:
+            wide = max(map(len, items), default=0) > MAX_WIDTH
+        except TypeError:
+            wide = False
+        if wide and all(type(s) is str for s in items):
+            index = [i for i, s in enumerate(items) if len(s) > MAX_WIDTH]
+            short = [s for s in items if len(s) <= MAX_WIDTH]
+            return (np.array(short, dtype="<U%d" % MAX_WIDTH), index,
+                    [items[i] for i in index])
+        strings = items
+    strings = unicode_array(strings)
+    if strings.dtype.itemsize // 4 <= MAX_WIDTH:
+        return strings, [], []
+    index = np.flatnonzero(np.char.str_len(strings) > MAX_WIDTH)
+    short = np.delete(strings, index).astype("<U%d" % MAX_WIDTH)
+    return short, index.tolist(), strings[index].tolist()
+
+
+def insert_results(numbers, status, index, results):
+    """把逐个转换的(number, status)插回index处, 返回完整的(numbers, status)."""
+    positions = [i - k for k, i in enumerate(index)]
+    numbers = np.insert(numbers, positions, [number for number, _ in results])
+    status = np.insert(status, positions, [code for _, code in results])
+    return numbers, status
+
+
+def code_chunks(strings, chunksize):
+    """按chunksize行分块, 生成(起始行, (N, W)的uint32码位矩阵)."""
+    width = strings.dtype.itemsize // 4
+    for i in range(0, len(strings), chunksize):
+        chunk = np.ascontiguousarray(strings[i:i + chunksize])
+        yield i, chunk.view(np.uint32).reshape(len(chunk), width)
+
+
+def chinese2int_values(codes, lookup):
+    """码位矩阵 => (values, end).
+
+    参数:
+        codes (numpy.ndarray): (N, W)的uint32数组, 每行是一个中文数字的码位,
+            右侧以0填充.
+        lookup (numpy.ndarray): 码位 => 整数 的稠密查找表.
+
+    返回:
+        tuple: (values, end). values是转置成(W, N)的int64数组, 每一列在内存中连续,
+            填充位为INVALID; end是每行的长度.
+    """
+    count, width = codes.shape
+    values = lookup[np.minimum(codes.T, len(lookup) - 1)]
+    values[codes.T == 0] = INVALID
+    filled = codes != 0
+    end = np.where(filled.any(axis=1),
+                   width - np.argmax(filled[:, ::-1], axis=1), 0)
+    return values, end
+
+
+def chinese2int_columns(values, end, enumeration=True):
+    """chinese2int_scan的数组版本, 含正负号. 逆序逐列扫描, 每一列对所有行同时做一步
+    状态转移.
+
+    参数:
+        values, end: 见chinese2int_values. 只扫描每行的[0, end)部分.
+        enumeration (bool | numpy.ndarray): 是否接受枚举表示, 可以逐行指定. 默认True.
+
+    返回:
+        tuple: (numbers, status), int64数组和int8数组.
+    """
+    width, count = values.shape
+    status = np.zeros(count, dtype=np.int8)
+    status[end == 0] = Status.INVALID_GRAMMAR
+
+    # 第一个字符: 正负号
+    first = values[0] if width else np.zeros(count, dtype=np.int64)
+    status[(status == 0) & (first == INVALID)] = Status.INVALID_CHARACTER
+    status[(status == 0) & (first == -100)] = Status.INVALID_GRAMMAR
+    start = (first < 0).astype(np.int64)
+    sign = np.where(first == -1, -1, 1)
+    status[(status == 0) & (start >= end)] = Status.INVALID_GRAMMAR
+
+    # 枚举阶段的状态
+    traditional = np.zeros(count, dtype=bool)
+    number = np.zeros(count, dtype=np.int64)
+    k = np.zeros(count, dtype=np.int64)
+    digit = np.zeros(count, dtype=np.int64)
+    nonzero = np.zeros(count, dtype=np.int64)
+    overflow = np.zeros(count, dtype=bool)
+
+    # 传统阶段的状态, 含义同chinese2int_scan.
+    small = np.zeros(count, dtype=np.int64)
+    b = np.ones(count, dtype=np.int64)
+    flag_pair_a = np.zeros(count, dtype=bool)
+    flag_pair_b = np.zeros(count, dtype=bool)
+    delimiter = np.ones(count, dtype=np.int64)
+    total = np.zeros(count, dtype=np.int64)
+    last = np.zeros(count, dtype=np.int64)
+    skip = np.zeros(count, dtype=bool)
+    powers = np.array(POWERS, dtype=np.int64)
+
+    for j in range(width - 1, -1, -1):
+        p = values[j]
+        active = (j >= start) & (j < end) & (status == 0)
+        if j < width - 1:
+            active &= ~skip
+            skip[:] = False
+        if not active.any():
+            continue
+
+        bad = active & (p == INVALID)
+        status[bad] = Status.INVALID_CHARACTER
+        active &= ~bad
+
+        # 枚举阶段
+        e = active & ~traditional
+        if e.any():
+            status[e & (p < 0)] = Status.INVALID_GRAMMAR
+            is_digit = e & (p >= 0) & (p <= 9)
+            is_nonzero = is_digit & (p != 0)
+            overflow |= is_nonzero & (k >= 12)
+            add = is_nonzero & (k < 12)
+            number[add] += p[add] * powers[k[add]]
+            digit[is_nonzero] = p[is_nonzero]
+            nonzero += is_nonzero
+            k += is_digit
+
+            # 遇到第一个权值, 进入传统阶段.
+            unit = e & (p > 9)
+            if unit.any():
+                elided = unit & (k == 1) & (p > 10)
+                status[unit & ~elided & (nonzero > 1)] = Status.INVALID_GRAMMAR
+                b[elided] = p[elided] // 10
+                small[unit] = np.where(elided[unit], digit[unit] * b[unit], digit[unit])
+                flag_pair_a[unit] = ~elided[unit] & (nonzero[unit] == 1)
+                traditional |= unit
+
+        # 传统阶段
+        t = active & traditional & (status == 0)
+        if not t.any():
+            continue
+        last[t] = p[t]
+        status[t & (p < 0)] = Status.INVALID_GRAMMAR
+
+        is_digit = t & (p > 0) & (p < 10)
+        tiny = p * b
+        status[is_digit & (flag_pair_a | (tiny <= small))] = Status.INVALID_GRAMMAR
+        is_digit &= status == 0
+        small[is_digit] += tiny[is_digit]
+        flag_pair_a[is_digit] = True
+        flag_pair_b[is_digit] = False
+
+        is_delimiter = t & ((p == 10000) | (p == 100000000))
+        status[is_delimiter & flag_pair_b] = Status.INVALID_GRAMMAR
+        is_delimiter &= status == 0
+        if is_delimiter.any():
+            total[is_delimiter] += small[is_delimiter] * delimiter[is_delimiter]
+            small[is_delimiter] = 0
+            b[is_delimiter] = 1
+            # 万万为亿
+            if j > 0:
+                merge = (is_delimiter & (p == 10000) & (j - 1 >= start) &
+                         (values[j - 1] == 10000))
+                skip |= merge
+                p = np.where(merge, 100000000, p)
+                last[merge] = 100000000
+            up = is_delimiter & (p > delimiter)
+            status[is_delimiter & ~up & (delimiter == 100000000)] = Status.OVERFLOW
+            delimiter[up] = p[up]
+            delimiter[is_delimiter & ~up & (status == 0)] = 100000000
+            flag_pair_a[is_delimiter] = False
+
+        is_unit = t & (p >= 10) & (p <= 1000)
+        status[is_unit & (flag_pair_b | (p <= b))] = Status.INVALID_GRAMMAR
+        is_unit &= status == 0
+        b[is_unit] = p[is_unit]
+        flag_pair_a[is_unit] = False
+        flag_pair_b[is_unit] = True
+
+    ok = status == 0
+    plain = ok & ~traditional
+    if enumeration is not True:
+        # 只接受传统表示时, 数字不能连续出现, 零除外.
+        single = plain & ~enumeration
+        status[single & (nonzero > 1)] = Status.INVALID_GRAMMAR
+        number = np.where(single, digit, number)
+        plain &= enumeration
+    status[plain & (overflow | (number >= 1000000000000))] = Status.OVERFLOW
+    status[ok & traditional & (last > 10)] = Status.INVALID_GRAMMAR
+    small[last == 10] += 10
+    number = np.where(traditional, total + small * delimiter, number) * sign
+    number[status != 0] = 0
+    return number, status
+
+
+def chinese2int_array(strings, chunksize=8192):
+    """中文数字数组 => 整数数组. 结果与try_chinese2int逐个转换一致.
+
+    码位经稠密查找表转换成整数, 然后逐列逆序扫描, 每一列对所有行同时做一步
+    chinese2int_scan的状态转移. 按chunksize行分块处理, 超过MAX_WIDTH个字符的项逐个
+    转换, 内存占用有界.
+
+    参数:
+        strings (array_like): 中文数字数组, 会转换成一维NumPy字符串数组("<U").
+        chunksize (int): 每块的行数. 默认8192.
+
+    返回:
+        tuple: (numbers, valid). numbers是int64数组, 转换失败的项为0; valid是
+            bool数组, 表示是否转换成功.
+    """
+    numbers, status = chinese2int_array_status(strings, chunksize)
+    return numbers, status == 0
+
+
+def chinese2int_array_status(strings, chunksize=8192):
+    """同chinese2int_array, 返回(numbers, status). status是Status状态码的int8数组."""
+    require_numpy()
+    strings, index, long = unicode_buckets(strings)
+    lookup = chinese2int_lookup()
+
+    numbers = np.zeros(len(strings), dtype=np.int64)
+    status = np.zeros(len(strings), dtype=np.int8)
+    for i, codes in code_chunks(strings, chunksize):
+        values, end = chinese2int_values(codes, lookup)
+        numbers[i:i + chunksize], status[i:i + chunksize] = \
+            chinese2int_columns(values, end)
+    if long:
+        table = Table.chinese2int
+        results = [chinese2int_signed(s, 0, table, True, True) for s in long]
+        numbers, status = insert_results(numbers, status, index, results)
+    return numbers, status
+
+
+def float_split_array(numbers, level):
+    """float_split的数组版本. 每一步浮点运算与float_split相同, 舍入结果一致.
+
+    返回:
+        tuple: (a, b), int64数组. a是整数部分, b是乘以level并四舍五入后的小数部分.
+    """
+    negative = numbers < 0
+    n = np.abs(numbers)
+    a = np.trunc(n)
+    n = n - a
+    n = n * level
+    b = np.trunc(n)
+    n = n - b
+    n = n * 10
+    n = np.where((n - np.trunc(n)) * 10 > 5, n + 1, n)
+    b = b.astype(np.int64) + (n >= 5)
+    a = a.astype(np.int64)
+    carry = b == level
+    a += carry
+    b[carry] = 0
+    a[negative] *= -1
+    return a, b
+
+
+def float2chinese_array(numbers, lower=True, precision=6,
+                        use_liang=False,
+                        use_simple_ten=False,
+                        use_simple_zero_tail=False,
+                        output="array"):
+    """浮点数数组 => 中文数字数组. 结果与float2chinese逐个转换一致.
+
+    先对整个数组做float_split的舍入和拆分, 再用int2chinese_array分别转换整数部分和
+    小数部分, 最后拼接.
+
+    参数:
+        numbers (array_like): 浮点数数组, 会转换成一维float64数组. NaN和无穷大
+            视为超出转换范围.
+        output (string): 见int2chinese_array.
+
+        其余参数同float2chinese.
+
+    返回:
+        numpy.ndarray | list: 中文数字.
+    """
+    require_numpy()
+    if output not in ("array", "object", "list"):
+        raise ValueError('output must be "array", "object" or "list"')
+    precision = max(min(precision, 12), 0)
+    level = Table.levels[precision]
+
+    numbers = np.asarray(numbers, dtype=np.float64).ravel()
+    valid = (numbers > -1e12) & (numbers < 1e12)
+    a, b = float_split_array(np.where(valid, numbers, 0.0), level)
+    valid &= (a > -1000000000000) & (a < 1000000000000)
+
+    strings = int2chinese_array(a, lower, False,
+                                use_liang=use_liang,
+                                use_simple_ten=use_simple_ten,
+                                use_simple_zero_tail=use_simple_zero_tail)
+    fraction = int2chinese_array(b, lower, True, use_upper_zero=True,
+                                 width=precision)
+    strings = np.char.add(np.char.add(strings, "点" if lower else "點"), fraction)
+
+    if output == "array":
+        strings[~valid] = ""
+        return strings
+    strings = strings.astype(object)
+    strings[~valid] = None
+    if output == "list":
+        return strings.tolist()
+    return strings
+
+
+def chinese2float_columns(values, end):
+    """chinese2float_signed的数组版本.
+
+    参数:
+        values, end: 见chinese2int_values.
+
+    返回:
+        tuple: (numbers, status), float64数组和int8数组.
+    """
+    width, count = values.shape
+    rows = np.arange(count)
+    status = np.zeros(count, dtype=np.int8)
+    first = values[0] if width else np.zeros(count, dtype=np.int64)
+    start = ((first < 0) & (first != INVALID)).astype(np.int64)
+    sign = np.where(first == -1, -1.0, 1.0)
+
+    # 检查顺序同chinese2float_signed: 第一个字符, 最后一个字符, 小数部分.
+    status[end == 0] = Status.INVALID_GRAMMAR
+    status[(status == 0) & (first == INVALID)] = Status.INVALID_CHARACTER
+    status[(status == 0) & (first == -100)] = Status.INVALID_GRAMMAR
+    last = values[np.maximum(end - 1, 0), rows]
+    status[(status == 0) & (last == INVALID)] = Status.INVALID_CHARACTER
+
+    # "六点三万人", "五点八亿斤"
+    tail = np.where(last > 1000, last, 1)
+    stop = end - (last > 1000)
+
+    # 小数部分之前的第一个非数字字符: 是"点"时按浮点数处理, 是非法字符时转换失败.
+    columns = np.arange(width)[:, None]
+    other = (values < 0) | (values > 9)
+    other &= (columns >= start) & (columns < stop)
+    found = other.any(axis=0)
+    dot = np.where(found, width - 1 - np.argmax(other[::-1], axis=0), -1)
+    p = values[np.maximum(dot, 0), rows]
+    status[(status == 0) & found & (p == INVALID)] = Status.INVALID_CHARACTER
+    point = (status == 0) & found & (p == -100)
+
+    b_length = np.where(point, stop - dot - 1, 0)
+    status[point & (b_length == 0)] = Status.INVALID_GRAMMAR
+    status[point & (b_length > 12)] = Status.OVERFLOW
+    point &= status == 0
+    b_length[~point] = 0
+
+    # 小数部分
+    b = np.zeros(count, dtype=np.int64)
+    if point.any():
+        for j in range(width):
+            digits = point & (columns[j] > dot) & (columns[j] < stop)
+            if digits.any():
+                b = np.where(digits, b * 10 + values[j], b)
+
+    # 整数部分. 有"点"时只扫描"点"之前的部分, 且只接受传统表示.
+    a, a_status = chinese2int_columns(values, np.where(point, dot, end), ~point)
+    ok = status == 0
+    status[ok] = a_status[ok]
+
+    a = np.abs(a).astype(np.float64)
+    levels = np.array(Table.levels, dtype=np.int64)
+    number = np.where(point, (a + b / levels[b_length]) * tail, a) * sign
+    number[status != 0] = np.nan
+    return number, status
+
+
+def chinese2float_array(strings, chunksize=8192):
+    """中文数字数组 => 浮点数数组. 结果与try_chinese2float逐个转换一致.
+
+    参数:
+        strings (array_like): 中文数字数组, 会转换成一维NumPy字符串数组("<U").
+        chunksize (int): 每块的行数. 默认8192.
+
+    返回:
+        tuple: (numbers, valid). numbers是float64数组, 转换失败的项为NaN; valid是
+            bool数组, 表示是否转换成功.
+    """
+    numbers, status = chinese2float_array_status(strings, chunksize)
+    return numbers, status == 0
+
+
+def chinese2float_array_status(strings, chunksize=8192):
+    """同chinese2float_array, 返回(numbers, status). status是Status状态码的int8数组."""
+    require_numpy()
+    strings, index, long = unicode_buckets(strings)
+    lookup = chinese2int_lookup()
+
+    numbers = np.zeros(len(strings), dtype=np.float64)
+    status = np.zeros(len(strings), dtype=np.int8)
+    for i, codes in code_chunks(strings, chunksize):
+        values, end = chinese2int_values(codes, lookup)
+        numbers[i:i + chunksize], status[i:i + chunksize] = \
+            chinese2float_columns(values, end)
+    if long:
+        table = Table.chinese2int
+        results = [chinese2float_signed(s, np.nan, table, True, True) for s in long]
+        numbers, status = insert_results(numbers, status, index, results)
+    return numbers, status
@@ -0,0 +1,130 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""Apache Arrow数组 和 中文数字的相互转换. 需要安装pyarrow和NumPy.
+
+按块转换: pyarrow.ChunkedArray逐个chunk转换, 超过chunksize行的chunk再零拷贝地切片.
+每一块转换成NumPy数组后, 调用cn2int.array中的向量化函数, 内存占用与chunksize成正比.
+输入中的null和转换失败的项, 在结果中都是null.
+"""
+
+try:
+    import pyarrow as pa
+except ImportError:
+    pa = None
+
+from . import array
+
+
+__all__ = ["chinese2int", "chinese2float", "int2chinese", "float2chinese"]
+
+
+def require_pyarrow():
+    if pa is None:
+        raise ImportError("cn2int.arrow requires pyarrow")
+    array.require_numpy()
+
+
+def slices(data, chunksize):
+    """pyarrow.Array | pyarrow.ChunkedArray => 不超过chunksize行的pyarrow.Array."""
+    chunks = data.chunks if isinstance(data, pa.ChunkedArray) else [data]
+    for chunk in chunks:
+        for i in range(0, len(chunk), chunksize):
+            yield chunk.slice(i, chunksize)
+
+
+def convert(data, convert_slice, result_type, chunksize):
+    """逐块调用convert_slice, 输入是Array时返回Array, 是ChunkedArray时返回ChunkedArray."""
+    require_pyarrow()
+    if not isinstance(data, (pa.Array, pa.ChunkedArray)):
+        data = pa.array(data)
+    results = [convert_slice(piece) for piece in slices(data, chunksize)]
+    if isinstance(data, pa.ChunkedArray):
+        return pa.chunked_array(results, type=result_type)
+    if not results:
+        return pa.array([], type=result_type)
+    return pa.concat_arrays(results)
+
+
+def string_slice(piece):
+    """字符串切片 => (NumPy object数组, null掩码). 由cn2int.array按长度转换成"<U"数组."""
+    if not (pa.types.is_string(piece.type) or pa.types.is_large_string(piece.type)):
+        raise TypeError("expected a string array, got %s" % piece.type)
+    nulls = piece.is_null().to_numpy(zero_copy_only=False)
+    strings = piece.fill_null("").to_numpy(zero_copy_only=False)
+    return strings, nulls
+
+
+def number_slice(piece, value_type):
+    """数值切片 => (NumPy数组, null掩码). null处填0."""
+    nulls = piece.is_null().to_numpy(zero_copy_only=False)
+    numbers = piece.cast(value_type).fill_null(0).to_numpy(zero_copy_only=False)
+    return numbers, nulls
+
+
+def chinese2int(data, chunksize=65536):
+    """中文数字字符串数组 => int64数组. 结果与chinese2int逐个转换一致.
+
+    参数:
+        data (pyarrow.Array | pyarrow.ChunkedArray): string或large_string类型.
+        chunksize (int): 每块的行数. 默认65536.
+
+    返回:
+        pyarrow.Array | pyarrow.ChunkedArray: int64. null和转换失败的项为null.
+    """
+    def convert_slice(piece):
+        strings, nulls = string_slice(piece)
+        numbers, valid = array.chinese2int_array(strings)
+        return pa.array(numbers, type=pa.int64(), mask=nulls | ~valid)
+    return convert(data, convert_slice, pa.int64(), chunksize)
+
+
+def chinese2float(data, chunksize=65536):
+    """中文数字字符串数组 => float64数组. 结果与chinese2float逐个转换一致.
+
+    参数同chinese2int.
+
+    返回:
+        pyarrow.Array | pyarrow.ChunkedArray: float64. null和转换失败的项为null.
+    """
+    def convert_slice(piece):
+        strings, nulls = string_slice(piece)
+        numbers, valid = array.chinese2float_array(strings)
+        return pa.array(numbers, type=pa.float64(), mask=nulls | ~valid)
+    return convert(data, convert_slice, pa.float64(), chunksize)
+
+
+def int2chinese(data, chunksize=65536, **options):
+    """整数数组 => 中文数字字符串数组. 结果与int2chinese逐个转换一致.
+
+    参数:
+        data (pyarrow.Array | pyarrow.ChunkedArray): 整数类型.
+        chunksize (int): 每块的行数. 默认65536.
+        options: int2chinese的转换选项.
+
+    返回:
+        pyarrow.Array | pyarrow.ChunkedArray: string. null和超出转换范围的项为null.
+    """
+    def convert_slice(piece):
+        numbers, nulls = number_slice(piece, pa.int64())
+        strings = array.int2chinese_array(numbers, **options)
+        return pa.array(strings, type=pa.string(), mask=nulls | (strings == ""))
+    return convert(data, convert_slice, pa.string(), chunksize)
+
+
+def float2chinese(data, chunksize=65536, **options):
+    """浮点数数组 => 中文数字字符串数组. 结果与float2chinese逐个转换一致.
+
+    参数:
+        data (pyarrow.Array | pyarrow.ChunkedArray): 浮点数类型.
+        chunksize (int): 每块的行数. 默认65536.
+        options: float2chinese的转换选项.
+
+    返回:
+        pyarrow.Array | pyarrow.ChunkedArray: string. null和超出转换范围的项为null.
+    """
+    def convert_slice(piece):
+        numbers, nulls = number_slice(piece, pa.float64())
+        strings = array.float2chinese_array(numbers, **options)
+        return pa.array(strings, type=pa.string(), mask=nulls | (strings == ""))
+    return convert(data, convert_slice, pa.string(), chunksize)
@@ -8,6 +8,7 @@ Home: https://github/citysu/cn2int
 """
 
 import re
+from collections import OrderedDict
 
 
 __version__ = "0.2.3"
@@ -15,12 +16,20 @@ __version__ = "0.2.3"
 
 __all__ = [
     "int2roman", "roman2int",
-    "int2chinese", "float2chinese", "chinese2int", "chinese2float"
-    "convert2int"
+    "int2chinese", "float2chinese", "chinese2int", "chinese2float",
+    "convert2int",
+    "int2chinese_many", "float2chinese_many",
+    "chinese2int_many", "chinese2float_many",
+    "int2roman_many", "roman2int_many", "convert2int_many",
+    "convert2int_column", "canonicalize", "canonicalize_many", "try_canonicalize",
+    "transcode", "transcode_many", "try_transcode",
+    "Formatter", "Parser", "Cache", "IncrementalParser",
+    "Status", "try_roman2int", "try_chinese2int", "try_chinese2float",
+    "try_convert2int",
 ]
 
 
-re_dot = re.compile(r"[点點]")
+re_arabic = re.compile(r"\s*[+-]?\d+(?:_\d+)*\s*")
 
 
 class Table:
@@ -29,6 +38,20 @@ class Table:
                   ["", "X", "XX", "XXX", "XL", "L", "LX", "LXX", "LXXX", "XC"],
                   ["", "C", "CC", "CCC", "CD", "D", "DC", "DCC", "DCCC", "CM"],
                   ["", "M", "MM", "MMM"]]
+    # 罗马数字全表, 首次使用时由roman_tables()生成.
+    # romans: 整数 => 罗马数字, romans_reverse: 罗马数字 => 整数.
+    romans = None
+    romans_reverse = None
+
+    # 传统表示的4位分段全表, 首次使用时由segment_tables()生成. (lower, use_liang) =>
+    # (low, high, low_zero, high_zero)
+    segments = {}
+    # 转码函数, 首次使用时由transcoder()生成. 目标格式的选项 => convert(s, default)
+    transcoders = {}
+    # 整数转换函数, 首次使用时由int2chinese_converter()生成. 转换选项 => convert(number)
+    converters = {}
+    # 规范形式的正则表达式, 首次使用时由canonical_regex()编译.
+    re_canonical = None
 
     lower_enumeration = "〇一二三四五六七八九负"
     lower_traditional = "零一二三四五六七八九负"
@@ -57,9 +80,52 @@ class Table:
     levels = [10**i for i in range(13)]
 
 
+class Status:
+    """数字字符串 => 整数/浮点数 的转换状态. try_系列函数返回该状态码, 不抛出异常."""
+    OK = 0
+    INVALID_CHARACTER = 1
+    INVALID_GRAMMAR = 2
+    OVERFLOW = 3
+
+
+def status_error(status, numerals="Chinese"):
+    """状态码 => 对应的异常实例.
+
+    INVALID_CHARACTER => KeyError, INVALID_GRAMMAR => ValueError,
+    OVERFLOW => OverflowError.
+    """
+    if status == Status.INVALID_CHARACTER:
+        return KeyError("invalid character in %s numerals" % numerals)
+    if status == Status.OVERFLOW:
+        return OverflowError("the value is out of the supported range")
+    return ValueError("invalid %s numerals" % numerals)
+
+
 # 罗马数字
 
 
+def roman_tables():
+    """生成罗马数字的正向表和反向表, 覆盖(0, 4000)内的全部整数. 只在首次调用时生成.
+
+    返回:
+        tuple: (list, dict). 整数 => 罗马数字, 罗马数字 => 整数.
+    """
+    if Table.romans is None:
+        romans = [None]
+        for number in range(1, 4000):
+            n, s = number, ""
+            i = 0
+            while n > 0:
+                p = n % 10
+                n //= 10
+                s = Table.int2roman[i][p] + s
+                i += 1
+            romans.append(s)
+        Table.romans_reverse = {s: i for i, s in enumerate(romans) if i > 0}
+        Table.romans = romans
+    return Table.romans, Table.romans_reverse
+
+
 def int2roman(number):
     """整数 => 罗马数字.
 
@@ -71,16 +137,34 @@ def int2roman(number):
     """
     if number <= 0 or number >= 4000:
         return None
-    
-    n, s = number, ""
-    i = 0
+    romans = Table.romans
+    if romans is None:
+        romans = roman_tables()[0]
+    return romans[number]
 
-    while n > 0:
-        p = n % 10
-        n //= 10
-        s = Table.int2roman[i][p] + s
-        i += 1
-    return s
+
+def try_roman2int(s, default=None):
+    """罗马数字 => 整数. 不抛出异常.
+
+    参数:
+        s (string): 罗马数字, 忽略大小写.
+        default: 转换失败时, 代替整数返回的值. 默认None.
+
+    返回:
+        tuple: (int, Status). 转换失败时为(default, 失败原因).
+    """
+    reverse = Table.romans_reverse
+    if reverse is None:
+        reverse = roman_tables()[1]
+    number = reverse.get(s)
+    if number is None:
+        s = s.upper()
+        number = reverse.get(s)
+        if number is None:
+            if set(s) <= Table.roman2int.keys():
+                return default, Status.INVALID_GRAMMAR
+            return default, Status.INVALID_CHARACTER
+    return number, Status.OK
 
 
 def roman2int(s):
@@ -92,68 +176,69 @@ def roman2int(s):
     返回:
         int: 正整数. 取值范围: (0, 4000).
     """
-    number, s = 0, s.upper()
-    length = len(s)
-
-    for i in range(length - 1):
-        p = Table.roman2int[s[i]]
-        p_next = Table.roman2int[s[i+1]]
-        number += -p if p < p_next else p
-    number += Table.roman2int[s[length-1]]
-    if s != int2roman(number):
-        raise ValueError("invalid Roman numerals")
+    number, status = try_roman2int(s)
+    if status:
+        raise status_error(status, "Roman")
     return number
 
 
 # 中文数字
 
 
-def chinese2int_enumeration(s):
-    """中文数字(枚举表示) => 非负整数
+def chinese2int_scan(s, start, end, table=Table.chinese2int,
+                     enumeration=True, traditional=True):
+    """中文数字 => 非负整数. 逆序单遍扫描s[start:end], 同时识别枚举表示和传统表示.
 
     参数:
-        s (string): 中文数字. 符合正则模式: "[〇一二三四五六七八九十百千万亿
-            零壹贰叁肆伍陆柒捌玖拾佰仟萬億两]+"
+        s (string): 中文数字. 不含正负号.
+        start, end (int): 扫描的范围.
+        table (dict): 字符 => 整数的映射表. 默认Table.chinese2int.
+        enumeration (bool): 是否接受枚举表示. 默认True.
+        traditional (bool): 是否接受传统表示. 默认True.
 
     返回:
-        int: 整数. 取值范围: [0, 1e12).
+        tuple: (int, Status). 整数取值范围: [0, 1e12).
     """
+    if start >= end:
+        return 0, Status.INVALID_GRAMMAR
+
+    # 枚举阶段: 逆序读取数字, 直到遇到第一个权值. 没有权值的是枚举表示, 否则是传统
+    # 表示, 已读取的数字即是传统表示末尾的"X"或"零X".
     number = 0
-    length = len(s)
-    i = 0
     m = 1
-
-    while length > 0:
-        length -= 1
-        p = Table.chinese2int[s[length]]
-
-        # 枚举表示 下不能出现大于9的单个数字.
+    digit = 0
+    count = 0
+    i = end
+
+    while i > start:
+        i -= 1
+        p = table.get(s[i])
+        if p is None:
+            return 0, Status.INVALID_CHARACTER
         if p > 9:
-            raise ValueError("invalid Chinese numerals")
-
-        number += p * m
-
-        # 范围限制
-        if i == 11 and len(s[:length].lstrip("零〇")) > 0:
-            raise OverflowError("the value is out of the supported range")
+            break
+        if p < 0:
+            # 正负号, "点"
+            return 0, Status.INVALID_GRAMMAR
+        if p != 0:
+            number += p * m
+            digit = p
+            count += 1
         m *= 10
-        i += 1
-
-    return number
-
-
-def chinese2int_traditional(s):
-    """中文数字(传统表示) => 非负整数
+    else:
+        if enumeration:
+            if number >= 1000000000000:
+                return 0, Status.OVERFLOW
+            return number, Status.OK
+        # 只接受传统表示时, 数字不能连续出现, 零除外.
+        if count > 1:
+            return 0, Status.INVALID_GRAMMAR
+        return digit, Status.OK
 
-    参数:
-        s (string): 中文数字. 符合正则模式: "[〇一二三四五六七八九十百千万亿
-            零壹贰叁肆伍陆柒捌玖拾佰仟萬億两]+"
+    if not traditional:
+        return 0, Status.INVALID_GRAMMAR
 
-    返回:
-        int: 整数. 取值范围: [0, 1e12).
-    """
-    number = 0
-    length = len(s)
+    # 传统阶段
 
     # 以"万亿萬億"作为分割符, 得到的每段中文数字子字符串为"X千X百X十X "的模式, 该子串对应
     # 的整数为small.
@@ -161,7 +246,7 @@ def chinese2int_traditional(s):
 
     # 中文数字子字符串按每两个字符进行分组"(X千)(X百)(X十)(X一)". 组内模式为(a, b),
     # a为数字(0-9), b为权值(一十百千).
-    a, b = 0, 1
+    b = 1
 
     # tiny是一个临时值, 当tiny = a * b时, 它始终比旧的small多一位数字. 该现象可确保
     # "千百十"出现的顺序正确.
@@ -175,74 +260,79 @@ def chinese2int_traditional(s):
     # 表示中文数字字符串中, 分隔符"亿万一"对应的整数.
     delimiter = 1
 
-    # use_simple_zero_tail: 计算出省略的单位.
-    p = 0
-    if length > 1:
-        p = Table.chinese2int[s[length - 2]]
-    if p > 10:
-        a = Table.chinese2int[s[length - 1]]
-        # 排除 "一百万", "二千亿"这种情况
-        if a < 10:
-            b = p // 10
-            small += a * b
-            length -= 1
-
-    while length > 0:
-        length -= 1
-        p = Table.chinese2int[s[length]]
+    if end - i == 2 and p > 10:
+        # use_simple_zero_tail: 权值后只有一个数字, 计算出省略的单位. 排除 "一百万",
+        # "二千亿"这种情况.
+        b = p // 10
+        small = digit * b
+    elif count > 1:
+        # 出现连续的a(数字).
+        return 0, Status.INVALID_GRAMMAR
+    else:
+        small = digit
+        flag_pair_a = count == 1
 
+    number = 0
+    while True:
         if p == 0:
-            continue
-
-        if p < 10:
-            if flag_pair_a is False:
-                a = p
-                tiny = a * b
-                if tiny > small:
-                    small += tiny
-                else:
-                    # "千百十"顺序出错, e.g. 五百六千
-                    raise ValueError("invalid Chinese numerals")
-                flag_pair_a = True
-            else:
+            pass
+        elif p < 0:
+            return 0, Status.INVALID_GRAMMAR
+        elif p < 10:
+            if flag_pair_a:
                 # 出现连续的a(数字).
-                raise ValueError("invalid Chinese numerals")
+                return 0, Status.INVALID_GRAMMAR
+            tiny = p * b
+            if tiny <= small:
+                # "千百十"顺序出错, e.g. 五百六千
+                return 0, Status.INVALID_GRAMMAR
+            small += tiny
+            flag_pair_a = True
             flag_pair_b = False
-        else:
-            if p == 10000 or p == 100000000:
-                if flag_pair_b is False:
-                    number += small * delimiter
-                    small = 0
-                    a, b = 0, 1
-
-                    # 万万为亿. e,g 六万万.
-                    if p == 10000 and Table.chinese2int[s[length - 1]] == 10000:
-                        p = 100000000
-                        length -= 1
-
-                    # 新的delimiter始终大于旧的delimiter, 确保"亿"在"万"前.
-                    if p > delimiter:
-                        delimiter = p
-                    else:
-                        if delimiter == 100000000:
-                            # e.g. 三万亿, 六亿亿, 六千万五亿
-                            raise OverflowError("the value is out of the supported range")
-                        # 此时必定: p=10000, delimiter=10000. 针对"四万五千万"的情形.
-                        delimiter = 100000000
-                else:
-                    # 出现万千, 万百, 万十 .etc.
-                    raise ValueError("invalid Chinese numerals")    
+        elif p == 10000 or p == 100000000:
+            if flag_pair_b:
+                # 出现万千, 万百, 万十 .etc.
+                return 0, Status.INVALID_GRAMMAR
+            number += small * delimiter
+            small = 0
+            b = 1
+
+            # 万万为亿. e,g 六万万.
+            if p == 10000 and i > start and table.get(s[i - 1]) == 10000:
+                p = 100000000
+                i -= 1
+
+            # 新的delimiter始终大于旧的delimiter, 确保"亿"在"万"前.
+            if p > delimiter:
+                delimiter = p
+            elif delimiter == 100000000:
+                # e.g. 三万亿, 六亿亿, 六千万五亿
+                return 0, Status.OVERFLOW
             else:
-                if flag_pair_b is False:
-                    if p <= b:
-                        # e.g 七千一千零一十万
-                        raise ValueError("invalid Chinese numerals")
-                    b = p
-                    flag_pair_b = True
-                else:
-                    # 出现连续的b(权值).
-                    raise ValueError("invalid Chinese numerals")
+                # 此时必定: p=10000, delimiter=10000. 针对"四万五千万"的情形.
+                delimiter = 100000000
+            flag_pair_a = False
+        else:
+            if flag_pair_b:
+                # 出现连续的b(权值).
+                return 0, Status.INVALID_GRAMMAR
+            if p <= b:
+                # e.g 七千一千零一十万
+                return 0, Status.INVALID_GRAMMAR
+            b = p
             flag_pair_a = False
+            flag_pair_b = True
+
+        if i == start:
+            break
+        i -= 1
+        p = table.get(s[i])
+        if p is None:
+            return 0, Status.INVALID_CHARACTER
+
+    # 第一个字符不能是"百千万亿佰仟萬億"
+    if p > 10:
+        return 0, Status.INVALID_GRAMMAR
 
     # use_simple_ten: "十"开头的中文数字字符串, 逆序遍历到开头的"十"
     # 后, 会终止循环, 导致"十"无法参与到small的计算中, 所以需要修正下.
@@ -250,9 +340,113 @@ def chinese2int_traditional(s):
         small += 10
 
     number += small * delimiter
+    return number, Status.OK
+
+
+def _try_chinese2int_enumeration(s, default=None):
+    """中文数字(枚举表示) => 非负整数. chinese2int_enumeration的不抛出异常的版本.
+
+    返回:
+        tuple: (int, Status). 转换失败时为(default, 失败原因).
+    """
+    number, status = chinese2int_scan(s, 0, len(s), traditional=False)
+    if status:
+        return default, status
+    return number, Status.OK
+
+
+def _try_chinese2int_traditional(s, default=None):
+    """中文数字(传统表示) => 非负整数. chinese2int_traditional的不抛出异常的版本.
+
+    返回:
+        tuple: (int, Status). 转换失败时为(default, 失败原因).
+    """
+    number, status = chinese2int_scan(s, 0, len(s), enumeration=False)
+    if status:
+        return default, status
+    return number, Status.OK
+
+
+def chinese2int_enumeration(s):
+    """中文数字(枚举表示) => 非负整数. 即chinese2int_scan(traditional=False), chinese2int已不再调用,
+    保留给直接使用它的调用者.
+
+    参数:
+        s (string): 中文数字. 符合正则模式: "[〇一二三四五六七八九
+            零壹贰叁肆伍陆柒捌玖两]+"
+
+    返回:
+        int: 整数. 取值范围: [0, 1e12).
+    """
+    number, status = _try_chinese2int_enumeration(s)
+    if status:
+        raise status_error(status)
+    return number
+
+
+def chinese2int_traditional(s):
+    """中文数字(传统表示) => 非负整数. 即chinese2int_scan(enumeration=False), chinese2int已不再调用,
+    保留给直接使用它的调用者.
+
+    参数:
+        s (string): 中文数字. 符合正则模式: "[〇一二三四五六七八九十百千万亿
+            零壹贰叁肆伍陆柒捌玖拾佰仟萬億两]+"
+
+    返回:
+        int: 整数. 取值范围: [0, 1e12).
+    """
+    number, status = _try_chinese2int_traditional(s)
+    if status:
+        raise status_error(status)
     return number
 
 
+def chinese2int_signed(s, default, table, enumeration, traditional):
+    """中文数字 => 整数. try_chinese2int的核心部分, 查找表和接受的表示方式由参数给出.
+
+    参数:
+        table, enumeration, traditional: 见chinese2int_scan.
+
+    返回:
+        tuple: (int, Status). 转换失败时为(default, 失败原因).
+    """
+    length = len(s)
+    start = 0
+    sign = 1
+
+    if length == 0:
+        return default, Status.INVALID_GRAMMAR
+    p = table.get(s[0])
+    if p is None:
+        return default, Status.INVALID_CHARACTER
+    if p < 0:
+        # "正负負"开头
+        if p == -100:
+            return default, Status.INVALID_GRAMMAR
+        if p == -1:
+            sign = -1
+        start = 1
+
+    number, status = chinese2int_scan(s, start, length, table,
+                                      enumeration, traditional)
+    if status:
+        return default, status
+    return sign * number, Status.OK
+
+
+def try_chinese2int(s, default=None):
+    """中文数字 => 整数. 不抛出异常.
+
+    参数:
+        s (string): 中文数字.
+        default: 转换失败时, 代替整数返回的值. 默认None.
+
+    返回:
+        tuple: (int, Status). 转换失败时为(default, 失败原因).
+    """
+    return chinese2int_signed(s, default, Table.chinese2int, True, True)
+
+
 def chinese2int(s):
     """中文数字 => 整数.
 
@@ -263,86 +457,117 @@ def chinese2int(s):
     返回:
         int: 整数. 取值范围: (-1e12, 1e12).
     """
-    number = 0
-    sign = 1
-
-    if len(s) >= 2:
-        a, b = Table.chinese2int[s[0]], Table.chinese2int[s[1]]
-        # 第一个字符不能是"百千万亿佰仟萬億"
-        if a > 10:
-            raise ValueError("invalid Chinese numerals")
-        if a == -10:
-            s = s[1:]
-        if a == -1:
-            s = s[1:]
-            sign = -1
-        if max(a, b) <= 9:
-            try:
-                number = chinese2int_enumeration(s)
-            except ValueError:
-                # "零零零三百六十一"会被错误的判定为枚举表示. (s.lstrip("零〇")
-                # 不可行, e.g. "零三零百六十" => "三零百六十")
-                number = chinese2int_traditional(s)
-        else:
-            number = chinese2int_traditional(s)
-        number *= sign
-    else:
-        number = Table.chinese2int[s]
+    number, status = chinese2int_signed(s, None, Table.chinese2int, True, True)
+    if status:
+        raise status_error(status)
     return number
 
 
-def chinese2float(s):
-    """中文数字 => 浮点数
-    
+def chinese2float_signed(s, default, table, enumeration, traditional):
+    """中文数字 => 浮点数. try_chinese2float的核心部分, 查找表和接受的表示方式由参数
+    给出. 有"点"时, 整数部分只接受传统表示.
+
     参数:
-        s (string): 中文数字. 符合正则模式: "[正负負]?[〇一二三四五六七八九十百千万亿
-            零壹贰叁肆伍陆柒捌玖拾佰仟萬億两点點]+"
+        table, enumeration, traditional: 见chinese2int_scan.
 
     返回:
-        float: 浮点数. 取值范围: (-1e12, 1e12).
+        tuple: (float, Status). 转换失败时为(default, 失败原因).
     """
-    p = Table.chinese2int[s[0]]
+    length = len(s)
+    start = 0
     signed = 1
-    if p == -10:
-        s = s[1:]
-    if p == -1:
-        s = s[1:]
-        signed = -1
 
-    number = 0
+    if length == 0:
+        return default, Status.INVALID_GRAMMAR
+    p = table.get(s[0])
+    if p is None:
+        return default, Status.INVALID_CHARACTER
+    if p < 0:
+        # "点"开头
+        if p == -100:
+            return default, Status.INVALID_GRAMMAR
+        if p == -1:
+            signed = -1
+        start = 1
+
+    # "六点三万人", "五点八亿斤". 只在有"点"时生效.
+    end = length
     tail = 1
-    s_original = s
-
-    # "六点三万人", "五点八亿斤"
-    p = Table.chinese2int.get(s[-1])
-    if p and p > 1000:
+    p = table.get(s[end - 1])
+    if p is None:
+        return default, Status.INVALID_CHARACTER
+    if p > 1000:
         tail = p
-        s = s[:-1]
-
-    parts = re_dot.split(s)
-    count = len(parts)
-
-    if count == 1:
-        number = chinese2int(s_original) * 1.0
-    elif count == 2:
-        a_length = len(parts[0])
-        b_length = len(parts[1])
-        # 整数部分
-        if a_length == 0:
-            raise ValueError("invalid Chinese numerals")
-        else:
-            a = chinese2int_traditional(parts[0])
-        # 小数部分
+        end -= 1
+
+    # 逆序读取小数部分, 直到遇到"点". 遇到其他非数字字符时, 按整数处理.
+    b = 0
+    m = 1
+    i = end
+    point = False
+    while i > start:
+        i -= 1
+        p = table.get(s[i])
+        if p is None:
+            return default, Status.INVALID_CHARACTER
+        if p == -100:
+            point = True
+            break
+        if p > 9 or p < 0:
+            break
+        b += p * m
+        m *= 10
+
+    if not point:
+        # 没有"点"
+        number, status = chinese2int_scan(s, start, length, table,
+                                          enumeration, traditional)
+        if status:
+            return default, status
+        number *= 1.0
+    else:
+        b_length = end - i - 1
         if b_length == 0:
-            raise ValueError("invalid Chinese numerals")
-        else:
-            b = chinese2int_enumeration(parts[1])
+            return default, Status.INVALID_GRAMMAR
+        if b_length > 12:
+            return default, Status.OVERFLOW
+        # 整数部分, 不能为空, 只接受传统表示.
+        a, status = chinese2int_scan(s, start, i, table, False, traditional)
+        if status:
+            return default, status
         number = a + b / Table.levels[b_length]
         number *= tail
-    else:
-        raise ValueError("invalid Chinese numerals")
 
     number *= signed
+    return number, Status.OK
+
+
+def try_chinese2float(s, default=None):
+    """中文数字 => 浮点数. 不抛出异常.
+
+    参数:
+        s (string): 中文数字.
+        default: 转换失败时, 代替浮点数返回的值. 默认None.
+
+    返回:
+        tuple: (float, Status). 转换失败时为(default, 失败原因).
+    """
+    return chinese2float_signed(s, default, Table.chinese2int, True, True)
+
+
+def chinese2float(s):
+    """中文数字 => 浮点数
+    
+    参数:
+        s (string): 中文数字. 符合正则模式: "[正负負]?[〇一二三四五六七八九十百千万亿
+            零壹贰叁肆伍陆柒捌玖拾佰仟萬億两点點]+"
+
+    返回:
+        float: 浮点数. 取值范围: (-1e12, 1e12).
+    """
+    number, status = chinese2float_signed(s, None, Table.chinese2int, True, True)
+    if status:
+        raise status_error(status)
     return number
 
 
@@ -366,7 +591,7 @@ def chinese_simple_zero_tail(s, lower):
     if len(s) >= 3 and s[-3] != "零":
         s = s.rstrip("十百千拾佰仟")
     if s.endswith("两"):
-        s = s[:-1] + "二" if lower else "贰"
+        s = s[:-1] + ("二" if lower else "贰")
     return s
 
 
@@ -389,38 +614,57 @@ def small2chinese(number, delimiter, digits, units, use_liang):
     return s
 
 
-def int2chinese(number, lower=True, enumeration=False,
-                use_liang=False,
-                use_simple_ten=False,
-                use_simple_zero_tail=False,
-                use_upper_zero=False,
-                width=0):
-    """整数 => 中文数字.
- 
-    参数:
-        number (int): 整数. 取值范围: (-1e12, 1e12)
-        lower (bool): 是否使用小写中文数字. 默认Ture.
-        enumeration (bool): 是否使用枚举表示. 枚举表示: 第一二三章,
-            传统表示: 第一百二十三章. 默认False.
-        use_upper_zero (bool): 枚举表示时, 是否用"零"替代"〇", 默认False.
-        width (int): 中文数字的最小字符数, 不足宽度的左侧补零.
+def segment_tables(lower, use_liang):
+    """生成传统表示的4位分段全表. 每种(lower, use_liang)组合只在首次调用时生成.
 
-        (以下参数只在enumeration=False时生效)
-
-        use_liang (bool): 是否用"两"替代、并尽可能多地替代"二". 默认False.
-        use_simple_ten (bool): 以"一十"开头的的中文数字, 是否省略"一". 默认False.
-        use_simple_zero_tail (bool): 整数以`xx000, xx00, xx0`结尾时, 是否省略
-            中文数字末尾的"十百千". 其中`x`是非零数字.
+    参数:
+        lower (bool): 是否使用小写中文数字.
+        use_liang (bool): 是否用"两"替代"二".
 
     返回:
-        string: 中文数字. 如果返回None, 表示超出转换范围.
+        tuple: (low, high, low_zero, high_zero), 均为长度10000的list.
+            low: 个位分段, high: "万亿"前的分段(两万, 两亿),
+            low_zero, high_zero: 不是最高分段时, 补零后的low, high.
     """
-    if number <= -1e12 or number >= 1e12:
-        return None
+    key = (lower, use_liang)
+    tables = Table.segments.get(key)
+    if tables is None:
+        if lower:
+            digits = Table.lower_traditional
+            units = Table.lower_uint
+        else:
+            digits = Table.upper_traditional
+            units = Table.upper_unit
+        low = [small2chinese(p, "", digits, units, use_liang)
+               for p in range(10000)]
+        high = list(low)
+        high[2] = small2chinese(2, "万", digits, units, use_liang)
+        low_zero = [chinese_fill_zero(s, p) for p, s in enumerate(low)]
+        high_zero = [chinese_fill_zero(s, p) for p, s in enumerate(high)]
+        tables = (low, high, low_zero, high_zero)
+        Table.segments[key] = tables
+    return tables
+
+
+def int2chinese_converter(lower=True, enumeration=False,
+                          use_liang=False,
+                          use_simple_ten=False,
+                          use_simple_zero_tail=False,
+                          use_upper_zero=False,
+                          width=0):
+    """根据转换选项选好数字表, 返回一个只接受整数参数的转换函数. int2chinese也经由这里
+    转换, 每种选项组合的转换函数只在首次调用时生成.
+
+    参数同int2chinese. 批量转换时, 转换选项只需处理一次.
 
-    n, s = number, ""
-    sign = ""
-    i = 0
+    返回:
+        function: convert(number) => string. 如果返回None, 表示超出转换范围.
+    """
+    key = (lower, enumeration, use_liang, use_simple_ten,
+           use_simple_zero_tail, use_upper_zero, width)
+    convert = Table.converters.get(key)
+    if convert is not None:
+        return convert
 
     if enumeration:
         if lower:
@@ -430,77 +674,108 @@ def int2chinese(number, lower=True, enumeration=False,
                 digits = Table.lower_enumeration
         else:
             digits = Table.upper_enumeration
-        if n < 0:
-            sign = digits[-1]
-            n = -n
-        if n == 0:
-            s = digits[0]
-        while n > 0:
-            p = n % 10
-            n //= 10
-            s = digits[p] + s
-            i += 1
-        if len(s) < width:
-            s = digits[0] * (width - len(s)) + s
+
+        zero, minus = digits[0], digits[-1]
+        table = str.maketrans("0123456789", digits[:10])
+
+        def convert(number):
+            if number <= -1e12 or number >= 1e12:
+                return None
+            n = number
+            sign = ""
+            if n < 0:
+                sign = minus
+                n = -n
+            s = ("%d" % n).translate(table)
+            if len(s) < width:
+                s = zero * (width - len(s)) + s
+            return sign + s
     else:
         if lower:
             digits = Table.lower_traditional
-            units = Table.lower_uint
             delimiters = Table.lower_delimiter
         else:
             digits = Table.upper_traditional
-            units = Table.upper_unit
             delimiters = Table.upper_delimiter
-        if n < 0:
-            sign = digits[-1]
-            n = -n
-        if n == 0:
-            s = digits[0]
-        while n > 0:
-            p = n % 10000
-            n //= 10000
-            delimiter = delimiters[0] if p == 0 else delimiters[i]
-            s_small = small2chinese(p, delimiter, digits, units, use_liang)
-            s = s_small + delimiter + s
-            if n != 0:
-                s = chinese_fill_zero(s, p)
-            i += 1
-        if use_simple_ten:
-            s = chinese_simple_ten(s, p)
-        if use_simple_zero_tail:
-            s = chinese_simple_zero_tail(s, lower)
-        if len(s) < width:
-            s = digits[0] * (width - len(s)) + s
-    s = sign + s
-    return s
+        # 每个4位分段只需查一次表, 见segment_tables.
+        low, high, low_zero, high_zero = segment_tables(lower, use_liang)
+        zero, minus = digits[0], digits[-1]
+        wan, yi = delimiters[1], delimiters[2]
+
+        def convert(number):
+            if number <= -1e12 or number >= 1e12:
+                return None
+            n = number
+            sign = ""
+            if n < 0:
+                sign = minus
+                n = -n
+            if n < 10000:
+                p = n
+                s = low[n] if n else zero
+            elif n < 100000000:
+                p = n // 10000
+                s = high[p] + wan + low_zero[n % 10000]
+            else:
+                p = n // 100000000
+                middle = n // 10000 % 10000
+                n %= 10000
+                if middle:
+                    s = "".join((high[p], yi, high_zero[middle], wan, low_zero[n]))
+                elif n:
+                    # "万"分段为零时, 省略"万", 补一个零.
+                    s = high[p] + yi + "零" + low[n]
+                else:
+                    s = high[p] + yi
+            if use_simple_ten:
+                s = chinese_simple_ten(s, p)
+            if use_simple_zero_tail:
+                s = chinese_simple_zero_tail(s, lower)
+            if len(s) < width:
+                s = zero * (width - len(s)) + s
+            return sign + s
 
+    Table.converters[key] = convert
+    return convert
 
-def float2chinese(number, lower=True, precision=6,
-                  use_liang=False,
-                  use_simple_ten=False,
-                  use_simple_zero_tail=False):
-    """浮点数 => 中文数字.
 
+def int2chinese(number, lower=True, enumeration=False,
+                use_liang=False,
+                use_simple_ten=False,
+                use_simple_zero_tail=False,
+                use_upper_zero=False,
+                width=0):
+    """整数 => 中文数字.
+ 
     参数:
-        number (float): 浮点数. 取值范围: (-1e12, 1e12)
+        number (int): 整数. 取值范围: (-1e12, 1e12)
         lower (bool): 是否使用小写中文数字. 默认Ture.
+        enumeration (bool): 是否使用枚举表示. 枚举表示: 第一二三章,
+            传统表示: 第一百二十三章. 默认False.
+        use_upper_zero (bool): 枚举表示时, 是否用"零"替代"〇", 默认False.
+        width (int): 中文数字的最小字符数, 不足宽度的左侧补零.
 
-        precision (int): 浮点数精度/小数点后的位数. 取值范围: [0, 12].
+        (以下参数只在enumeration=False时生效)
 
         use_liang (bool): 是否用"两"替代、并尽可能多地替代"二". 默认False.
         use_simple_ten (bool): 以"一十"开头的的中文数字, 是否省略"一". 默认False.
-        use_simple_zero_tail (bool): 整数部分以`xx000, xx00, xx0`结尾时, 是否省略
-            中文数字整数部分末尾的"十百千". 其中`x`是非零数字.
+        use_simple_zero_tail (bool): 整数以`xx000, xx00, xx0`结尾时, 是否省略
+            中文数字末尾的"十百千". 其中`x`是非零数字.
 
     返回:
         string: 中文数字. 如果返回None, 表示超出转换范围.
     """
-    if number <= -1e12 or number >= 1e12:
-        return None
-    precision = max(min(precision, 12), 0)
-    level = Table.levels[precision]
+    convert = Table.converters.get((lower, enumeration, use_liang, use_simple_ten,
+                                    use_simple_zero_tail, use_upper_zero, width))
+    if convert is None:
+        convert = int2chinese_converter(lower, enumeration, use_liang, use_simple_ten,
+                                        use_simple_zero_tail, use_upper_zero, width)
+    return convert(number)
 
-    n, s = number, ""
+
+def float_split(number, level):
+    """浮点数 => (整数部分, 小数部分). 小数部分已乘以level并四舍五入."""
+    n = number
     sign = 1
 
     if n < 0:
@@ -521,6 +796,65 @@ def float2chinese(number, lower=True, precision=6,
             a += 1
             b = 0
     a *= sign
+    return a, b
+
+
+def float2chinese_converter(lower=True, precision=6,
+                            use_liang=False,
+                            use_simple_ten=False,
+                            use_simple_zero_tail=False):
+    """根据转换选项选好数字表, 返回一个只接受浮点数参数的转换函数.
+
+    参数同float2chinese.
+
+    返回:
+        function: convert(number) => string. 如果返回None, 表示超出转换范围.
+    """
+    precision = max(min(precision, 12), 0)
+    level = Table.levels[precision]
+    convert_a = int2chinese_converter(lower, False,
+                                      use_liang=use_liang,
+                                      use_simple_ten=use_simple_ten,
+                                      use_simple_zero_tail=use_simple_zero_tail)
+    convert_b = int2chinese_converter(lower, True,
+                                      use_upper_zero=True,
+                                      width=precision)
+    dot = "点" if lower else "點"
+
+    def convert(number):
+        if number <= -1e12 or number >= 1e12:
+            return None
+        a, b = float_split(number, level)
+        return convert_a(a) + dot + convert_b(b)
+    return convert
+
+
+def float2chinese(number, lower=True, precision=6,
+                  use_liang=False,
+                  use_simple_ten=False,
+                  use_simple_zero_tail=False):
+    """浮点数 => 中文数字.
+
+    参数:
+        number (float): 浮点数. 取值范围: (-1e12, 1e12)
+        lower (bool): 是否使用小写中文数字. 默认Ture.
+
+        precision (int): 浮点数精度/小数点后的位数. 取值范围: [0, 12].
+
+        use_liang (bool): 是否用"两"替代、并尽可能多地替代"二". 默认False.
+        use_simple_ten (bool): 以"一十"开头的的中文数字, 是否省略"一". 默认False.
+        use_simple_zero_tail (bool): 整数部分以`xx000, xx00, xx0`结尾时, 是否省略
+            中文数字整数部分末尾的"十百千". 其中`x`是非零数字.
+
+    返回:
+        string: 中文数字. 如果返回None, 表示超出转换范围.
+    """
+    if number <= -1e12 or number >= 1e12:
+        return None
+    precision = max(min(precision, 12), 0)
+    level = Table.levels[precision]
+
+    a, b = float_split(number, level)
 
     s_a = int2chinese(a, lower, False,
                       use_liang=use_liang,
@@ -542,6 +876,33 @@ def float2chinese(number, lower=True, precision=6,
 # 数字
 
 
+def try_convert2int(s, default=None):
+    """数字 => 整数. 不抛出异常.
+
+    参数:
+        s (string): 数字字符串. 要求同convert2int.
+        default: 转换失败时, 代替整数返回的值. 默认None.
+
+    返回:
+        tuple: (int, Status). 转换失败时为(default, 失败原因).
+    """
+    if len(s) == 0:
+        return default, Status.INVALID_GRAMMAR
+    code = ord(s[0])
+    if code <= 57:
+        if re_arabic.fullmatch(s) is None:
+            return default, Status.INVALID_GRAMMAR
+        try:
+            return int(s), Status.OK
+        except ValueError:
+            # 超过sys.get_int_max_str_digits()位的数字串
+            return default, Status.OVERFLOW
+    elif code <= 88:
+        return try_roman2int(s, default)
+    else:
+        return try_chinese2int(s, default)
+
+
 def convert2int(s):
     """数字 => 整数
 
@@ -570,3 +931,1243 @@ def convert2int(s):
     else:
         number = chinese2int(s)
     return number
+
+
+# 批量转换
+
+
+def check_errors(errors):
+    """检查批量转换的errors参数. 取值见chinese2int_many."""
+    if errors not in ("raise", "coerce", "ignore"):
+        raise ValueError('errors must be "raise", "coerce" or "ignore"')
+
+
+def parse_many(convert, try_convert, strings, errors, default, lazy):
+    """批量转换的公共部分. errors见chinese2int_many.
+
+    chinese2int_many等逐项转换较重的函数在非lazy时有各自的循环, 只在lazy时
+    使用这里的生成器.
+    """
+    check_errors(errors)
+    if errors == "raise":
+        results = map(convert, strings)
+    elif errors == "coerce":
+        results = (try_convert(s, default)[0] for s in strings)
+    else:
+        results = (number for number, status in map(try_convert, strings)
+                   if not status)
+    return results if lazy else list(results)
+
+
+def chinese2int_many(strings, errors="raise", default=None, lazy=False):
+    """批量 中文数字 => 整数.
+
+    参数:
+        strings (iterable): 中文数字序列, 每一项的要求同chinese2int.
+        errors (string): 转换失败时的处理方式. "raise": 抛出异常; "coerce": 用
+            default代替; "ignore": 丢弃该项. 默认"raise".
+        default: errors="coerce"时, 代替转换失败项的值. 默认None.
+        lazy (bool): 是否返回生成器, 按需逐个转换. 默认False.
+
+    返回:
+        list | generator: 整数序列.
+    """
+    if lazy:
+        return parse_many(chinese2int, try_chinese2int, strings,
+                          errors, default, lazy)
+    check_errors(errors)
+    raising = errors == "raise"
+    ignoring = errors == "ignore"
+    table = Table.chinese2int
+    get = table.get
+    scan = chinese2int_scan
+    results = []
+    append = results.append
+    for s in strings:
+        # 同chinese2int_signed, 正负号在这里处理
+        if not s:
+            status = Status.INVALID_GRAMMAR
+        else:
+            p = get(s[0])
+            if p is None:
+                status = Status.INVALID_CHARACTER
+            elif p >= 0:
+                number, status = scan(s, 0, len(s), table, True, True)
+            elif p == -100:
+                status = Status.INVALID_GRAMMAR
+            else:
+                number, status = scan(s, 1, len(s), table, True, True)
+                if p == -1:
+                    number = -number
+        if status:
+            if raising:
+                raise status_error(status)
+            if ignoring:
+                continue
+            number = default
+        append(number)
+    return results
+
+
+def chinese2float_many(strings, errors="raise", default=None, lazy=False):
+    """批量 中文数字 => 浮点数.
+
+    参数:
+        strings (iterable): 中文数字序列, 每一项的要求同chinese2float.
+        errors (string): 转换失败时的处理方式, 同chinese2int_many.
+        default: errors="coerce"时, 代替转换失败项的值. 默认None.
+        lazy (bool): 是否返回生成器, 按需逐个转换. 默认False.
+
+    返回:
+        list | generator: 浮点数序列.
+    """
+    if lazy:
+        return parse_many(chinese2float, try_chinese2float, strings,
+                          errors, default, lazy)
+    check_errors(errors)
+    raising = errors == "raise"
+    ignoring = errors == "ignore"
+    table = Table.chinese2int
+    signed = chinese2float_signed
+    results = []
+    append = results.append
+    for s in strings:
+        number, status = signed(s, default, table, True, True)
+        if status:
+            if raising:
+                raise status_error(status)
+            if ignoring:
+                continue
+        append(number)
+    return results
+
+
+def roman2int_many(strings, errors="raise", default=None, lazy=False):
+    """批量 罗马数字 => 整数.
+
+    参数:
+        strings (iterable): 罗马数字序列, 每一项的要求同roman2int.
+        errors (string): 转换失败时的处理方式, 同chinese2int_many.
+        default: errors="coerce"时, 代替转换失败项的值. 默认None.
+        lazy (bool): 是否返回生成器, 按需逐个转换. 默认False.
+
+    返回:
+        list | generator: 整数序列.
+    """
+    if lazy:
+        return parse_many(roman2int, try_roman2int, strings,
+                          errors, default, lazy)
+    check_errors(errors)
+    raising = errors == "raise"
+    ignoring = errors == "ignore"
+    reverse = Table.romans_reverse
+    if reverse is None:
+        reverse = roman_tables()[1]
+    get = reverse.get
+    results = []
+    append = results.append
+    for s in strings:
+        # 大写的合法罗马数字直接查表, 其余交给try_roman2int
+        number = get(s)
+        if number is None:
+            number, status = try_roman2int(s, default)
+            if status:
+                if raising:
+                    raise status_error(status, "Roman")
+                if ignoring:
+                    continue
+        append(number)
+    return results
+
+
+def convert2int_many(strings, errors="raise", default=None, lazy=False):
+    """批量 数字 => 整数.
+
+    参数:
+        strings (iterable): 数字字符串序列, 每一项的要求同convert2int.
+        errors (string): 转换失败时的处理方式, 同chinese2int_many.
+        default: errors="coerce"时, 代替转换失败项的值. 默认None.
+        lazy (bool): 是否返回生成器, 按需逐个转换. 默认False.
+
+    返回:
+        list | generator: 整数序列.
+    """
+    return parse_many(convert2int, try_convert2int, strings,
+                      errors, default, lazy)
+
+
+# 枚举表示的数字 => 阿拉伯数字, 供str.translate使用.
+enumeration_digits = str.maketrans({c: str(p) for c, p in Table.chinese2int.items()
+                                    if 0 <= p <= 9})
+
+
+def numeral_format(s):
+    """数字字符串的格式: "arabic", "roman", "traditional", "enumeration". 空字符串为None.
+
+    与convert2int一样只按第一个字符区分阿拉伯数字、罗马数字和中文数字. 字符串比较
+    s < ":"等价于ord(s[0]) <= 57, s < "Y"等价于ord(s[0]) <= 88.
+    """
+    if not s:
+        return None
+    if s < ":":
+        return "arabic"
+    if s < "Y":
+        return "roman"
+    table = Table.chinese2int
+    for c in s:
+        if table.get(c, 0) > 9:
+            return "traditional"
+    return "enumeration"
+
+
+def column_format(strings, sample=64):
+    """均匀抽取最多sample项, 推断整列的格式. 占抽样的3/4以上的格式即整列的格式, 没有
+    这样的格式时为"mixed"."""
+    step = max(len(strings) // sample, 1) if sample > 0 else len(strings) + 1
+    counts = {}
+    for s in strings[::step][:sample]:
+        form = numeral_format(s)
+        counts[form] = counts.get(form, 0) + 1
+    total = sum(counts.values())
+    for form, count in counts.items():
+        if form is not None and count * 4 > total * 3:
+            return form
+    return "mixed"
+
+
+def column_converter(form):
+    """格式 => convert(s). convert返回None表示s不是该格式, 或转换失败, 需要逐项判断格式
+    重新转换. "mixed"时返回None.
+
+    专用的转换函数不再判断格式. 保证返回的整数与convert2int一致.
+    """
+    if form == "arabic":
+        def convert(s):
+            if s < ":":
+                try:
+                    return int(s)
+                except ValueError:
+                    pass
+            return None
+        return convert
+
+    if form == "roman":
+        # 只接受规范的大写罗马数字, 小写等交给try_convert2int.
+        reverse = Table.romans_reverse
+        if reverse is None:
+            reverse = roman_tables()[1]
+        return reverse.get
+
+    if form == "enumeration":
+        table = enumeration_digits
+
+        def convert(s):
+            if s < "Y":
+                return None
+            sign = 1
+            c = s[0]
+            if c == "负" or c == "負":
+                sign = -1
+                s = s[1:]
+            elif c == "正":
+                s = s[1:]
+            digits = s.translate(table)
+            if digits.isdigit() and digits.isascii():
+                number = int(digits)
+                if number < 1000000000000:
+                    return sign * number
+            return None
+        return convert
+
+    if form == "traditional":
+        table = Table.chinese2int
+
+        def convert(s):
+            if s < "Y":
+                return None
+            return chinese2int_signed(s, None, table, True, True)[0]
+        return convert
+
+    return None
+
+
+def convert2int_column(values, errors="raise", default=None, sample=64):
+    """批量 数字 => 整数, 适合同一格式的一列数据. 结果同convert2int_many.
+
+    均匀抽取最多sample项推断整列的格式(阿拉伯数字、罗马数字、中文传统表示、中文枚举
+    表示, 或混合), 然后用该格式的专用转换函数转换每一项, 不再逐项判断格式. 专用函数转换
+    失败的项, 再逐项判断格式, 用try_convert2int重新转换.
+
+    参数:
+        values (iterable): 数字字符串序列, 每一项的要求同convert2int.
+        errors (string): 转换失败时的处理方式, 同chinese2int_many.
+        default: errors="coerce"时, 代替转换失败项的值. 默认None.
+        sample (int): 推断格式时抽取的项数. 默认64.
+
+    返回:
+        list: 整数序列.
+    """
+    if errors not in ("raise", "coerce", "ignore"):
+        raise ValueError('errors must be "raise", "coerce" or "ignore"')
+    strings = values if isinstance(values, (list, tuple)) else list(values)
+    convert = column_converter(column_format(strings, sample))
+    if convert is None:
+        return convert2int_many(strings, errors, default)
+    numbers = list(map(convert, strings))
+    if None not in numbers:
+        return numbers
+
+    # 逐项重新转换专用函数转换失败的项
+    dropped = False
+    ignored = object()
+    for i, number in enumerate(numbers):
+        if number is None:
+            if errors == "raise":
+                numbers[i] = convert2int(strings[i])
+                continue
+            number, status = try_convert2int(strings[i], default)
+            if status and errors == "ignore":
+                number = ignored
+                dropped = True
+            numbers[i] = number
+    if dropped:
+        return [n for n in numbers if n is not ignored]
+    return numbers
+
+
+def int2roman_many(numbers, lazy=False):
+    """批量 整数 => 罗马数字.
+
+    参数:
+        numbers (iterable): 整数序列.
+        lazy (bool): 是否返回生成器, 按需逐个转换. 默认False.
+
+    返回:
+        list | generator: 罗马数字序列. 超出转换范围的项为None.
+    """
+    romans = roman_tables()[0]
+    results = (romans[n] if 0 < n < 4000 else None for n in numbers)
+    return results if lazy else list(results)
+
+
+def int2chinese_many(numbers, lower=True, enumeration=False,
+                     use_liang=False,
+                     use_simple_ten=False,
+                     use_simple_zero_tail=False,
+                     use_upper_zero=False,
+                     width=0,
+                     lazy=False):
+    """批量 整数 => 中文数字. 转换选项只处理一次.
+
+    参数:
+        numbers (iterable): 整数序列.
+        lazy (bool): 是否返回生成器, 按需逐个转换. 默认False.
+
+        其余参数同int2chinese.
+
+    返回:
+        list | generator: 中文数字序列. 超出转换范围的项为None.
+    """
+    convert = int2chinese_converter(lower, enumeration,
+                                    use_liang=use_liang,
+                                    use_simple_ten=use_simple_ten,
+                                    use_simple_zero_tail=use_simple_zero_tail,
+                                    use_upper_zero=use_upper_zero,
+                                    width=width)
+    results = map(convert, numbers)
+    return results if lazy else list(results)
+
+
+def float2chinese_many(numbers, lower=True, precision=6,
+                       use_liang=False,
+                       use_simple_ten=False,
+                       use_simple_zero_tail=False,
+                       lazy=False):
+    """批量 浮点数 => 中文数字. 转换选项只处理一次.
+
+    参数:
+        numbers (iterable): 浮点数序列.
+        lazy (bool): 是否返回生成器, 按需逐个转换. 默认False.
+
+        其余参数同float2chinese.
+
+    返回:
+        list | generator: 中文数字序列. 超出转换范围的项为None.
+    """
+    convert = float2chinese_converter(lower, precision,
+                                      use_liang=use_liang,
+                                      use_simple_ten=use_simple_ten,
+                                      use_simple_zero_tail=use_simple_zero_tail)
+    results = map(convert, numbers)
+    return results if lazy else list(results)
+
+
+# 规范化
+
+
+def canonical_pattern():
+    """int2chinese默认选项输出的正则表达式, 即规范形式. 只匹配规范形式.
+
+    4位一段: 千百十位中, 连续的0写作一个"零", 末尾的0省略, 保留"一十". 低位的段不满
+    1000时, 以"零"开头; 整段为0时, 写作一个"零".
+    """
+    d = "[一二三四五六七八九]"
+    tens = d + "十" + d + "?"
+    hundreds = d + "百(?:" + tens + "|零" + d + ")?"
+    thousands = d + "千(?:" + hundreds + "|零(?:" + tens + "|" + d + "))?"
+    small = "(?:%s|%s|%s)" % (hundreds, tens, d)
+    segment = "(?:%s|%s)" % (thousands, small)
+    low = "(?:%s|零%s)" % (thousands, small)
+    wan = "%s万%s?" % (segment, low)
+    yi = "%s亿(?:(?:%s|零%s)万%s?|零%s)?" % (segment, thousands, small, low, segment)
+    return "负?(?:%s|%s|%s)|零" % (yi, wan, segment)
+
+
+def canonical_regex():
+    """编译canonical_pattern(). 只在首次调用时编译, 不拖慢import.
+
+    返回:
+        re.Pattern: 规范形式的正则表达式.
+    """
+    if Table.re_canonical is None:
+        Table.re_canonical = re.compile(canonical_pattern())
+    return Table.re_canonical
+
+
+def canonical_chars():
+    """字符 => 值相同的规范字符, 由Table.chinese2int生成: 大写 => 小写, "两" => "二",
+    全角、半角数字 => 中文数字. "正"、"点"不在表中, 含"正"的字符串不会匹配规范形式.
+    """
+    canonical = dict(enumerate(Table.lower_traditional[:10]))
+    canonical.update(zip((10, 100, 1000), Table.lower_uint[1:]))
+    canonical.update(zip((10000, 100000000), Table.lower_delimiter[1:]))
+    canonical[-1] = Table.lower_traditional[-1]
+    return {c: canonical[p] for c, p in Table.chinese2int.items()
+            if p in canonical and c != canonical[p]}
+
+
+# chinese2int只按字符的值扫描, 替换后的值和格式是否合法都不变.
+canonical_table = str.maketrans(canonical_chars())
+
+
+def try_canonicalize(s, default=None):
+    """中文数字 => 规范形式. 不抛出异常.
+
+    参数:
+        s (string): 中文数字. 要求同chinese2int.
+        default: 转换失败时, 代替规范形式返回的值. 默认None.
+
+    返回:
+        tuple: (string, Status). 转换失败时为(default, 失败原因).
+    """
+    t = s.translate(canonical_table)
+    if canonical_regex().fullmatch(t) is not None:
+        return t, Status.OK
+    number, status = try_chinese2int(s)
+    if status:
+        return default, status
+    return int2chinese(number), Status.OK
+
+
+def canonicalize(s):
+    """中文数字 => 规范形式. 值相同的中文数字得到相同的字符串, 适合作为缓存、去重的键.
+
+    规范形式是int2chinese(chinese2int(s))的结果: 小写, 传统表示, 不使用"两", 保留
+    "一十", 不省略末尾的单位, 没有多余的"零". 例如"贰仟伍佰", "两千五", "零二千五百",
+    "二五〇〇"都规范化为"二千五百".
+
+    先用str.translate把字符换成值相同的规范字符, 结果已是规范形式时直接返回, 不做转换;
+    否则转换成整数后重新格式化.
+
+    参数:
+        s (string): 中文数字. 要求同chinese2int.
+
+    返回:
+        string: 规范形式.
+    """
+    result, status = try_canonicalize(s)
+    if status:
+        raise status_error(status)
+    return result
+
+
+def canonicalize_many(strings, errors="raise", default=None, lazy=False):
+    """批量 中文数字 => 规范形式.
+
+    参数:
+        strings (iterable): 中文数字序列, 每一项的要求同chinese2int.
+        errors (string): 转换失败时的处理方式, 同chinese2int_many.
+        default: errors="coerce"时, 代替转换失败项的值. 默认None.
+        lazy (bool): 是否返回生成器, 按需逐个转换. 默认False.
+
+    返回:
+        list | generator: 规范形式的序列.
+    """
+    return parse_many(canonicalize, try_canonicalize, strings,
+                      errors, default, lazy)
+
+
+# 转码
+
+
+# 规范形式的小写字符 => 大写字符. "零"和"两"大小写相同.
+upper_table = str.maketrans("一二三四五六七八九十百千万亿负",
+                            "壹贰叁肆伍陆柒捌玖拾佰仟萬億負")
+# 规范形式中, 使用"两"时被替代的"二": 百位、千位的"二", 以及"万亿"前整段为2的"二"
+# (最高分段, 或"亿"后补零的"万"分段).
+re_liang = re.compile("二(?=[百千])|(?:^|(?<=亿零))二(?=[万亿])")
+# 只有数字、没有单位的中文数字(枚举表示), 以及其中的数字 => ASCII数字.
+re_enumeration = re.compile("[负負]?[〇零一二三四五六七八九壹贰叁肆伍陆柒捌玖两０-９0-9]+")
+enumeration_ascii = str.maketrans("〇零一二三四五六七八九壹贰叁肆伍陆柒捌玖两０１２３４５６７８９",
+                                  "0012345678912345678920123456789")
+
+
+def transcoder(lower=True, enumeration=False,
+               use_liang=False,
+               use_simple_ten=False,
+               use_simple_zero_tail=False,
+               use_upper_zero=False,
+               width=0):
+    """根据目标格式选好转换表, 返回try_transcode使用的转码函数.
+
+    参数同int2chinese. 每种选项组合只在首次调用时生成.
+
+    返回:
+        function: convert(s, default=None) => (string, Status).
+    """
+    key = (lower, enumeration, use_liang, use_simple_ten,
+           use_simple_zero_tail, use_upper_zero, width)
+    convert = Table.transcoders.get(key)
+    if convert is not None:
+        return convert
+    format_int = int2chinese_converter(*key)
+
+    def reformat(s, default):
+        number, status = try_chinese2int(s)
+        if status:
+            return default, status
+        return format_int(number), Status.OK
+
+    if enumeration:
+        if lower:
+            digits = Table.lower_traditional if use_upper_zero else Table.lower_enumeration
+        else:
+            digits = Table.upper_enumeration
+        table = str.maketrans("0123456789", digits[:10])
+        minus = digits[-1]
+
+        def convert(s, default=None):
+            if re_enumeration.fullmatch(s) is None:
+                return reformat(s, default)
+            # 枚举表示 => 枚举表示: 去掉开头的零, 逐个数字替换.
+            t, sign = s, ""
+            if t[0] in "负負":
+                t = t[1:]
+                sign = minus
+            t = t.translate(enumeration_ascii).lstrip("0")
+            if len(t) > 12:
+                return reformat(s, default)
+            if not t:
+                t, sign = "0", ""
+            return sign + t.rjust(width, "0").translate(table), Status.OK
+    else:
+        zero = "零"
+        minus = "负" if lower else "負"
+        fullmatch = canonical_regex().fullmatch
+
+        def convert(s, default=None):
+            # 多数输入已是规范形式, 先直接匹配, 省去一次str.translate.
+            t = s
+            if fullmatch(t) is None:
+                t = s.translate(canonical_table)
+                if fullmatch(t) is None:
+                    return reformat(s, default)
+            # 规范形式 => 传统表示: 依次同int2chinese_converter处理"两", "一十",
+            # 大小写, 末尾的单位, 宽度.
+            sign = ""
+            if t[0] == "负":
+                t = t[1:]
+                sign = minus
+            if use_liang:
+                t = re_liang.sub("两", t)
+            if use_simple_ten and t.startswith("一十"):
+                t = t[1:]
+            if not lower:
+                t = t.translate(upper_table)
+            if use_simple_zero_tail:
+                t = chinese_simple_zero_tail(t, lower)
+            if len(t) < width:
+                t = zero * (width - len(t)) + t
+            return sign + t, Status.OK
+
+    Table.transcoders[key] = convert
+    return convert
+
+
+def transcode_options(to):
+    """to => transcoder的参数. to可以是None, dict或Formatter."""
+    if to is None:
+        return {}
+    if isinstance(to, Formatter):
+        to = to.options
+    return {k: v for k, v in to.items() if k != "precision"}
+
+
+def try_transcode(s, to=None, default=None):
+    """中文数字 => 另一种格式的中文数字. 不抛出异常.
+
+    参数:
+        s (string): 中文数字. 要求同chinese2int.
+        to (dict | Formatter): 目标格式, int2chinese的转换选项. 默认None, 即规范形式.
+        default: 转换失败时, 代替结果返回的值. 默认None.
+
+    返回:
+        tuple: (string, Status). 转换失败时为(default, 失败原因).
+    """
+    return transcoder(**transcode_options(to))(s, default)
+
+
+def transcode(s, to=None):
+    """中文数字 => 另一种格式的中文数字. 结果同int2chinese(chinese2int(s), **to).
+
+    结构不变时不转换成整数: 字符换成值相同的规范字符后是规范形式的, 直接用正则替换加上
+    "两", 去掉"一十"的"一"和末尾的单位, 再用str.translate换成大写; 目标是枚举表示、s也是
+    枚举表示的, 逐个数字替换. 其余的(如省略了末尾单位的s, 传统表示 <=> 枚举表示)转换成
+    整数后重新格式化.
+
+    参数:
+        s (string): 中文数字. 要求同chinese2int.
+        to (dict | Formatter): 目标格式, int2chinese的转换选项, 如
+            {"lower": False, "use_liang": True}. Formatter的precision被忽略.
+            默认None, 即规范形式.
+
+    返回:
+        string: 目标格式的中文数字.
+
+    例子:
+        transcode("二千五百", {"lower": False})  # "贰仟伍佰"
+        transcode("一二三", {"enumeration": True, "lower": False})  # "壹贰叁"
+    """
+    result, status = try_transcode(s, to)
+    if status:
+        raise status_error(status)
+    return result
+
+
+def transcode_many(strings, to=None, errors="raise", default=None, lazy=False):
+    """批量 中文数字 => 另一种格式的中文数字. 目标格式只处理一次.
+
+    参数:
+        strings (iterable): 中文数字序列, 每一项的要求同chinese2int.
+        to (dict | Formatter): 目标格式, 同transcode.
+        errors (string): 转换失败时的处理方式, 同chinese2int_many.
+        default: errors="coerce"时, 代替转换失败项的值. 默认None.
+        lazy (bool): 是否返回生成器, 按需逐个转换. 默认False.
+
+    返回:
+        list | generator: 目标格式的中文数字序列.
+    """
+    convert = transcoder(**transcode_options(to))
+
+    def strict(s):
+        result, status = convert(s, None)
+        if status:
+            raise status_error(status)
+        return result
+
+    return parse_many(strict, convert, strings, errors, default, lazy)
+
+
+# 格式化器, 解析器
+
+
+class Formatter:
+    """整数/浮点数 => 中文数字. 构造时处理一次转换选项, 之后的转换不再判断选项.
+
+    参数:
+        lower, enumeration, use_liang, use_simple_ten, use_simple_zero_tail,
+        use_upper_zero, width: 同int2chinese.
+        precision (int): 浮点数精度, 同float2chinese. 默认6.
+
+    方法:
+        format(number): 整数 => 中文数字, 同int2chinese.
+        format_float(number): 浮点数 => 中文数字, 同float2chinese. 不使用
+            enumeration, use_upper_zero, width.
+        format_many(numbers, lazy=False), format_float_many(numbers, lazy=False):
+            批量转换.
+
+    例子:
+        formatter = Formatter(lower=False, use_liang=True)
+        formatter.format(2306300078)
+        formatter.format_float(23063000.78)
+    """
+
+    def __init__(self, lower=True, enumeration=False,
+                 use_liang=False,
+                 use_simple_ten=False,
+                 use_simple_zero_tail=False,
+                 use_upper_zero=False,
+                 width=0,
+                 precision=6):
+        self.options = {"lower": lower, "enumeration": enumeration,
+                        "use_liang": use_liang,
+                        "use_simple_ten": use_simple_ten,
+                        "use_simple_zero_tail": use_simple_zero_tail,
+                        "use_upper_zero": use_upper_zero,
+                        "width": width,
+                        "precision": precision}
+        self.format = int2chinese_converter(lower, enumeration,
+                                            use_liang=use_liang,
+                                            use_simple_ten=use_simple_ten,
+                                            use_simple_zero_tail=use_simple_zero_tail,
+                                            use_upper_zero=use_upper_zero,
+                                            width=width)
+        self.format_float = float2chinese_converter(lower, precision,
+                                                    use_liang=use_liang,
+                                                    use_simple_ten=use_simple_ten,
+                                                    use_simple_zero_tail=use_simple_zero_tail)
+
+    def __repr__(self):
+        options = ", ".join("%s=%r" % item for item in self.options.items())
+        return "Formatter(%s)" % options
+
+    def __call__(self, number):
+        return self.format(number)
+
+    def format_many(self, numbers, lazy=False):
+        results = map(self.format, numbers)
+        return results if lazy else list(results)
+
+    def format_float_many(self, numbers, lazy=False):
+        results = map(self.format_float, numbers)
+        return results if lazy else list(results)
+
+
+class Parser:
+    """中文数字 => 整数/浮点数. 构造时把接受的字符和表示方式写入查找表, 转换时在同一遍
+    扫描中拒绝不接受的输入.
+
+    参数:
+        lower (bool): 是否接受小写中文数字"〇一二三四五六七八九十百千万亿负点". 默认True.
+        upper (bool): 是否接受大写中文数字"壹贰叁肆伍陆柒捌玖拾佰仟萬億負點". 默认True.
+        mixed_case (bool): 是否接受大小写混合, 如"二千伍佰". 默认True.
+        liang (bool): 是否接受"两". 默认True.
+        arabic (bool): 是否接受阿拉伯数字"0-9", "０-９". 默认True.
+        sign (bool): 是否接受正负号"正负負". 默认True.
+        enumeration (bool): 是否接受枚举表示. 默认True.
+        traditional (bool): 是否接受传统表示. 默认True.
+
+    不接受的字符按Status.INVALID_CHARACTER处理, 不接受的表示方式按
+    Status.INVALID_GRAMMAR处理. 不接受大小写混合时, 与第一个区分大小写的字符
+    大小写不同的字符, 也按不接受的字符处理.
+
+    例子:
+        parser = Parser(upper=False, liang=False)
+        parser.parse("一百二十三")
+        parser.parse_many(["一", "二"], errors="coerce")
+        parser.parse_float("三点一四")
+    """
+
+    lower_characters = "〇一二三四五六七八九十百千万亿负点"
+    upper_characters = "壹贰叁肆伍陆柒捌玖拾佰仟萬億負點"
+    arabic_characters = "0123456789０１２３４５６７８９"
+
+    def __init__(self, lower=True, upper=True, mixed_case=True,
+                 liang=True, arabic=True, sign=True,
+                 enumeration=True, traditional=True):
+        self.options = {"lower": lower, "upper": upper,
+                        "mixed_case": mixed_case,
+                        "liang": liang, "arabic": arabic, "sign": sign,
+                        "enumeration": enumeration,
+                        "traditional": traditional}
+        self.enumeration = enumeration
+        self.traditional = traditional
+
+        excluded = ""
+        if not liang:
+            excluded += "两"
+        if not arabic:
+            excluded += self.arabic_characters
+        if not sign:
+            excluded += "正负負"
+        common = {c: p for c, p in Table.chinese2int.items()
+                  if c not in excluded and c not in self.lower_characters
+                  and c not in self.upper_characters}
+        table_lower = dict(common)
+        table_upper = dict(common)
+        for c in self.lower_characters:
+            if c not in excluded:
+                table_lower[c] = Table.chinese2int[c]
+        for c in self.upper_characters:
+            if c not in excluded:
+                table_upper[c] = Table.chinese2int[c]
+
+        # table为None时, 每次转换根据第一个区分大小写的字符, 从cases中选出查找表.
+        self.cases = None
+        if lower and upper:
+            if mixed_case:
+                self.table = dict(table_lower, **table_upper)
+            else:
+                self.table = None
+                self.cases = dict.fromkeys(table_lower.keys() - common.keys(),
+                                           table_lower)
+                self.cases.update(dict.fromkeys(table_upper.keys() - common.keys(),
+                                                table_upper))
+                self.table_default = table_lower
+        elif lower:
+            self.table = table_lower
+        elif upper:
+            self.table = table_upper
+        else:
+            self.table = common
+
+    def __repr__(self):
+        options = ", ".join("%s=%r" % item for item in self.options.items())
+        return "Parser(%s)" % options
+
+    def select_table(self, s):
+        """不接受大小写混合时, 根据第一个区分大小写的字符选出查找表."""
+        cases = self.cases
+        for c in s:
+            table = cases.get(c)
+            if table is not None:
+                return table
+        return self.table_default
+
+    def try_parse(self, s, default=None):
+        """中文数字 => 整数. 不抛出异常, 同try_chinese2int."""
+        table = self.table
+        if table is None:
+            table = self.select_table(s)
+        return chinese2int_signed(s, default, table,
+                                  self.enumeration, self.traditional)
+
+    def try_parse_float(self, s, default=None):
+        """中文数字 => 浮点数. 不抛出异常, 同try_chinese2float."""
+        table = self.table
+        if table is None:
+            table = self.select_table(s)
+        return chinese2float_signed(s, default, table,
+                                    self.enumeration, self.traditional)
+
+    def parse(self, s):
+        """中文数字 => 整数, 同chinese2int."""
+        number, status = self.try_parse(s)
+        if status:
+            raise status_error(status)
+        return number
+
+    def parse_float(self, s):
+        """中文数字 => 浮点数, 同chinese2float."""
+        number, status = self.try_parse_float(s)
+        if status:
+            raise status_error(status)
+        return number
+
+    def parse_many(self, strings, errors="raise", default=None, lazy=False):
+        """批量 中文数字 => 整数, 参数同chinese2int_many."""
+        return parse_many(self.parse, self.try_parse, strings,
+                          errors, default, lazy)
+
+    def parse_float_many(self, strings, errors="raise", default=None,
+                         lazy=False):
+        """批量 中文数字 => 浮点数, 参数同chinese2float_many."""
+        return parse_many(self.parse_float, self.try_parse_float, strings,
+                          errors, default, lazy)
+
+
+# 缓存
+
+
+class Cache:
+    """转换结果的有界LRU缓存, 适合大量重复的输入. 转换失败的结果同样被缓存.
+
+    参数:
+        maxsize (int): 最多缓存的结果数, 超出时淘汰最久未使用的结果. None表示不限制.
+            默认65536.
+
+    属性:
+        hits, misses, evictions (int): 命中、未命中、淘汰的次数.
+
+    方法与同名的函数相同: chinese2int, chinese2float, convert2int, int2chinese,
+    以及try_chinese2int, try_chinese2float, try_convert2int.
+
+    注: 非线程安全, 多线程时每个线程使用各自的Cache.
+
+    例子:
+        cache = Cache(maxsize=10000)
+        cache.chinese2int("一百二十三")
+        cache.info()
+    """
+
+    missing = object()
+
+    def __init__(self, maxsize=65536):
+        self.maxsize = maxsize
+        self.data = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __len__(self):
+        return len(self.data)
+
+    def __repr__(self):
+        return "Cache(%s)" % ", ".join("%s=%r" % item for item in self.info().items())
+
+    def info(self):
+        """缓存的统计信息.
+
+        返回:
+            dict: hits, misses, evictions, size, maxsize.
+        """
+        return {"hits": self.hits, "misses": self.misses,
+                "evictions": self.evictions,
+                "size": len(self.data), "maxsize": self.maxsize}
+
+    def clear(self):
+        """清空缓存和统计信息."""
+        self.data.clear()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def lookup(self, key, convert, value):
+        """查找key对应的结果. 未命中时计算convert(value)并缓存."""
+        data = self.data
+        result = data.get(key, self.missing)
+        if result is self.missing:
+            self.misses += 1
+            result = convert(value)
+            data[key] = result
+            if self.maxsize is not None and len(data) > self.maxsize:
+                data.popitem(last=False)
+                self.evictions += 1
+        else:
+            self.hits += 1
+            data.move_to_end(key)
+        return result
+
+    def try_chinese2int(self, s, default=None):
+        result = self.lookup((0, s), try_chinese2int, s)
+        return (default, result[1]) if result[1] else result
+
+    def try_chinese2float(self, s, default=None):
+        result = self.lookup((1, s), try_chinese2float, s)
+        return (default, result[1]) if result[1] else result
+
+    def try_convert2int(self, s, default=None):
+        result = self.lookup((2, s), try_convert2int, s)
+        return (default, result[1]) if result[1] else result
+
+    def chinese2int(self, s):
+        number, status = self.lookup((0, s), try_chinese2int, s)
+        if status:
+            raise status_error(status)
+        return number
+
+    def chinese2float(self, s):
+        number, status = self.lookup((1, s), try_chinese2float, s)
+        if status:
+            raise status_error(status)
+        return number
+
+    def convert2int(self, s):
+        number, status = self.lookup((2, s), try_convert2int, s)
+        if status:
+            raise status_error(status, "Arabic, Roman or Chinese")
+        return number
+
+    def int2chinese(self, number, lower=True, enumeration=False,
+                    use_liang=False,
+                    use_simple_ten=False,
+                    use_simple_zero_tail=False,
+                    use_upper_zero=False,
+                    width=0):
+        key = (3, number, lower, enumeration, use_liang, use_simple_ten,
+               use_simple_zero_tail, use_upper_zero, width)
+        return self.lookup(key, self.int2chinese_key, key)
+
+    @staticmethod
+    def int2chinese_key(key):
+        # key[1:]的顺序与int2chinese的参数顺序一致.
+        return int2chinese(*key[1:])
+
+
+# 增量解析
+
+
+class IncrementalParser:
+    """增量解析中文数字. 字符逐个或逐段追加, 每个字符O(1), 随时可以读取当前结果.
+
+    chinese2int_scan逆序扫描, 追加字符会改变整个扫描过程. 这里按正序识别同一套语法:
+    去掉"零"后, 数字和权值交替出现, 同一段内权值递减; "万亿"把数字分成至多3段, 末尾
+    连续的"万"从右往左两两合并为"亿"; 只有末尾的"X百Y", "X千Y"等省略了单位. 结果与
+    chinese2int/chinese2float完全一致. 格式非法时, 状态码由chinese2int/chinese2float
+    对已读取的全部字符计算, 与它们的报错一致.
+
+    参数:
+        decimal (bool): 是否按chinese2float解析, 接受"点". 默认False, 按chinese2int
+            解析.
+
+    属性:
+        value: 当前已读取字符对应的整数/浮点数. 格式非法或尚不完整时为None.
+        is_complete (bool): 当前已读取的字符是否是合法的中文数字.
+        status (int): 当前的状态码, 见Status.
+        text (string): 已读取的全部字符.
+
+    例子:
+        parser = IncrementalParser()
+        for c in "一万二千":
+            parser.feed(c)
+            print(parser.text, parser.value)
+    """
+
+    def __init__(self, decimal=False):
+        self.decimal = decimal
+        self.reset()
+
+    def __repr__(self):
+        return "IncrementalParser(%r, value=%r)" % (self.text, self.value)
+
+    def reset(self):
+        """清空已读取的字符."""
+        self.chars = []
+        self.sign = 1
+        # 不可恢复的格式错误: 之后无论追加什么字符, 都不合法.
+        self.error = False
+        self.cache = None
+
+        # 整数部分. first是第一个字符(不含正负号)对应的整数.
+        self.first = None
+        self.all_digits = True
+        self.enumeration = 0
+        # 末尾连续的数字: 长度, 非零数字, 是否出现多个非零数字, 之前的权值.
+        self.run_length = 0
+        self.run_digit = 0
+        self.repeat = False
+        self.last_unit = 0
+        # 去掉"零"后, 上一个字符的类型: None, "digit", "unit", "delimiter".
+        self.prev = None
+        # 当前段的值和最小的权值; 已结束的各段的值和分隔符.
+        self.section = 0
+        self.unit = 10000
+        self.sections = []
+        self.delimiters = []
+        # 末尾连续的"万"的个数, 尚未合并.
+        self.wan = 0
+
+        # 小数部分. integer是"点"之前的整数部分.
+        self.point = False
+        self.integer = 0
+        self.fraction = 0
+        self.fraction_length = 0
+        self.tail = 1
+
+    @property
+    def text(self):
+        return "".join(self.chars)
+
+    def feed(self, s):
+        """追加一个或多个字符."""
+        table = Table.chinese2int
+        for c in s:
+            self.chars.append(c)
+            if self.error:
+                continue
+            p = table.get(c)
+            if p is None:
+                self.error = True
+            elif p < 0 and len(self.chars) == 1:
+                # "正负負"开头, "点"开头
+                if p == -100:
+                    self.error = True
+                elif p == -1:
+                    self.sign = -1
+            elif self.point:
+                self.feed_fraction(p)
+            elif p == -100 and self.decimal:
+                self.feed_point()
+            elif p < 0:
+                self.error = True
+            else:
+                self.feed_integer(p)
+        self.cache = None
+
+    def feed_integer(self, p):
+        if self.first is None:
+            self.first = p
+            if p > 10:
+                # 第一个字符不能是"百千万亿佰仟萬億"
+                self.error = True
+                return
+
+        if p < 10:
+            if self.wan:
+                self.merge_wan()
+            if self.all_digits and self.enumeration < 1000000000000:
+                self.enumeration = self.enumeration * 10 + p
+            self.run_length += 1
+            if p:
+                if self.prev == "digit":
+                    self.repeat = True
+                self.run_digit = p
+                self.prev = "digit"
+            return
+
+        self.all_digits = False
+        if p == 10000 and self.wan:
+            self.wan += 1
+        else:
+            if self.wan:
+                self.merge_wan()
+            if p < 10000:
+                # 十百千: 前面是数字时组成一对, 不能紧跟在权值或分隔符之后.
+                if self.prev == "digit":
+                    self.section += self.run_digit * p
+                elif self.prev is not None:
+                    self.error = True
+                    return
+                if p >= self.unit:
+                    self.error = True
+                    return
+                self.unit = p
+                self.prev = "unit"
+            else:
+                # 万亿: 结束当前段.
+                if self.prev == "digit":
+                    self.section += self.run_digit
+                self.sections.append(self.section)
+                self.section = 0
+                self.unit = 10000
+                if p == 10000:
+                    self.wan = 1
+                else:
+                    self.delimiters.append(p)
+                self.prev = "delimiter"
+                if len(self.delimiters) > 2:
+                    self.error = True
+        self.last_unit = p
+        self.run_length = 0
+        self.run_digit = 0
+
+    def wan_delimiters(self):
+        """末尾连续的"万", 从右往左两两合并为"亿". 返回(分隔符, 新增的空段数)."""
+        n = self.wan
+        if n % 2:
+            return [10000] + [100000000] * (n // 2), n // 2
+        return [100000000] * (n // 2), n // 2 - 1
+
+    def merge_wan(self):
+        delimiters, empty = self.wan_delimiters()
+        self.delimiters += delimiters
+        self.sections += [0] * empty
+        self.wan = 0
+        if len(self.delimiters) > 2:
+            self.error = True
+
+    def feed_point(self):
+        number = self.integer_value(False)
+        if number is None:
+            self.error = True
+            return
+        self.integer = number
+        self.point = True
+
+    def feed_fraction(self, p):
+        if self.tail != 1 or p < 0 or 9 < p < 10000:
+            self.error = True
+        elif p > 9:
+            # "六点三万", "五点八亿"
+            if self.fraction_length == 0:
+                self.error = True
+            self.tail = p
+        else:
+            self.fraction_length += 1
+            if self.fraction_length <= 12:
+                self.fraction = self.fraction * 10 + p
+
+    def integer_value(self, enumeration):
+        """整数部分(不含正负号)的值. 格式非法时返回None.
+
+        参数:
+            enumeration (bool): 是否接受枚举表示. 见chinese2int_scan.
+        """
+        if self.first is None or self.error:
+            return None
+        if self.all_digits:
+            if not enumeration:
+                # 只接受传统表示时, 数字不能连续出现, 零除外.
+                return None if self.repeat else self.run_digit
+            if self.enumeration >= 1000000000000:
+                return None
+            return self.enumeration
+        if self.repeat:
+            return None
+
+        sections = self.sections
+        delimiters = self.delimiters
+        if self.wan:
+            extra, empty = self.wan_delimiters()
+            sections = sections + [0] * empty
+            delimiters = delimiters + extra
+        if len(delimiters) > 2 or (len(delimiters) == 2 and delimiters[1] != 10000):
+            # e.g. 三万亿, 六亿亿, 六千万五亿
+            return None
+
+        # 最后一段. 末尾的"X百Y", "X千Y", "X万Y", "X亿Y"省略了Y的单位.
+        last = self.section
+        if self.prev == "digit":
+            digit = self.run_digit
+            if self.run_length == 1 and self.last_unit > 10:
+                digit *= self.last_unit // 10
+            last += digit
+
+        # "十"开头, 即"一十"开头.
+        leading = 10 if self.first == 10 else 0
+        if not delimiters:
+            return last + leading
+        if len(delimiters) == 1:
+            return (sections[0] + leading) * delimiters[0] + last
+        return (sections[0] + leading) * 100000000 + sections[1] * 10000 + last
+
+    @property
+    def value(self):
+        if self.error:
+            return None
+        if self.point:
+            if self.fraction_length == 0 or self.fraction_length > 12:
+                return None
+            number = self.integer + self.fraction / Table.levels[self.fraction_length]
+            number *= self.tail
+            number *= self.sign
+            return number
+        number = self.integer_value(True)
+        if number is None:
+            return None
+        if self.decimal:
+            number *= 1.0
+        return number * self.sign
+
+    @property
+    def is_complete(self):
+        return self.value is not None
+
+    @property
+    def status(self):
+        if self.cache is None:
+            if self.value is not None:
+                self.cache = Status.OK
+            elif self.decimal:
+                self.cache = try_chinese2float(self.text)[1]
+            else:
+                self.cache = try_chinese2int(self.text)[1]
+        return self.cache
+
+    def result(self):
+        """当前已读取字符对应的整数/浮点数. 格式非法时, 与chinese2int/chinese2float
+        抛出相同的异常."""
+        number = self.value
+        if number is None:
+            raise status_error(self.status)
+        return number
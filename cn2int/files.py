@@ -0,0 +1,148 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""按行转换整个文件. 每行一个数字, UTF-8编码.
+
+输入文件被内存映射, 每次取约chunksize字节并在换行符处对齐, 整块解码成一个字符串后再
+切分成行, 转换结果join成一个字符串, 编码后写入大缓冲区的输出文件. 任何时候只有一块在
+内存中.
+"""
+
+import mmap
+
+from .cn2int import (Formatter, int2roman, try_chinese2int, try_chinese2float,
+                     try_roman2int, try_convert2int)
+
+
+__all__ = ["convert_file"]
+
+
+parsers = {"chinese2int": try_chinese2int, "chinese2float": try_chinese2float,
+           "roman2int": try_roman2int, "convert2int": try_convert2int}
+formatters = ["int2chinese", "float2chinese", "int2roman"]
+
+
+def string_converter(mode, **options):
+    """返回convert(field) => string. 转换失败时返回None.
+
+    参数:
+        mode (string): parsers或formatters中的转换函数名.
+        options: int2chinese, float2chinese的转换选项, 同Formatter.
+    """
+    if mode in parsers:
+        parse = parsers[mode]
+
+        def convert(field):
+            number, status = parse(field.strip())
+            return None if status else str(number)
+        return convert
+
+    if mode == "int2roman":
+        format_number, number_type = int2roman, int
+    elif mode == "int2chinese":
+        format_number, number_type = Formatter(**options).format, int
+    elif mode == "float2chinese":
+        format_number, number_type = Formatter(**options).format_float, float
+    else:
+        raise ValueError("unknown mode %r" % mode)
+
+    def convert(field):
+        try:
+            return format_number(number_type(field))
+        except (ValueError, OverflowError):
+            return None
+    return convert
+
+
+def aligned_chunks(data, chunksize):
+    """把bytes-like的data切成约chunksize字节的块, 每块(除最后一块)以b"\\n"结尾."""
+    size = len(data)
+    pos = 0
+    while pos < size:
+        end = pos + chunksize
+        if end < size:
+            newline = data.rfind(b"\n", pos, end)
+            if newline < 0:
+                # 一行比chunksize还长
+                newline = data.find(b"\n", end)
+            end = size if newline < 0 else newline + 1
+        else:
+            end = size
+        yield data[pos:end]
+        pos = end
+
+
+def convert_chunk(chunk, convert, errors, default, lineno):
+    """转换一块文本. 返回(转换后的文本, 行数, 失败数).
+
+    lineno是这一块之前的行数, 用于报错.
+    """
+    lines = chunk.split("\n")
+    tail = ""
+    if not lines[-1]:
+        lines.pop()
+        tail = "\n"
+    crlf = "\r" in chunk
+    if crlf:
+        # 保留"\r\n"
+        endings = ["\r" if line.endswith("\r") else "" for line in lines]
+        lines = [line.rstrip("\r") for line in lines]
+
+    values = list(map(convert, lines))
+    failures = values.count(None)
+    if failures:
+        if errors == "raise":
+            i = values.index(None)
+            raise ValueError("line %d: cannot convert %r" % (lineno + i + 1, lines[i]))
+        if errors == "coerce":
+            values = [default if v is None else v for v in values]
+        else:
+            if crlf:
+                endings = [e for v, e in zip(values, endings) if v is not None]
+            values = [v for v in values if v is not None]
+            if not values:
+                return "", len(lines), failures
+    if crlf:
+        values = [v + e for v, e in zip(values, endings)]
+    return "\n".join(values) + tail, len(lines), failures
+
+
+def convert_file(src, dst, mode="chinese2int", errors="raise", default="",
+                 chunksize=1 << 22, **options):
+    """按行转换文件, 每行一个数字. 适合GB级的大文件.
+
+    输入被内存映射, 按换行符对齐的大块整块解码和转换, 不会一次读入整个文件, 也不会逐行
+    读取.
+
+    参数:
+        src (string | os.PathLike): 输入文件, UTF-8编码.
+        dst (string | os.PathLike): 输出文件, UTF-8编码. 换行符与输入一致.
+        mode (string): 转换函数, "chinese2int", "chinese2float", "roman2int",
+            "convert2int", "int2chinese", "float2chinese", "int2roman"之一.
+            默认"chinese2int".
+        errors (string): 转换失败时, "raise"抛出ValueError, "coerce"用default代替,
+            "ignore"丢弃该行. 默认"raise".
+        default (string): errors="coerce"时代替的值. 默认"".
+        chunksize (int): 每块的字节数, 也是输出缓冲区的大小. 默认4MiB.
+        options: int2chinese, float2chinese的转换选项, 同Formatter.
+
+    返回:
+        dict: {"rows": 行数, "errors": 转换失败的行数}.
+    """
+    if errors not in ("raise", "coerce", "ignore"):
+        raise ValueError("errors must be 'raise', 'coerce' or 'ignore'")
+    convert = string_converter(mode, **options)
+    rows = failures = 0
+    buffering = max(chunksize, 1 << 16)
+    with open(src, "rb") as source, open(dst, "wb", buffering=buffering) as output:
+        # 空文件不能被内存映射
+        if source.seek(0, 2) == 0:
+            return {"rows": 0, "errors": 0}
+        with mmap.mmap(source.fileno(), 0, access=mmap.ACCESS_READ) as data:
+            for chunk in aligned_chunks(data, chunksize):
+                text, n, f = convert_chunk(chunk.decode("utf-8"), convert, errors,
+                                           default, rows)
+                output.write(text.encode("utf-8"))
+                rows += n
+                failures += f
+    return {"rows": rows, "errors": failures}
@@ -0,0 +1,198 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""多进程批量转换. 转换函数是纯Python实现, 受GIL限制只能使用一个核, 因此把输入切成块,
+分给concurrent.futures.ProcessPoolExecutor中的多个进程.
+
+- 列表等可迭代对象: 每块pickle后发送给子进程.
+- 文件路径: 只发送按换行符对齐的字节范围, 子进程自己读取和解码.
+- NumPy数组(非object类型): 复制到共享内存中一次, 只发送共享内存的名字和切片范围.
+
+同时提交的块数有上限, 结果按输入的顺序生成.
+"""
+
+import itertools
+import mmap
+import os
+import sys
+from collections import deque
+
+
+__all__ = ["parallel_convert"]
+
+
+def loaded_numpy():
+    """已导入的NumPy模块, 未导入时为None.
+
+    输入是NumPy数组时NumPy一定已经导入, 判断类型不必导入NumPy. concurrent.futures,
+    multiprocessing.shared_memory同样只在用到时导入, import cn2int不会加载它们.
+    """
+    return sys.modules.get("numpy")
+
+
+def import_shared_memory():
+    try:
+        from multiprocessing import shared_memory
+    except ImportError:
+        return None
+    return shared_memory
+
+
+def convert_items(func, items):
+    return list(map(func, items))
+
+
+def convert_range(func, path, start, end):
+    """转换文件path中[start, end)字节范围内的各行."""
+    with open(path, "rb") as f:
+        f.seek(start)
+        text = f.read(end - start).decode("utf-8")
+    lines = text.split("\n")
+    if not lines[-1]:
+        lines.pop()
+    return [func(line.rstrip("\r")) for line in lines]
+
+
+def convert_shared(func, name, shape, dtype, start, end):
+    """转换共享内存name中的NumPy数组的[start, end)部分."""
+    import numpy as np
+    from multiprocessing import shared_memory
+    memory = shared_memory.SharedMemory(name=name)
+    try:
+        data = np.ndarray(shape, dtype=dtype, buffer=memory.buf)
+        items = data[start:end].tolist()
+        del data
+    finally:
+        memory.close()
+    return list(map(func, items))
+
+
+def file_ranges(path, chunksize):
+    """文件path => 按换行符对齐, 约chunksize字节的(start, end)."""
+    with open(path, "rb") as f:
+        if f.seek(0, 2) == 0:
+            return
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+            start = 0
+            size = len(data)
+            while start < size:
+                end = start + chunksize
+                if end < size:
+                    newline = data.find(b"\n", end - 1)
+                    end = size if newline < 0 else newline + 1
+                else:
+                    end = size
+                yield start, end
+                start = end
+
+
+def line_tasks(stream, chunksize):
+    """文件对象 => 每块chunksize行, 去掉换行符."""
+    while True:
+        lines = [line.rstrip("\r\n") for line in itertools.islice(stream, chunksize)]
+        if not lines:
+            return
+        yield convert_items, lines
+
+
+def item_tasks(iterable, chunksize):
+    iterator = iter(iterable)
+    while True:
+        items = list(itertools.islice(iterator, chunksize))
+        if not items:
+            return
+        yield convert_items, items
+
+
+def ordered_results(tasks, func, workers):
+    """提交tasks, 最多同时有2 * workers块, 按提交的顺序生成结果."""
+    from concurrent.futures import ProcessPoolExecutor
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        pending = deque()
+        try:
+            for task, *args in tasks:
+                pending.append(executor.submit(task, func, *args))
+                if len(pending) >= 2 * workers:
+                    yield from pending.popleft().result()
+            while pending:
+                yield from pending.popleft().result()
+        finally:
+            for future in pending:
+                future.cancel()
+
+
+def shared_results(data, func, workers, chunksize, np, shared_memory):
+    """NumPy数组复制到共享内存一次, 子进程按切片范围读取."""
+    memory = shared_memory.SharedMemory(create=True, size=data.nbytes)
+    try:
+        np.ndarray(data.shape, dtype=data.dtype, buffer=memory.buf)[...] = data
+        tasks = ((convert_shared, memory.name, data.shape, data.dtype.str,
+                  i, min(i + chunksize, len(data)))
+                 for i in range(0, len(data), chunksize))
+        yield from ordered_results(tasks, func, workers)
+    finally:
+        memory.close()
+        memory.unlink()
+
+
+def parallel_results(iterable_or_file, func, workers, chunksize):
+    if isinstance(iterable_or_file, (str, os.PathLike)):
+        # 文件路径, 每块约chunksize * 16字节
+        path = os.fspath(iterable_or_file)
+        tasks = ((convert_range, path, start, end)
+                 for start, end in file_ranges(path, chunksize * 16))
+        return ordered_results(tasks, func, workers)
+
+    np = loaded_numpy()
+    if (np is not None and isinstance(iterable_or_file, np.ndarray)
+            and iterable_or_file.dtype != object and iterable_or_file.size):
+        shared_memory = import_shared_memory()
+        if shared_memory is not None:
+            return shared_results(np.ravel(iterable_or_file), func, workers, chunksize,
+                                  np, shared_memory)
+
+    if hasattr(iterable_or_file, "readline"):
+        return ordered_results(line_tasks(iterable_or_file, chunksize), func, workers)
+    return ordered_results(item_tasks(iterable_or_file, chunksize), func, workers)
+
+
+def parallel_convert(iterable_or_file, func, workers=None, chunksize=16384, lazy=False):
+    """多进程批量转换, 结果按输入的顺序排列.
+
+    参数:
+        iterable_or_file: 输入.
+            - 可迭代对象, 如list, generator.
+            - 文本文件对象, 每行一项, 去掉换行符.
+            - 文件路径(string | os.PathLike), UTF-8编码, 每行一项. 子进程自己读取文件.
+            - NumPy数组, 非object类型时经共享内存传给子进程. 多维数组按ravel的顺序.
+        func (callable): 对每一项调用的转换函数, 如chinese2int, int2chinese.
+            必须可以pickle(模块级函数), 转换失败时抛出的异常会在取结果时重新抛出.
+        workers (int): 进程数. 默认os.cpu_count(). 为1时在当前进程中直接转换.
+        chunksize (int): 每块的项数. 默认16384.
+        lazy (bool): 为True时返回生成器. 默认False.
+
+    返回:
+        list | generator: func(item)的结果.
+    """
+    if workers is None:
+        workers = os.cpu_count() or 1
+    if workers < 1:
+        raise ValueError("workers must be >= 1")
+    if chunksize < 1:
+        raise ValueError("chunksize must be >= 1")
+
+    if workers == 1:
+        np = loaded_numpy()
+        if isinstance(iterable_or_file, (str, os.PathLike)):
+            results = itertools.chain.from_iterable(
+                convert_range(func, iterable_or_file, start, end)
+                for start, end in file_ranges(iterable_or_file, chunksize * 16))
+        elif hasattr(iterable_or_file, "readline"):
+            results = (func(line.rstrip("\r\n")) for line in iterable_or_file)
+        elif np is not None and isinstance(iterable_or_file, np.ndarray):
+            results = map(func, np.ravel(iterable_or_file).tolist())
+        else:
+            results = map(func, iterable_or_file)
+    else:
+        results = parallel_results(iterable_or_file, func, workers, chunksize)
+    return results if lazy else list(results)
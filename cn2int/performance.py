@@ -1,9 +1,12 @@
 #!/usr/bin/env python3
 # -*- coding: utf-8 -*-
 
+import os
+import sys
 from timeit import default_timer
 
 import cn2int as c2i
+from cn2int.cn2int import Table, segment_tables
 
 
 def performance_int2chinese(number):
@@ -17,7 +20,7 @@ def performance_int2chinese(number):
                             use_simple_zero_tail=False,
                             width=0)
     rate = int(1e5 / (default_timer() - last) / 1e3)
-    print("%-16s: %4d k/s" % ("int2chinese", rate))
+    print("%-19s: %4d k/s" % ("int2chinese", rate))
 
 
 def performance_chinese2int(s):
@@ -25,7 +28,16 @@ def performance_chinese2int(s):
     for i in range(int(1e5)):
         number = c2i.chinese2int(s)
     rate = int(1e5 / (default_timer() - last) / 1e3)
-    print("%-16s: %4d k/s" % ("chinese2int", rate))
+    print("%-19s: %4d k/s" % ("chinese2int", rate))
+
+
+def performance_chinese2int_mixed(strings):
+    strings = strings * int(1e5 / len(strings))
+    last = default_timer()
+    for s in strings:
+        number = c2i.chinese2int(s)
+    rate = int(len(strings) / (default_timer() - last) / 1e3)
+    print("%-19s: %4d k/s" % ("chinese2int(mixed)", rate))
 
 
 def performance_chinese2float(s):
@@ -33,14 +45,183 @@ def performance_chinese2float(s):
     for i in range(int(1e5)):
         number = c2i.chinese2float(s)
     rate = int(1e5 / (default_timer() - last) / 1e3)
-    print("%-16s: %4d k/s" % ("chinese2float", rate))
+    print("%-19s: %4d k/s" % ("chinese2float", rate))
+
+
+def performance_int2chinese_many(number):
+    numbers = [number] * int(1e5)
+    last = default_timer()
+    strings = c2i.int2chinese_many(numbers,
+                                   lower=True,
+                                   enumeration=False,
+                                   use_liang=False,
+                                   use_simple_ten=False,
+                                   use_simple_zero_tail=False,
+                                   width=0)
+    rate = int(1e5 / (default_timer() - last) / 1e3)
+    print("%-19s: %4d k/s" % ("int2chinese_many", rate))
+
+
+def performance_int2chinese_array(number):
+    # cn2int.array会导入NumPy, 只在运行该项测试时导入.
+    from cn2int import array
+    if array.np is None:
+        return
+    numbers = array.np.full(int(1e5), number)
+    last = default_timer()
+    strings = array.int2chinese_array(numbers)
+    rate = int(1e5 / (default_timer() - last) / 1e3)
+    print("%-19s: %4d k/s" % ("int2chinese_array", rate))
+
+
+def performance_float2chinese_array(number):
+    from cn2int import array
+    if array.np is None:
+        return
+    numbers = array.np.full(int(1e5), number)
+    last = default_timer()
+    strings = array.float2chinese_array(numbers, precision=6)
+    rate = int(1e5 / (default_timer() - last) / 1e3)
+    print("%-19s: %4d k/s" % ("float2chinese_array", rate))
+
+
+def performance_chinese2float_array(number):
+    from cn2int import array
+    if array.np is None:
+        return
+    strings = array.np.full(int(1e5), c2i.float2chinese(number, precision=6))
+    last = default_timer()
+    numbers, valid = array.chinese2float_array(strings)
+    rate = int(1e5 / (default_timer() - last) / 1e3)
+    print("%-19s: %4d k/s" % ("chinese2float_array", rate))
+
+
+def performance_chinese2int_array(number):
+    from cn2int import array
+    if array.np is None:
+        return
+    strings = array.np.full(int(1e5), c2i.int2chinese(number))
+    last = default_timer()
+    numbers, valid = array.chinese2int_array(strings)
+    rate = int(1e5 / (default_timer() - last) / 1e3)
+    print("%-19s: %4d k/s" % ("chinese2int_array", rate))
+
+
+def performance_float2chinese(number):
+    last = default_timer()
+    for i in range(int(1e5)):
+        s = c2i.float2chinese(number, lower=True, precision=6)
+    rate = int(1e5 / (default_timer() - last) / 1e3)
+    print("%-19s: %4d k/s" % ("float2chinese", rate))
+
+
+def performance_float2chinese_many(number):
+    numbers = [number] * int(1e5)
+    last = default_timer()
+    strings = c2i.float2chinese_many(numbers, lower=True, precision=6)
+    rate = int(1e5 / (default_timer() - last) / 1e3)
+    print("%-19s: %4d k/s" % ("float2chinese_many", rate))
+
+
+def performance_chinese2int_many(s):
+    strings = [s] * int(1e5)
+    last = default_timer()
+    numbers = c2i.chinese2int_many(strings)
+    rate = int(1e5 / (default_timer() - last) / 1e3)
+    print("%-19s: %4d k/s" % ("chinese2int_many", rate))
+
+
+def performance_chinese2float_many(s):
+    strings = [s] * int(1e5)
+    last = default_timer()
+    numbers = c2i.chinese2float_many(strings)
+    rate = int(1e5 / (default_timer() - last) / 1e3)
+    print("%-19s: %4d k/s" % ("chinese2float_many", rate))
+
+
+def performance_cache(strings):
+    cache = c2i.Cache(maxsize=1024)
+    strings = strings * int(1e5 / len(strings))
+    last = default_timer()
+    for s in strings:
+        number = cache.chinese2int(s)
+    rate = int(len(strings) / (default_timer() - last) / 1e3)
+    print("%-19s: %4d k/s, %s" % ("Cache.chinese2int", rate, cache.info()))
+
+
+def performance_roman2int(s):
+    last = default_timer()
+    for i in range(int(1e5)):
+        number = c2i.roman2int(s)
+    rate = int(1e5 / (default_timer() - last) / 1e3)
+    print("%-19s: %4d k/s" % ("roman2int", rate))
+
+
+def performance_int2roman(number):
+    last = default_timer()
+    for i in range(int(1e5)):
+        s = c2i.int2roman(number)
+    rate = int(1e5 / (default_timer() - last) / 1e3)
+    print("%-19s: %4d k/s" % ("int2roman", rate))
+
+
+def performance_segment_tables(number):
+    """每种(lower, use_liang)组合的分段表: 生成耗时, 内存占用, int2chinese速度."""
+    for lower in (True, False):
+        for use_liang in (False, True):
+            Table.segments.pop((lower, use_liang), None)
+            last = default_timer()
+            tables = segment_tables(lower, use_liang)
+            cost = (default_timer() - last) * 1e3
+            strings = {id(s): s for table in tables for s in table}
+            size = sum(sys.getsizeof(table) for table in tables)
+            size += sum(sys.getsizeof(s) for s in strings.values())
+
+            last = default_timer()
+            for i in range(int(1e5)):
+                s = c2i.int2chinese(number, lower=lower, use_liang=use_liang)
+            rate = int(1e5 / (default_timer() - last) / 1e3)
+            name = "lower=%d,liang=%d" % (lower, use_liang)
+            print("%-19s: %4d k/s, %4d KB, %3d ms" % (name, rate, size / 1024, cost))
+
+
+def performance_parallel_convert(s):
+    """parallel_convert从1个进程到os.cpu_count()个进程的扩展曲线."""
+    strings = [s] * int(2e5)
+    cpus = os.cpu_count() or 1
+    workers = sorted({min(2 ** i, cpus) for i in range(cpus.bit_length() + 1)})
+    for n in workers:
+        last = default_timer()
+        numbers = c2i.parallel_convert(strings, c2i.chinese2int, workers=n)
+        rate = int(len(strings) / (default_timer() - last) / 1e3)
+        print("%-19s: %4d k/s" % ("parallel(workers=%d)" % n, rate))
 
 
-def performance():
+def performance(parallel=False):
+    """运行各项性能测试. parallel=True时, 也测试parallel_convert的多进程扩展曲线(较慢)."""
     performance_int2chinese(218123456789)
+    performance_int2chinese_many(218123456789)
+    performance_int2chinese_array(218123456789)
+    performance_float2chinese(45678982.765432)
+    performance_float2chinese_many(45678982.765432)
+    performance_float2chinese_array(45678982.765432)
     performance_chinese2int("二千一百八十一亿二千三百四十五万六千七百八十九")
+    performance_chinese2int_many("二千一百八十一亿二千三百四十五万六千七百八十九")
+    performance_chinese2int_array(218123456789)
+    performance_chinese2int_mixed(["二千一百八十一亿二千三百四十五万六千七百八十九",
+                                   "零零零三百六十一", "九二九八七六五四三二一〇",
+                                   "负一千零一十", "一万二", "十五", "三百二十"])
+    performance_cache(["二千一百八十一亿二千三百四十五万六千七百八十九",
+                       "一千零三十", "二十三", "两万"])
     performance_chinese2float("四千五百六十七万八千九百八十二点七六五四三二")
+    performance_chinese2float_many("四千五百六十七万八千九百八十二点七六五四三二")
+    performance_chinese2float_array(45678982.765432)
+    performance_segment_tables(218123456789)
+    performance_int2roman(3888)
+    performance_roman2int("MMMDCCCLXXXVIII")
+    if parallel:
+        performance_parallel_convert("二千一百八十一亿二千三百四十五万六千七百八十九")
 
 
 if __name__ == "__main__":
-    performance()
+    performance(parallel="--parallel" in sys.argv[1:])
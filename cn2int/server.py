@@ -0,0 +1,418 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""本地转换服务, 只使用标准库. 监听TCP端口或Unix socket, 协议是HTTP/1.1.
+
+    python -m cn2int.server --port 8000
+    python -m cn2int.server --unix /tmp/cn2int.sock
+
+    curl -d '["一百二十三", "x"]' http://127.0.0.1:8000/chinese2int
+    curl -d '{"items": [123], "options": {"lower": false}}' http://127.0.0.1:8000/int2chinese
+    curl --unix-socket /tmp/cn2int.sock --data-binary @numbers.txt \\
+        -H "Content-Type: text/plain" http://localhost/chinese2int
+
+请求是POST /<mode>, mode是chinese2int, chinese2float, roman2int, convert2int,
+int2chinese, float2chinese, int2roman之一.
+
+- JSON: Content-Type为application/json, 或请求体以"["、"{"开头. 请求体是列表, 或
+  {"items": 列表, "options": 转换选项}. 响应{"results": [{"value": 结果} |
+  {"error": "异常类型: 信息"}, ...], "errors": 失败数}.
+- 其他请求体每行一项. 响应每行一个JSON对象({"value": ...}或{"error": ...}), 与请求的
+  行一一对应.
+
+并发的小请求被合并成较大的批次: 批处理线程取出第一个请求后, 最多再等待max_delay秒, 合并
+最多max_batch项, 按(mode, options)分组后统一转换, 再把结果分发回各个请求.
+
+压力测试, 输出p50/p99延迟和每秒请求数:
+
+    python -m cn2int.server --bench --spawn --concurrency 16 --batch 8
+"""
+
+import argparse
+import http.client
+import json
+import os
+import queue
+import socket
+import socketserver
+import sys
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from timeit import default_timer
+
+from .cn2int import (Formatter, status_error, try_chinese2int, try_chinese2float,
+                     try_roman2int, try_convert2int, int2roman)
+
+
+__all__ = ["Batcher", "make_server", "serve", "bench"]
+
+
+parsers = {"chinese2int": (try_chinese2int, "Chinese"),
+           "chinese2float": (try_chinese2float, "Chinese"),
+           "roman2int": (try_roman2int, "Roman"),
+           "convert2int": (try_convert2int, "Arabic, Roman or Chinese")}
+formatters = ["int2chinese", "float2chinese", "int2roman"]
+formatter_options = ["lower", "enumeration", "use_liang", "use_simple_ten",
+                     "use_simple_zero_tail", "use_upper_zero", "width", "precision"]
+
+
+def error_result(error):
+    message = error.args[0] if error.args else ""
+    return {"error": "%s: %s" % (type(error).__name__, message)}
+
+
+def convert_items(mode, options, items):
+    """逐项转换, 返回[{"value": ...} | {"error": ...}]."""
+    if mode in parsers:
+        parse, numerals = parsers[mode]
+        results = []
+        for s in items:
+            if not isinstance(s, str):
+                results.append(error_result(TypeError("expected a string")))
+                continue
+            number, status = parse(s)
+            if status:
+                results.append(error_result(status_error(status, numerals)))
+            else:
+                results.append({"value": number})
+        return results
+
+    if mode == "int2roman":
+        format_number = int2roman
+    elif mode == "int2chinese":
+        format_number = Formatter(**options).format
+    else:
+        format_number = Formatter(**options).format_float
+    number_types = (int, float) if mode == "float2chinese" else int
+    results = []
+    for number in items:
+        if not isinstance(number, number_types) or isinstance(number, bool):
+            results.append(error_result(TypeError("expected a number")))
+            continue
+        try:
+            s = format_number(number)
+        except (ValueError, OverflowError) as error:
+            # NaN
+            results.append(error_result(error))
+            continue
+        if s is None:
+            results.append(error_result(OverflowError("the value is out of the supported range")))
+        else:
+            results.append({"value": s})
+    return results
+
+
+class Request:
+    """一个等待批处理的请求."""
+
+    def __init__(self, mode, options, items):
+        self.mode = mode
+        self.options = options
+        self.items = items
+        self.results = None
+        self.done = threading.Event()
+
+
+class Batcher:
+    """把并发的小请求合并成批次, 在一个线程中统一转换.
+
+    参数:
+        max_batch (int): 每批最多的项数. 默认4096.
+        max_delay (float): 取出第一个请求后, 等待更多请求的最长秒数. 为0时只合并
+            已经在排队的请求, 即上一批转换期间到达的请求. 默认0.
+    """
+
+    def __init__(self, max_batch=4096, max_delay=0.0):
+        self.max_batch = max_batch
+        self.max_delay = max_delay
+        self.queue = queue.Queue()
+        self.batches = 0
+        self.requests = 0
+        self.thread = threading.Thread(target=self.run, daemon=True)
+        self.thread.start()
+
+    def submit(self, mode, options, items):
+        """提交一个请求, 阻塞到转换完成. 返回[{"value": ...} | {"error": ...}]."""
+        if not items:
+            return []
+        request = Request(mode, options, items)
+        self.queue.put(request)
+        request.done.wait()
+        return request.results
+
+    def collect(self):
+        """取出一批请求."""
+        batch = [self.queue.get()]
+        size = len(batch[0].items)
+        deadline = default_timer() + self.max_delay
+        while size < self.max_batch:
+            timeout = deadline - default_timer()
+            try:
+                request = self.queue.get(timeout=timeout) if timeout > 0 \
+                    else self.queue.get_nowait()
+            except queue.Empty:
+                break
+            batch.append(request)
+            size += len(request.items)
+        return batch
+
+    def run(self):
+        while True:
+            batch = self.collect()
+            groups = {}
+            for request in batch:
+                key = (request.mode, tuple(sorted(request.options.items())))
+                groups.setdefault(key, []).append(request)
+            for (mode, options), requests in groups.items():
+                items = [item for request in requests for item in request.items]
+                try:
+                    results = convert_items(mode, dict(options), items)
+                except Exception as error:
+                    results = [error_result(error)] * len(items)
+                start = 0
+                for request in requests:
+                    request.results = results[start:start + len(request.items)]
+                    start += len(request.items)
+                    request.done.set()
+            self.batches += 1
+            self.requests += len(batch)
+
+
+class Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    server_version = "cn2int"
+
+    def send_body(self, code, body, content_type="application/json"):
+        body = body.encode("utf-8")
+        self.send_response(code)
+        self.send_header("Content-Type", content_type + "; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def send_error_body(self, code, message):
+        self.send_body(code, json.dumps({"error": message}, ensure_ascii=False))
+
+    def do_GET(self):
+        self.send_body(200, json.dumps({"modes": sorted(parsers) + formatters}))
+
+    def do_POST(self):
+        mode = self.path.strip("/").split("?")[0]
+        length = int(self.headers.get("Content-Length") or 0)
+        body = self.rfile.read(length).decode("utf-8", "replace")
+        if mode not in parsers and mode not in formatters:
+            return self.send_error_body(404, "unknown mode %r" % mode)
+
+        # Content-Type含json, 或请求体以"["、"{"开头时按JSON解析. curl -d默认发送
+        # application/x-www-form-urlencoded, 因此不能只看Content-Type.
+        content_type = self.headers.get("Content-Type", "")
+        framed = "json" not in content_type and body.lstrip()[:1] not in ("[", "{")
+        options = {}
+        if framed:
+            items = body.split("\n")
+            if items and not items[-1]:
+                items.pop()
+            items = [item.rstrip("\r") for item in items]
+            if mode not in parsers:
+                # 每行一个JSON数字
+                try:
+                    items = [json.loads(item) for item in items]
+                except ValueError:
+                    return self.send_error_body(400, "expected one number per line")
+        else:
+            try:
+                data = json.loads(body)
+            except ValueError:
+                return self.send_error_body(400, "invalid JSON")
+            if isinstance(data, dict):
+                items = data.get("items", [])
+                options = data.get("options") or {}
+            else:
+                items = data
+            if not isinstance(items, list) or not isinstance(options, dict):
+                return self.send_error_body(400, "expected a list of items")
+            unknown = set(options) - set(formatter_options)
+            if (unknown or (options and mode not in ("int2chinese", "float2chinese"))
+                    or not all(isinstance(v, int) for v in options.values())):
+                return self.send_error_body(400, "unsupported options %s" % sorted(options))
+
+        results = self.server.batcher.submit(mode, options, items)
+        if framed:
+            lines = [json.dumps(result, ensure_ascii=False) + "\n" for result in results]
+            self.send_body(200, "".join(lines), "application/x-ndjson")
+        else:
+            errors = sum(1 for result in results if "error" in result)
+            self.send_body(200, json.dumps({"results": results, "errors": errors},
+                                           ensure_ascii=False))
+
+    def log_message(self, format, *args):
+        if self.server.verbose:
+            super().log_message(format, *args)
+
+    def address_string(self):
+        return self.client_address[0] if self.client_address else "unix"
+
+
+class TCPHandler(Handler):
+    # 响应头和响应体分两次写出, 不关闭Nagle算法时会与客户端的延迟确认相互等待.
+    disable_nagle_algorithm = True
+
+
+class UnixHTTPServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    daemon_threads = True
+
+
+def make_server(host="127.0.0.1", port=8000, unix=None, max_batch=4096,
+                max_delay=0.0, verbose=False):
+    """创建服务. unix不为None时监听Unix socket, 否则监听(host, port).
+
+    返回:
+        socketserver.BaseServer: 调用serve_forever()开始服务, shutdown()停止.
+    """
+    if unix is not None:
+        if os.path.exists(unix):
+            os.unlink(unix)
+        server = UnixHTTPServer(unix, Handler)
+    else:
+        server = ThreadingHTTPServer((host, port), TCPHandler)
+    server.batcher = Batcher(max_batch, max_delay)
+    server.verbose = verbose
+    return server
+
+
+def serve(host="127.0.0.1", port=8000, unix=None, **options):
+    server = make_server(host, port, unix, **options)
+    address = unix if unix is not None else "http://%s:%d" % server.server_address[:2]
+    sys.stderr.write("cn2int.server: listening on %s\n" % address)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        if unix is not None and os.path.exists(unix):
+            os.unlink(unix)
+
+
+class UnixHTTPConnection(http.client.HTTPConnection):
+
+    def __init__(self, path, timeout=None):
+        super().__init__("localhost", timeout=timeout)
+        self.path = path
+
+    def connect(self):
+        self.sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        self.sock.connect(self.path)
+
+
+def percentile(values, p):
+    values = sorted(values)
+    return values[min(len(values) - 1, int(len(values) * p))]
+
+
+def bench(host="127.0.0.1", port=8000, unix=None, mode="chinese2int",
+          concurrency=16, requests=2000, batch=8, stream=sys.stdout):
+    """压力测试: concurrency个线程各用一个长连接, 共发送requests个请求, 每个请求batch项.
+
+    返回:
+        dict: {"requests", "seconds", "rps", "p50", "p99"}, 延迟的单位是毫秒.
+    """
+    if mode in parsers:
+        items = ["二千一百八十一亿二千三百四十五万六千七百八十九"] * batch
+    else:
+        items = [218123456789] * batch
+    body = json.dumps(items).encode("utf-8")
+    headers = {"Content-Type": "application/json"}
+    latencies = []
+    lock = threading.Lock()
+    counts = [requests // concurrency + (i < requests % concurrency)
+              for i in range(concurrency)]
+
+    def worker(count):
+        if unix is not None:
+            connection = UnixHTTPConnection(unix)
+        else:
+            connection = http.client.HTTPConnection(host, port)
+        local = []
+        try:
+            for _ in range(count):
+                last = default_timer()
+                connection.request("POST", "/" + mode, body, headers)
+                response = connection.getresponse()
+                response.read()
+                if response.status != 200:
+                    raise RuntimeError("HTTP %d" % response.status)
+                local.append(default_timer() - last)
+        finally:
+            connection.close()
+        with lock:
+            latencies.extend(local)
+
+    threads = [threading.Thread(target=worker, args=(count,)) for count in counts]
+    last = default_timer()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    cost = default_timer() - last
+
+    result = {"requests": len(latencies), "seconds": cost,
+              "rps": len(latencies) / cost if cost > 0 else 0,
+              "p50": percentile(latencies, 0.50) * 1e3 if latencies else 0,
+              "p99": percentile(latencies, 0.99) * 1e3 if latencies else 0}
+    stream.write("%s: %d requests x %d items, concurrency %d\n"
+                 % (mode, result["requests"], batch, concurrency))
+    stream.write("%.1f requests/s, %.1f items/s, p50 %.2f ms, p99 %.2f ms\n"
+                 % (result["rps"], result["rps"] * batch, result["p50"], result["p99"]))
+    return result
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m cn2int.server",
+                                     description="本地转换服务, 或对服务做压力测试.")
+    parser.add_argument("--host", default="127.0.0.1", help="默认127.0.0.1")
+    parser.add_argument("--port", type=int, default=8000, help="默认8000")
+    parser.add_argument("--unix", help="监听/连接Unix socket, 代替--host, --port")
+    parser.add_argument("--max-batch", type=int, default=4096, help="每批最多的项数. 默认4096")
+    parser.add_argument("--max-delay", type=float, default=0.0,
+                        help="等待合并请求的最长秒数. 默认0, 只合并已经在排队的请求")
+    parser.add_argument("--verbose", action="store_true", help="输出访问日志")
+
+    group = parser.add_argument_group("压力测试")
+    group.add_argument("--bench", action="store_true", help="运行压力测试, 而不是启动服务")
+    group.add_argument("--spawn", action="store_true", help="在当前进程中启动服务后再测试")
+    group.add_argument("--mode", default="chinese2int", choices=sorted(parsers) + formatters)
+    group.add_argument("--concurrency", type=int, default=16, help="并发连接数. 默认16")
+    group.add_argument("--requests", type=int, default=2000, help="请求总数. 默认2000")
+    group.add_argument("--batch", type=int, default=8, help="每个请求的项数. 默认8")
+    args = parser.parse_args(argv)
+
+    options = {"max_batch": args.max_batch, "max_delay": args.max_delay,
+               "verbose": args.verbose}
+    if not args.bench:
+        serve(args.host, args.port, args.unix, **options)
+        return 0
+
+    server = None
+    host, port = args.host, args.port
+    if args.spawn:
+        server = make_server(args.host, 0 if args.unix is None else args.port,
+                             args.unix, **options)
+        host, port = server.server_address[:2] if args.unix is None else (host, port)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+    try:
+        bench(host, port, args.unix, args.mode, args.concurrency, args.requests, args.batch)
+    finally:
+        if server is not None:
+            server.shutdown()
+            server.server_close()
+            if args.unix is not None and os.path.exists(args.unix):
+                os.unlink(args.unix)
+            sys.stdout.write("batches: %d, requests per batch: %.1f\n"
+                             % (server.batcher.batches,
+                                server.batcher.requests / max(server.batcher.batches, 1)))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
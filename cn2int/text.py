@@ -0,0 +1,286 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""在任意文本中查找中文数字、罗马数字、阿拉伯数字, 并同时完成转换.
+
+文本只扫描一遍: 一个正则表达式找出最长的候选片段, 候选片段直接交给try_系列函数转换,
+转换失败的片段被忽略. 文件对象按块读取, 每块只处理到最后一个"安全字符"为止, 剩余部分
+留到下一块, 因此跨越块边界的数字不会被截断.
+"""
+
+import codecs
+import re
+
+from .cn2int import Table, try_roman2int, try_chinese2int, try_chinese2float
+
+
+__all__ = ["find_numerals", "normalize_text"]
+
+
+def character_class(characters):
+    return "[" + "".join(re.escape(c) for c in sorted(characters)) + "]"
+
+
+# 数字(0-9, 含全角和"两"), 数字和权值, 正负号, "点", 小数部分之后的"万亿".
+digits = "".join(c for c, p in Table.chinese2int.items() if 0 <= p <= 9)
+numerals = "".join(c for c, p in Table.chinese2int.items() if p >= 0)
+signs = {"正": 1, "负": -1, "負": -1, "+": 1, "-": -1}
+points = "点點."
+
+re_numeral = re.compile(
+    "(?P<number>(?:[正负負]|(?<![0-9A-Za-z])[+-])?" + character_class(numerals) + "+"
+    "(?:" + character_class(points) + character_class(digits) + "+"
+    "[万亿萬億]?)?)"
+    "|(?P<roman>(?<![A-Za-z])[IVXLCDM]+(?![A-Za-z]))")
+
+# 不可能出现在候选片段中, 也不影响前后断言的字符之外的字符. 按块读取时, 只在安全字符处
+# 切分文本.
+unsafe = frozenset(numerals) | frozenset(signs) | frozenset(points) | \
+    frozenset("ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz")
+
+
+def arabic_int(s):
+    """十进制数字串 => 整数. 超过sys.get_int_max_str_digits()位时int()抛出ValueError,
+    此时返回None, 该片段按转换失败处理."""
+    try:
+        return int(s)
+    except ValueError:
+        return None
+
+
+def convert_number(s):
+    """候选片段 => (value, kind, length). 转换失败时返回None.
+
+    全部是十进制数字(可以有"."和正负号)的片段是阿拉伯数字, 其余是中文数字. 小数部分
+    转换失败时, 退回到只转换"点"之前的整数部分, length是实际转换的长度.
+    """
+    sign = 1
+    start = 0
+    if s[0] in signs:
+        sign = signs[s[0]]
+        start = 1
+    body = s[start:]
+
+    a, dot, b = body.partition(".")
+    if a.isdecimal() and (not dot or b.isdecimal()):
+        if dot:
+            return sign * float(body), "arabic", len(s)
+        number = arabic_int(body)
+        if number is None:
+            return None
+        return sign * number, "arabic", len(s)
+
+    if dot or "点" in body or "點" in body:
+        number, status = try_chinese2float(body)
+        if not status:
+            return sign * number, "chinese", len(s)
+        # 只转换"点"之前的部分, e.g. "三点钟"中的"三点"不会成为候选, 但"三.5"会.
+        body = re.split("[点點.]", body, 1)[0]
+
+    if body.isdecimal():
+        number = arabic_int(body)
+        if number is None:
+            return None
+        return sign * number, "arabic", start + len(body)
+    number, status = try_chinese2int(body)
+    if status:
+        return None
+    return sign * number, "chinese", start + len(body)
+
+
+def scan(text, pos=0, endpos=None, chinese=True, roman=True, arabic=True):
+    """在text[pos:endpos]中查找数字, 生成(start, end, value, kind). 位置相对于text."""
+    if endpos is None:
+        endpos = len(text)
+    for m in re_numeral.finditer(text, pos, endpos):
+        if m.lastgroup == "roman":
+            if roman:
+                number, status = try_roman2int(m.group())
+                if not status:
+                    yield m.start(), m.end(), number, "roman"
+            continue
+        result = convert_number(m.group())
+        if result is None:
+            continue
+        value, kind, length = result
+        if (chinese if kind == "chinese" else arabic):
+            yield m.start(), m.start() + length, value, kind
+
+
+def read_chunks(stream, chunksize):
+    """按块读取文件对象. 二进制文件按UTF-8增量解码."""
+    decoder = None
+    while True:
+        chunk = stream.read(chunksize)
+        if not chunk:
+            return
+        if isinstance(chunk, bytes):
+            if decoder is None:
+                decoder = codecs.getincrementaldecoder("utf-8")()
+            # 块末尾不完整的UTF-8字符留在解码器中, 此时可能解码出空字符串.
+            chunk = decoder.decode(chunk)
+            if not chunk:
+                continue
+        yield chunk
+
+
+def safe_position(buffer, pos):
+    """buffer[pos:]中最后一个安全字符的位置. 没有时返回-1."""
+    i = len(buffer)
+    while i > pos:
+        i -= 1
+        if buffer[i] not in unsafe:
+            return i
+    return -1
+
+
+def stream_buffers(stream, chunksize):
+    """按块读取文件对象, 生成(buffer, offset, pos, endpos).
+
+    只需处理buffer[pos:endpos], 依次生成的各段恰好拼成整个文本. buffer[endpos:]会拼接到
+    下一块的开头. offset是buffer[0]在整个文本中的位置.
+    """
+    buffer = ""
+    offset = 0
+    pos = 0
+    for chunk in read_chunks(stream, chunksize):
+        buffer += chunk
+        cut = safe_position(buffer, pos)
+        if cut < 0:
+            # 整块都可能属于同一个数字, 继续读取.
+            continue
+        yield buffer, offset, pos, cut + 1
+        # 保留安全字符本身, 作为下一块的向后断言的上下文, 但不再处理它.
+        offset += cut
+        buffer = buffer[cut:]
+        pos = 1
+    if len(buffer) > pos:
+        yield buffer, offset, pos, len(buffer)
+
+
+def find_numerals(text_or_stream, chinese=True, roman=True, arabic=True,
+                  chunksize=65536):
+    """在文本中查找数字并转换, 一遍扫描完成.
+
+    候选片段是最长的连续数字字符(可带正负号和小数部分), 或被非英文字母包围的大写罗马
+    数字. 转换失败的候选片段被忽略.
+
+    参数:
+        text_or_stream (string | file): 文本, 或可以read()的文件对象(文本或二进制).
+        chinese, roman, arabic (bool): 是否查找中文数字、罗马数字、阿拉伯数字.
+            默认都为True.
+        chunksize (int): 从文件对象中每次读取的长度. 默认65536.
+
+    返回:
+        generator: (start, end, value, kind). start, end是在整个文本中的位置; value
+            是int或float; kind是"chinese", "roman", "arabic"之一.
+    """
+    options = chinese, roman, arabic
+    if isinstance(text_or_stream, str):
+        yield from scan(text_or_stream, 0, None, *options)
+        return
+    for buffer, offset, pos, endpos in stream_buffers(text_or_stream, chunksize):
+        for start, end, value, kind in scan(buffer, pos, endpos, *options):
+            yield start + offset, end + offset, value, kind
+
+
+# 枚举表示逐字符转换成阿拉伯数字, 保留开头的"零".
+enumeration_table = str.maketrans({c: str(p) for c, p in Table.chinese2int.items()
+                                   if 0 <= p <= 9})
+enumeration_table.update(str.maketrans({"负": "-", "負": "-", "正": ""}))
+
+
+def numeral_form(s):
+    """中文数字片段的表示方式: "decimal", "traditional", "enumeration"."""
+    if "点" in s or "點" in s:
+        return "decimal"
+    table = Table.chinese2int
+    for c in s:
+        if table.get(c, 0) >= 10:
+            return "traditional"
+    return "enumeration"
+
+
+def format_decimal(s):
+    """中文小数片段 => 阿拉伯数字, 不使用科学计数法, 去掉小数部分末尾的0.
+
+    由整数部分的值和小数部分的各个数字直接拼成, 不经过浮点数, 因此没有二进制舍入误差.
+    s必须是try_chinese2float可以转换的片段.
+    """
+    sign = ""
+    if s[0] in signs:
+        sign = "-" if signs[s[0]] < 0 else ""
+        s = s[1:]
+    # "五点三万", "五点八亿"
+    exponent = 0
+    if s[-1] in "万萬":
+        exponent, s = 4, s[:-1]
+    elif s[-1] in "亿億":
+        exponent, s = 8, s[:-1]
+    a, b = re.split("[点點]", s, 1)
+    fraction = b.translate(enumeration_table)
+    n = int(str(try_chinese2int(a)[0]) + fraction)
+    exponent -= len(fraction)
+    if exponent >= 0:
+        result = str(n * 10 ** exponent)
+    else:
+        result = str(n).rjust(1 - exponent, "0")
+        result = (result[:exponent] + "." + result[exponent:]).rstrip("0").rstrip(".")
+    return result if result == "0" else sign + result
+
+
+def normalize_pieces(text, pos, endpos, forms, roman):
+    """生成text[pos:endpos]改写后的各个片段."""
+    last = pos
+    for start, end, value, kind in scan(text, pos, endpos, True, roman, False):
+        s = text[start:end]
+        if kind == "roman":
+            replacement = str(value)
+        else:
+            form = numeral_form(s)
+            if form not in forms:
+                continue
+            if form == "decimal":
+                replacement = format_decimal(s)
+            elif form == "enumeration":
+                replacement = s.translate(enumeration_table)
+            else:
+                replacement = str(value)
+        yield text[last:start]
+        yield replacement
+        last = end
+    yield text[last:endpos]
+
+
+def normalize_text(text_or_stream, traditional=True, enumeration=True,
+                   decimal=True, roman=False, chunksize=65536):
+    """把文本中的数字改写成阿拉伯数字. "第二十三章共一万二千字" => "第23章共12000字".
+
+    一遍扫描, 查找规则同find_numerals. 改写后的片段收集到列表中, 最后一次join.
+
+    参数:
+        text_or_stream (string | file): 文本, 或可以read()的文件对象(文本或二进制).
+        traditional (bool): 是否改写传统表示, "一万二千" => "12000". 默认True.
+        enumeration (bool): 是否改写枚举表示. 逐字符改写, 保留开头的零,
+            "零零七" => "007". 默认True.
+        decimal (bool): 是否改写带"点"的浮点数, "三点一四" => "3.14". 默认True.
+        roman (bool): 是否改写罗马数字. 默认False.
+        chunksize (int): 从文件对象中每次读取的长度. 默认65536.
+
+    返回:
+        string | generator: 输入是文本时返回改写后的文本; 输入是文件对象时, 返回按块
+            生成改写后文本的生成器, 各块依次拼接即是完整的文本.
+    """
+    forms = set()
+    if traditional:
+        forms.add("traditional")
+    if enumeration:
+        forms.add("enumeration")
+    if decimal:
+        forms.add("decimal")
+
+    if isinstance(text_or_stream, str):
+        return "".join(normalize_pieces(text_or_stream, 0, len(text_or_stream),
+                                        forms, roman))
+    return ("".join(normalize_pieces(buffer, pos, endpos, forms, roman))
+            for buffer, offset, pos, endpos in stream_buffers(text_or_stream, chunksize))
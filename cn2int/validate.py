@@ -0,0 +1,116 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""只校验、不转换的判断函数, 以及批量过滤.
+
+与转换函数使用同一套语法: is_chinese_numeral(s)为True, 当且仅当try_chinese2int(s)转换
+成功; is_roman_numeral(s)同理对应try_roman2int. 因此"三百二二"这样字符合法、格式非法的
+字符串同样被拒绝. 不抛出异常, 也不返回转换结果.
+"""
+
+import re
+
+from .cn2int import (Table, Status, roman_tables, chinese2int_scan,
+                     chinese2float_signed)
+
+
+__all__ = ["is_chinese_numeral", "is_roman_numeral",
+           "filter_chinese_numerals", "filter_roman_numerals"]
+
+
+# 字符层面的检查由正则表达式完成, 只有字符合法的字符串才会进入语法扫描.
+re_chinese_integer = re.compile(
+    "[正负負]?[%s]+" % "".join(c for c, p in Table.chinese2int.items() if p >= 0))
+re_chinese_float = re.compile(
+    "[正负負]?[%s]+" % "".join(c for c, p in Table.chinese2int.items() if p >= 0 or p == -100))
+
+# 批量过滤时, 超过该数目且安装了NumPy, 使用cn2int.array中的向量化状态机.
+ARRAY_THRESHOLD = 1024
+
+
+def is_chinese_numeral(s, decimal=False):
+    """s是否是可以转换的中文数字. 语法同chinese2int, decimal=True时同chinese2float.
+
+    参数:
+        s: 任意对象. 不是字符串时返回False.
+        decimal (bool): 是否按浮点数的语法校验. 默认False.
+
+    返回:
+        bool: try_chinese2int(s)(或try_chinese2float(s))转换成功时为True.
+    """
+    if type(s) is not str:
+        return False
+    if decimal:
+        if re_chinese_float.fullmatch(s) is None:
+            return False
+        return not chinese2float_signed(s, None, Table.chinese2int, True, True)[1]
+    if re_chinese_integer.fullmatch(s) is None:
+        return False
+    start = 1 if Table.chinese2int[s[0]] < 0 else 0
+    return chinese2int_scan(s, start, len(s))[1] == Status.OK
+
+
+def is_roman_numeral(s):
+    """s是否是可以转换的罗马数字, 忽略大小写. 语法同roman2int.
+
+    参数:
+        s: 任意对象. 不是字符串时返回False.
+
+    返回:
+        bool: try_roman2int(s)转换成功时为True.
+    """
+    if type(s) is not str:
+        return False
+    reverse = Table.romans_reverse
+    if reverse is None:
+        reverse = roman_tables()[1]
+    return s in reverse or s.upper() in reverse
+
+
+def filter_chinese_numerals(strings, decimal=False, lazy=False):
+    """批量过滤, 只保留可以转换的中文数字, 顺序不变.
+
+    先由正则表达式拒绝字符非法的项. 不返回生成器、剩下的项数超过ARRAY_THRESHOLD、且安装
+    了NumPy时, 使用chinese2int_array_status(chinese2float_array_status)一次校验整批的
+    语法; 其中超过cn2int.array.MAX_WIDTH个字符的项仍逐个校验, 不会按它的长度分配整批
+    的内存.
+
+    参数:
+        strings (iterable): 待过滤的序列.
+        decimal (bool): 是否按浮点数的语法校验. 默认False.
+        lazy (bool): 是否返回生成器. 默认False.
+
+    返回:
+        list | generator: 可以转换的项.
+    """
+    if lazy:
+        return (s for s in strings if is_chinese_numeral(s, decimal))
+    # 先由正则表达式拒绝字符非法的项, 剩下的再校验语法. 含"\0"的项也在这里被拒绝,
+    # NumPy字符串数组会去掉末尾的"\0".
+    fullmatch = (re_chinese_float if decimal else re_chinese_integer).fullmatch
+    strings = [s for s in strings if type(s) is str and fullmatch(s)]
+    if len(strings) < ARRAY_THRESHOLD:
+        return [s for s in strings if is_chinese_numeral(s, decimal)]
+    # cn2int.array会导入NumPy, 只在批量足够大时导入.
+    from . import array
+    if array.np is None:
+        return [s for s in strings if is_chinese_numeral(s, decimal)]
+    if decimal:
+        status = array.chinese2float_array_status(strings)[1]
+    else:
+        status = array.chinese2int_array_status(strings)[1]
+    return [s for s, failed in zip(strings, status.tolist()) if not failed]
+
+
+def filter_roman_numerals(strings, lazy=False):
+    """批量过滤, 只保留可以转换的罗马数字, 顺序不变.
+
+    参数:
+        strings (iterable): 待过滤的序列.
+        lazy (bool): 是否返回生成器. 默认False.
+
+    返回:
+        list | generator: 可以转换的项.
+    """
+    results = filter(is_roman_numeral, strings)
+    return results if lazy else list(results)
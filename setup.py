@@ -25,6 +25,7 @@ def setup_package():
         packages=find_packages(),
         python_requires='>=3',
         classifiers=["Programming Language :: Python :: 3"],
+        entry_points={"console_scripts": ["cn2int = cn2int.__main__:main"]},
     )
 
 
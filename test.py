@@ -3,10 +3,24 @@
 
 """Cn2Int测试"""
 
-from random import sample, randint
+from random import sample, randint, choice
+import asyncio
+import http.client
+import io
+import json
 import math
+import os
+import socket
+import tempfile
+import threading
 
 import cn2int as c2i
+import cn2int.array
+import cn2int.arrow
+import cn2int.accessor
+import cn2int.aio
+import cn2int.server
+from cn2int.__main__ import main as cli_main
 
 
 def test_roman2int():
@@ -29,6 +43,15 @@ def test_roman2int():
             raise Exception("s=%s, n=%d" % (s, n))
         except:
             pass
+    print(">>> OK <<<")
+
+    print("3. 批量转换.")
+    numbers = list(range(-1, 4001))
+    romans = c2i.int2roman_many(numbers)
+    assert romans == [c2i.int2roman(i) for i in numbers]
+    assert romans[0] is None and romans[1] is None and romans[-1] is None
+    assert c2i.roman2int_many(romans[2:-2]) == numbers[2:-2]
+    assert c2i.roman2int_many([s.lower() for s in romans[2:-2]]) == numbers[2:-2]
     print(">>> OK <<<\n")
 
 
@@ -234,6 +257,74 @@ def test_chinese2int():
             except (OverflowError, ValueError):
                 n = None
             assert number == n, "%s => %s | %s" % (s, str(n), str(number))
+
+    print("%d. 只接受一种表示的chinese2int_enumeration, chinese2int_traditional" % (len(dataset) + 1))
+    from cn2int.cn2int import chinese2int_enumeration, chinese2int_traditional
+    assert chinese2int_enumeration("零一二三") == 123
+    assert chinese2int_traditional("一百二十三") == 123
+    for convert, s, error in [(chinese2int_enumeration, "一百二十三", ValueError),
+                              (chinese2int_enumeration, "一九二九八七六五四三二一〇", OverflowError),
+                              (chinese2int_traditional, "一二三", ValueError),
+                              (chinese2int_traditional, "一百x", KeyError)]:
+        try:
+            convert(s)
+        except error:
+            pass
+        else:
+            assert False, s
+    print(">>> OK <<<\n")
+
+
+def test_int2chinese():
+    print("=== test_int2chinese ===")
+    dataset = {
+        "默认": ({}, {
+            0: "零",
+            10: "一十",
+            20002: "二万零二",
+            100000007: "一亿零七",
+            100070000: "一亿零七万",
+            218123456789: "二千一百八十一亿二千三百四十五万六千七百八十九",
+            -1010: "负一千零一十",
+            10**12: None,
+        }),
+        "大写, 两, 省略末尾单位": ({"lower": False, "use_liang": True, "use_simple_zero_tail": True}, {
+            22000: "两萬贰",
+            20000: "两萬",
+            2200: "两仟贰",
+            1020: "壹仟零贰拾",
+        }),
+        "省略一十": ({"use_simple_ten": True}, {
+            0: "零",
+            15: "十五",
+            150000: "十五万",
+        }),
+        "枚举表示, 宽度": ({"enumeration": True, "width": 4}, {
+            0: "〇〇〇〇",
+            -305: "负〇三〇五",
+            12345: "一二三四五",
+            True: "〇〇〇一",
+        }),
+        "枚举表示, 大写": ({"enumeration": True, "lower": False}, {
+            1020: "壹零贰零",
+            -7: "負柒",
+            10**12: None,
+        }),
+    }
+
+    for i, (info, (option, cases)) in enumerate(dataset.items()):
+        print("%d. %s" % (i + 1, info))
+        for number, s in cases.items():
+            r = c2i.int2chinese(number, **option)
+            assert s == r, "%s => %s | %s" % (number, r, s)
+
+    print("%d. 往返转换" % (len(dataset) + 1))
+    numbers = [randint(-10**12 + 1, 10**12 - 1) for i in range(2000)] + list(range(-100, 100000, 7))
+    options = [{}, {"lower": False, "use_liang": True}, {"use_simple_ten": True}, {"enumeration": True}]
+    for option in options:
+        for number in numbers:
+            s = c2i.int2chinese(number, **option)
+            assert c2i.chinese2int(s) == number, "%s => %s" % (number, s)
     print(">>> OK <<<\n")
 
 
@@ -300,8 +391,885 @@ def test_convert2int():
     print(">>> OK <<<\n")
 
 
+def test_many():
+    print("=== test_many ===")
+
+    numbers = [randint(-10**12 + 1, 10**12 - 1) for i in range(1000)] + [0, 10**12]
+    floats = [n / 1000 for n in numbers]
+    options = [
+        {},
+        {"lower": False, "use_liang": True, "use_simple_zero_tail": True},
+        {"use_simple_ten": True},
+        {"enumeration": True, "width": 13},
+        {"enumeration": True, "use_upper_zero": True},
+    ]
+
+    print("1. int2chinese_many, chinese2int_many")
+    for option in options:
+        strings = c2i.int2chinese_many(numbers, **option)
+        assert strings == [c2i.int2chinese(n, **option) for n in numbers], option
+    strings = c2i.int2chinese_many(numbers[:-1])
+    assert c2i.chinese2int_many(strings) == numbers[:-1]
+
+    print("2. float2chinese_many, chinese2float_many")
+    strings = c2i.float2chinese_many(floats, lower=False, precision=3)
+    assert strings == [c2i.float2chinese(n, lower=False, precision=3) for n in floats]
+    assert c2i.chinese2float_many(strings[:-1]) == [c2i.chinese2float(s) for s in strings[:-1]]
+
+    print("3. lazy")
+    results = c2i.chinese2int_many(iter(["一", "二", "三"]), lazy=True)
+    assert not isinstance(results, list)
+    assert list(results) == [1, 2, 3]
+
+    print("4. errors")
+    for many, strings, coerced in [
+        (c2i.chinese2int_many, ["负一", "x", "十一十", "两万", ""], [-1, None, None, 20000, None]),
+        (c2i.chinese2float_many, ["三点五", "点", "负零点五"], [3.5, None, -0.5]),
+        (c2i.roman2int_many, ["XVI", "xvi", "ABC", "IIII"], [16, 16, None, None]),
+    ]:
+        valid = [n for n in coerced if n is not None]
+        assert many(strings, errors="coerce") == coerced, many
+        assert many(strings, errors="ignore") == valid, many
+        assert list(many(strings, errors="coerce", lazy=True)) == coerced, many
+        assert list(many(strings, errors="ignore", lazy=True)) == valid, many
+        for errors in ("raise", "skip"):
+            try:
+                many(strings, errors=errors)
+                assert False, many
+            except (KeyError, ValueError):
+                pass
+    print(">>> OK <<<\n")
+
+
+def test_try():
+    print("=== test_try ===")
+    OK = c2i.Status.OK
+    CHARACTER = c2i.Status.INVALID_CHARACTER
+    GRAMMAR = c2i.Status.INVALID_GRAMMAR
+    OVERFLOW = c2i.Status.OVERFLOW
+    dataset = {
+        c2i.try_chinese2int: {
+            "一千零一十": (1010, OK),
+            "负一二三": (-123, OK),
+            "一千二百三四": (None, GRAMMAR),
+            "三万亿": (None, OVERFLOW),
+            "一九二九八七六五四三二一〇": (None, OVERFLOW),
+            "一千x": (None, CHARACTER),
+            "": (None, GRAMMAR),
+            "百": (None, GRAMMAR),
+            "负": (None, GRAMMAR),
+            "负负一": (None, GRAMMAR),
+            "负百": (None, GRAMMAR),
+            "一负": (None, GRAMMAR),
+        },
+        c2i.try_chinese2float: {
+            "负零点九九九九": (-0.9999, OK),
+            "三点六万": (36000, OK),
+            "点九八七六": (None, GRAMMAR),
+            "三点x": (None, CHARACTER),
+            "负负三点一": (None, GRAMMAR),
+            "三点一点四": (None, GRAMMAR),
+        },
+        c2i.try_roman2int: {
+            "xvi": (16, OK),
+            "IIII": (None, GRAMMAR),
+            "XA": (None, CHARACTER),
+            "": (None, GRAMMAR),
+        },
+        c2i.try_convert2int: {
+            "+123": (123, OK),
+            "12万": (None, GRAMMAR),
+            "XI": (11, OK),
+            "正九十九": (99, OK),
+            "9" * 5000: (None, OVERFLOW),
+        },
+    }
+
+    for i, (func, cases) in enumerate(dataset.items()):
+        print("%d. %s" % (i + 1, func.__name__))
+        for s, result in cases.items():
+            r = func(s)
+            assert r == result, "%s => %s | %s" % (s, str(r), str(result))
+
+    print("%d. 异常类型" % (len(dataset) + 1))
+    for s, error in [("一千x", KeyError), ("一千二百三四", ValueError), ("三万亿", OverflowError)]:
+        try:
+            c2i.chinese2int(s)
+            raise Exception(s)
+        except error:
+            pass
+
+    print("%d. errors" % (len(dataset) + 2))
+    strings = ["一", "x", "二", "一二百"]
+    assert c2i.chinese2int_many(strings, errors="coerce") == [1, None, 2, None]
+    assert c2i.chinese2int_many(strings, errors="coerce", default=-1) == [1, -1, 2, -1]
+    assert c2i.chinese2int_many(strings, errors="ignore") == [1, 2]
+    assert c2i.roman2int_many(["I", "IIII"], errors="ignore") == [1]
+    assert c2i.convert2int_many(["1", "I", "一"]) == [1, 1, 1]
+    assert c2i.convert2int_many(["1", "9" * 5000], errors="coerce") == [1, None]
+    assert c2i.Cache().try_convert2int("9" * 5000) == (None, OVERFLOW)
+    print(">>> OK <<<\n")
+
+
+def test_formatter():
+    print("=== test_formatter ===")
+
+    numbers = [randint(-10**12 + 1, 10**12 - 1) for i in range(1000)] + list(range(-100, 30000, 3)) + [10**12]
+    floats = [n / 997 for n in numbers]
+    options = [
+        {},
+        {"lower": False, "use_liang": True, "use_simple_zero_tail": True},
+        {"use_simple_ten": True, "width": 20},
+        {"enumeration": True, "use_upper_zero": True, "width": 13},
+    ]
+
+    print("1. format, format_many")
+    for option in options:
+        formatter = c2i.Formatter(**option)
+        expected = [c2i.int2chinese(n, **option) for n in numbers]
+        assert [formatter.format(n) for n in numbers] == expected, option
+        assert formatter.format_many(numbers) == expected, option
+        assert formatter(numbers[0]) == expected[0]
+
+    print("2. format_float, format_float_many")
+    formatter = c2i.Formatter(lower=False, use_liang=True, precision=3)
+    expected = [c2i.float2chinese(n, lower=False, use_liang=True, precision=3) for n in floats]
+    assert formatter.format_float_many(floats) == expected
+    assert list(formatter.format_float_many(floats, lazy=True)) == expected
+    print(">>> OK <<<\n")
+
+
+def test_parser():
+    print("=== test_parser ===")
+    CHARACTER = c2i.Status.INVALID_CHARACTER
+    GRAMMAR = c2i.Status.INVALID_GRAMMAR
+    dataset = {
+        "默认, 同chinese2int": ({}, {
+            "二千伍佰六十叁": 2563,
+            "负一二三": -123,
+            "一千二百三四": GRAMMAR,
+        }),
+        "不接受大小写混合": ({"mixed_case": False}, {
+            "二千伍佰六十叁": CHARACTER,
+            "贰仟伍佰陆拾叁": 2563,
+            "零零二千": 2000,
+            "负贰仟": CHARACTER,
+            "負贰仟": -2000,
+        }),
+        "只接受小写": ({"upper": False}, {
+            "二千五百": 2500,
+            "贰仟": CHARACTER,
+        }),
+        "不接受两, 阿拉伯数字, 正负号": ({"liang": False, "arabic": False, "sign": False}, {
+            "两千": CHARACTER,
+            "1千": CHARACTER,
+            "负一": CHARACTER,
+            "二千": 2000,
+        }),
+        "只接受枚举表示": ({"traditional": False}, {
+            "一二三": 123,
+            "一百二十三": GRAMMAR,
+        }),
+        "只接受传统表示": ({"enumeration": False}, {
+            "一二三": GRAMMAR,
+            "一百二十三": 123,
+            "三": 3,
+        }),
+    }
+
+    for i, (info, (option, cases)) in enumerate(dataset.items()):
+        print("%d. %s" % (i + 1, info))
+        parser = c2i.Parser(**option)
+        for s, result in cases.items():
+            number, status = parser.try_parse(s)
+            r = status if status else number
+            assert r == result, "%s => %s | %s" % (s, str(r), str(result))
+
+    print("%d. parse_float, parse_many" % (len(dataset) + 1))
+    parser = c2i.Parser(upper=False, liang=False)
+    assert parser.parse_float("负三点一四万") == c2i.chinese2float("负三点一四万")
+    assert parser.parse_float_many(["三点一四", "三點一四"], errors="coerce") == [3.14, None]
+    assert parser.parse_many(["一", "两", "三"], errors="ignore") == [1, 3]
+    try:
+        parser.parse("两")
+        raise Exception("两")
+    except KeyError:
+        pass
+    print(">>> OK <<<\n")
+
+
+def test_cache():
+    print("=== test_cache ===")
+    cache = c2i.Cache(maxsize=3)
+
+    print("1. 转换结果与函数相同")
+    assert cache.chinese2int("一百二十三") == 123
+    assert cache.chinese2int("一百二十三") == 123
+    assert cache.chinese2float("三点一四") == 3.14
+    assert cache.convert2int("XI") == 11
+    assert cache.int2chinese(123, lower=False) == c2i.int2chinese(123, lower=False)
+    assert cache.info() == {"hits": 1, "misses": 4, "evictions": 1, "size": 3, "maxsize": 3}
+
+    print("2. 缓存失败的结果")
+    cache.clear()
+    for i in range(2):
+        assert cache.try_chinese2int("一二百", -1) == (-1, c2i.Status.INVALID_GRAMMAR)
+        try:
+            cache.chinese2int("一二百")
+            raise Exception("一二百")
+        except ValueError:
+            pass
+    assert cache.hits == 3 and cache.misses == 1
+
+    print("3. LRU淘汰")
+    cache.clear()
+    for s in ["一", "二", "三", "一", "四", "一"]:
+        cache.chinese2int(s)
+    assert list(cache.data) == [(0, "三"), (0, "四"), (0, "一")]
+    assert cache.info()["evictions"] == 1
+
+    print("4. 不限制大小")
+    cache = c2i.Cache(maxsize=None)
+    for i in range(1000):
+        cache.int2chinese(i)
+    assert len(cache) == 1000 and cache.evictions == 0
+    print(">>> OK <<<\n")
+
+
+def test_int2chinese_array():
+    print("=== test_int2chinese_array ===")
+    if cn2int.array.np is None:
+        print(">>> SKIP: NumPy未安装 <<<\n")
+        return
+
+    numbers = [randint(-10**12 + 1, 10**12 - 1) for i in range(500)] + list(range(-100, 3000, 7))
+    numbers += [randint(1, 99) * 10**randint(0, 10) for i in range(500)] + [10**8 + 2, 2 * 10**8 + 20000]
+    names = ["lower", "enumeration", "use_liang", "use_simple_ten", "use_simple_zero_tail", "use_upper_zero"]
+
+    print("1. 所有选项组合, 与int2chinese一致")
+    for i in range(2**len(names)):
+        option = {name: bool(i >> j & 1) for j, name in enumerate(names)}
+        for width in (0, 14):
+            expected = [c2i.int2chinese(n, width=width, **option) for n in numbers]
+            strings = cn2int.array.int2chinese_array(numbers, width=width, output="list", **option)
+            assert strings == expected, (option, width)
+
+    print("2. 超出转换范围")
+    numbers = [10**12, -10**12, 1]
+    assert cn2int.array.int2chinese_array(numbers).tolist() == ["", "", "一"]
+    assert cn2int.array.int2chinese_array(numbers, output="list") == [None, None, "一"]
+    print(">>> OK <<<\n")
+
+
+def test_chinese2int_array():
+    print("=== test_chinese2int_array ===")
+    if cn2int.array.np is None:
+        print(">>> SKIP: NumPy未安装 <<<\n")
+        return
+
+    print("1. 与try_chinese2int一致, 包括状态码")
+    alphabet = "零〇一二三四五六七八九十百千万亿壹拾佰萬两负正点x1"
+    strings = ["".join(choice(alphabet) for j in range(randint(0, 9))) for i in range(2000)]
+    for i in range(500):
+        number = randint(-10**12 + 1, 10**12 - 1)
+        strings += [c2i.int2chinese(number), c2i.int2chinese(number, lower=False, use_liang=True),
+                    c2i.int2chinese(number, enumeration=True, width=14)]
+    strings += ["", "负", "一万万", "四万万五千万", "万万", "零" * 11 + "一二", "一" + "零" * 12]
+    numbers, status = cn2int.array.chinese2int_array_status(strings, chunksize=1000)
+    expected = [c2i.try_chinese2int(s, 0) for s in strings]
+    assert list(zip(numbers.tolist(), status.tolist())) == expected
+
+    print("2. valid数组")
+    numbers, valid = cn2int.array.chinese2int_array(["一百零五", "十一十", "负二十"])
+    assert numbers.tolist() == [105, 0, -20]
+    assert valid.tolist() == [True, False, True]
+
+    print("3. 超过MAX_WIDTH个字符的项逐个转换")
+    long = ["一" * 5000, "九千九百亿" + "零" * 30, "一千" * 20, "负" + "〇" * 40 + "七"]
+    strings = strings[:1500] + long[:2] + strings[1500:3000] + long[2:]
+    expected = [c2i.try_chinese2int(s, 0) for s in strings]
+    for data in (strings, cn2int.array.np.array(strings), cn2int.array.np.array(strings, dtype=object)):
+        numbers, status = cn2int.array.chinese2int_array_status(data, chunksize=1000)
+        assert list(zip(numbers.tolist(), status.tolist())) == expected
+    print(">>> OK <<<\n")
+
+
+def test_float2chinese_array():
+    print("=== test_float2chinese_array ===")
+    if cn2int.array.np is None:
+        print(">>> SKIP: NumPy未安装 <<<\n")
+        return
+
+    print("1. 与float2chinese一致, 包括舍入")
+    numbers = [randint(-10**12 + 1, 10**12 - 1) / 10**randint(0, 8) for i in range(1000)]
+    numbers += [0.5, -0.5, 0.9999999, 1.5, 2.5, 1.005, 2.675, -0.0, 999999999999.99999]
+    strings = []
+    for precision in (0, 2, 6, 12):
+        for lower in (True, False):
+            expected = [c2i.float2chinese(n, lower=lower, precision=precision) for n in numbers[:-1]]
+            result = cn2int.array.float2chinese_array(numbers, lower=lower, precision=precision,
+                                                      output="list")
+            assert result[:-1] == expected, (precision, lower)
+            assert result[-1] is None
+            strings += expected
+    assert cn2int.array.float2chinese_array([1e12, float("nan"), 1.0]).tolist() == \
+        ["", "", "一点零零零零零零"]
+
+    print("2. 与try_chinese2float一致, 包括状态码")
+    alphabet = "零一二三四五六七八九十百千万亿两负点點x"
+    strings += ["".join(choice(alphabet) for j in range(randint(0, 10))) for i in range(2000)]
+    strings += ["五点八亿", "六点三万", "负点五", "一点", "一二点五", "五点一二三四五六七八九零一二三"]
+    strings += ["一" * 5000, "零点" + "五" * 40, "三" + "点" * 40]
+    numbers, status = cn2int.array.chinese2float_array_status(strings, chunksize=1000)
+    for s, number, code in zip(strings, numbers.tolist(), status.tolist()):
+        expected, expected_code = c2i.try_chinese2float(s)
+        assert code == expected_code, s
+        assert (math.isnan(number) if code else number == expected), s
+
+    print("3. valid数组")
+    numbers, valid = cn2int.array.chinese2float_array(["一百点零五", "点五", "负二点五"])
+    assert numbers[0] == 100.05 and math.isnan(numbers[1]) and numbers[2] == -2.5
+    assert valid.tolist() == [True, False, True]
+    print(">>> OK <<<\n")
+
+
+def test_arrow():
+    print("=== test_arrow ===")
+    if cn2int.arrow.pa is None or cn2int.array.np is None:
+        print(">>> SKIP: pyarrow或NumPy未安装 <<<\n")
+        return
+    pa = cn2int.arrow.pa
+
+    print("1. 中文数字 => 整数/浮点数, null和转换失败的项为null")
+    data = pa.array(["一百零五", None, "十一十", "负二十", "三点五", "一" * 5000])
+    assert cn2int.arrow.chinese2int(data).to_pylist() == [105, None, None, -20, None, None]
+    assert cn2int.arrow.chinese2float(data).to_pylist() == [105.0, None, None, -20.0, 3.5, None]
+
+    print("2. 按块转换, ChunkedArray保持分块")
+    numbers = [randint(-10**12 + 1, 10**12 - 1) for i in range(1000)]
+    strings = [c2i.int2chinese(n) for n in numbers]
+    chunked = pa.chunked_array([strings[:300], strings[300:]])
+    result = cn2int.arrow.chinese2int(chunked, chunksize=128)
+    assert isinstance(result, pa.ChunkedArray) and result.type == pa.int64()
+    assert result.to_pylist() == numbers
+    assert cn2int.arrow.chinese2int(pa.array([], type=pa.string())).to_pylist() == []
+
+    print("3. 整数/浮点数 => 中文数字")
+    result = cn2int.arrow.int2chinese(pa.array(numbers + [None, 10**12]), chunksize=128, lower=False)
+    assert result.to_pylist() == [c2i.int2chinese(n, lower=False) for n in numbers] + [None, None]
+    result = cn2int.arrow.float2chinese(pa.array([1.25, None, float("nan")]), precision=2)
+    assert result.to_pylist() == ["一点二五", None, None]
+    print(">>> OK <<<\n")
+
+
+def test_accessor():
+    print("=== test_accessor ===")
+    if cn2int.accessor.pd is None or cn2int.array.np is None:
+        print(">>> SKIP: pandas或NumPy未安装 <<<\n")
+        return
+    pd = cn2int.accessor.pd
+
+    series = pd.Series(["一百零五", None, "十一十", "负二十", "三点五", "一" * 5000],
+                       index=list("abcdef"), name="x")
+    result = series.cn2int.chinese2int(chunksize=2)
+    assert str(result.dtype) == "Int64" and result.name == "x" and list(result.index) == list("abcdef")
+    assert result.tolist() == [105, pd.NA, pd.NA, -20, pd.NA, pd.NA]
+    result = series.cn2int.chinese2float()
+    assert str(result.dtype) == "Float64"
+    assert result.tolist() == [105.0, pd.NA, pd.NA, -20.0, 3.5, pd.NA]
+
+    numbers = pd.Series([12, None, 10**12, 20000], dtype="Int64")
+    result = numbers.cn2int.int2chinese(chunksize=3, use_liang=True)
+    assert result.tolist() == ["一十二", pd.NA, pd.NA, "两万"]
+    result = pd.Series([1.25, None]).cn2int.float2chinese(precision=2)
+    assert result.tolist() == ["一点二五", pd.NA]
+    print(">>> OK <<<\n")
+
+
+def test_find_numerals():
+    print("=== test_find_numerals ===")
+    text = "第二十三章共一万二千字, 价格-3.5元, 1-2页, Chapter XIV, MIXED, 负五点三万人, 三点钟, 三百二二"
+
+    print("1. 查找并转换")
+    result = [(text[start:end], value, kind) for start, end, value, kind in c2i.find_numerals(text)]
+    assert result == [("二十三", 23, "chinese"), ("一万二千", 12000, "chinese"),
+                      ("-3.5", -3.5, "arabic"), ("1", 1, "arabic"), ("2", 2, "arabic"),
+                      ("XIV", 14, "roman"), ("负五点三万", -53000.0, "chinese"),
+                      ("三", 3, "chinese")]
+    assert [kind for *_, kind in c2i.find_numerals(text, chinese=False, arabic=False)] == ["roman"]
+
+    print("2. 按块读取文件对象, 跨越块边界的数字")
+    text = text * 20
+    expected = list(c2i.find_numerals(text))
+    for chunksize in (1, 2, 7, 100):
+        assert list(c2i.find_numerals(io.StringIO(text), chunksize=chunksize)) == expected
+        assert list(c2i.find_numerals(io.BytesIO(text.encode()), chunksize=chunksize)) == expected
+
+    print("3. 超过int()位数上限的阿拉伯数字片段被忽略")
+    digits = "9" * 5000
+    text = "编号" + digits + ", 第二十三章, -" + digits + "页"
+    assert [value for *_, value, kind in c2i.find_numerals(text)] == [23]
+    assert c2i.normalize_text(text) == "编号" + digits + ", 第23章, -" + digits + "页"
+    print(">>> OK <<<\n")
+
+
+def test_normalize_text():
+    print("=== test_normalize_text ===")
+    text = "第二十三章共一万二千字, 价格-3.5元, 负五点三万人, 三点一四, 零零七, 三百二二, Chapter XIV"
+
+    print("1. 改写选项")
+    assert c2i.normalize_text(text) == \
+        "第23章共12000字, 价格-3.5元, -53000人, 3.14, 007, 三百二二, Chapter XIV"
+    assert c2i.normalize_text(text, enumeration=False, decimal=False, roman=True) == \
+        "第23章共12000字, 价格-3.5元, 负五点三万人, 三点一四, 零零七, 三百二二, Chapter 14"
+    assert c2i.normalize_text(text, traditional=False, enumeration=False, decimal=False) == text
+    for s, expected in [("一亿二千三百四十五万六千七百八十九点一二三", "123456789.123"),
+                        ("一千二百三十四万点五六七八", "12340000.5678"),
+                        ("九千九百亿点九九", "990000000000.99"),
+                        ("零点零零一", "0.001"), ("负零点零", "0"), ("五点八亿", "580000000")]:
+        assert c2i.normalize_text(s) == expected, s
+
+    print("2. 按块读取文件对象")
+    text = text * 20
+    expected = c2i.normalize_text(text, roman=True)
+    for chunksize in (1, 3, 64):
+        pieces = c2i.normalize_text(io.StringIO(text), roman=True, chunksize=chunksize)
+        assert "".join(pieces) == expected
+    print(">>> OK <<<\n")
+
+
+def test_incremental_parser():
+    print("=== test_incremental_parser ===")
+
+    print("1. 每个前缀的结果和状态码与chinese2int一致")
+    strings = []
+    for i in range(300):
+        number = randint(-10**12 + 1, 10**12 - 1)
+        strings += [c2i.int2chinese(number), c2i.int2chinese(number, use_simple_zero_tail=True,
+                                                             use_simple_ten=True, use_liang=True)]
+    alphabet = "零一二九十百千万亿负x"
+    strings += ["".join(choice(alphabet) for j in range(randint(1, 12))) for i in range(2000)]
+    strings += ["一万万五", "四万五千万", "零十五", "一百五零", "三万亿", "十"]
+    for s in strings:
+        parser = c2i.IncrementalParser()
+        for i, ch in enumerate(s):
+            parser.feed(ch)
+            number, status = c2i.try_chinese2int(s[:i + 1])
+            assert parser.value == number and parser.status == status, s[:i + 1]
+            assert parser.is_complete == (status == c2i.Status.OK)
+
+    print("2. 浮点数")
+    strings = [c2i.float2chinese(randint(-10**8, 10**8) / 100, precision=randint(1, 4)) for i in range(300)]
+    strings += ["".join(choice("零一九十百万点负") for j in range(randint(1, 10))) for i in range(2000)]
+    strings += ["五点八亿", "六点三万", "负点五", "一零点五", "五点一二三四五六七八九零一二三"]
+    for s in strings:
+        parser = c2i.IncrementalParser(decimal=True)
+        for i, ch in enumerate(s):
+            parser.feed(ch)
+            number, status = c2i.try_chinese2float(s[:i + 1])
+            assert parser.value == number and parser.status == status, s[:i + 1]
+
+    print("3. 异常与chinese2int一致")
+    parser = c2i.IncrementalParser()
+    parser.feed("三百二")
+    assert parser.result() == 320
+    parser.feed("二")
+    try:
+        parser.result()
+    except ValueError:
+        pass
+    else:
+        assert False
+    parser.reset()
+    parser.feed("一千")
+    assert parser.text == "一千" and parser.value == 1000
+    print(">>> OK <<<\n")
+
+
+def test_cli():
+    print("=== test_cli ===")
+    directory = tempfile.mkdtemp()
+    src = os.path.join(directory, "input")
+    dst = os.path.join(directory, "output")
+
+    def run(content, *argv):
+        with open(src, "w", encoding="utf-8", newline="") as f:
+            f.write(content)
+        code = cli_main(list(argv) + [src, "-o", dst])
+        with open(dst, encoding="utf-8", newline="") as f:
+            return code, f.read()
+
+    print("1. lines")
+    assert run("一百二十三\n负四十五\r\n", "chinese2int") == (0, "123\n-45\r\n")
+    assert run("123\n-20002", "int2chinese", "--upper", "--liang") == \
+        (0, "壹佰贰拾叁\n負两萬零贰")
+    assert run("XVI\n", "roman2int") == (0, "16\n")
+
+    print("2. tsv, csv")
+    assert run("a\tb\n1\t三点五\n", "chinese2float", "-f", "tsv", "-c", "2", "--header") == \
+        (0, "a\tb\n1\t3.5\n")
+    assert run('x,"十二"\ny,"一,"\n', "convert2int", "-f", "csv", "-c", "2", "-e", "coerce",
+               "--default", "NA") == (0, "x,12\ny,NA\n")
+    assert run("一\t二\n三\n", "chinese2int", "-f", "tsv", "-c", "2", "-e", "coerce",
+               "--default", "NA") == (0, "一\t2\n三\tNA\n")
+
+    print("3. errors")
+    assert run("一\nx\n二\n", "chinese2int", "-e", "ignore") == (0, "1\n2\n")
+    assert run("一\nx\n二\n", "chinese2int", "-e", "coerce") == (0, "1\n\n2\n")
+    assert run("一\nx\n二\n", "chinese2int")[0] == 1
+    print(">>> OK <<<\n")
+
+
+def test_convert_file():
+    print("=== test_convert_file ===")
+    directory = tempfile.mkdtemp()
+    src = os.path.join(directory, "input")
+    dst = os.path.join(directory, "output")
+
+    def run(content, **kwargs):
+        with open(src, "wb") as f:
+            f.write(content.encode("utf-8"))
+        info = c2i.convert_file(src, dst, **kwargs)
+        with open(dst, "rb") as f:
+            return info, f.read().decode("utf-8")
+
+    print("1. 与逐个转换一致, 块边界对齐到行")
+    numbers = [randint(-10**12 + 1, 10**12 - 1) for _ in range(2000)]
+    content = "\n".join(c2i.int2chinese(n) for n in numbers) + "\n"
+    for chunksize in [1, 7, 100, 1 << 22]:
+        info, text = run(content, chunksize=chunksize)
+        assert info == {"rows": 2000, "errors": 0}
+        assert text == "".join("%d\n" % n for n in numbers)
+    info, text = run("12\r\n-3", mode="int2chinese", lower=False)
+    assert text == "壹拾贰\r\n負叁"
+
+    print("2. errors")
+    assert run("一\nx\n二\n", errors="coerce", default="NA") == \
+        ({"rows": 3, "errors": 1}, "1\nNA\n2\n")
+    assert run("一\r\nx\r\n二", errors="ignore", chunksize=5)[1] == "1\r\n2"
+    assert run("", mode="roman2int") == ({"rows": 0, "errors": 0}, "")
+    try:
+        run("一\nx\n", chunksize=3)
+    except ValueError as e:
+        assert "line 2" in str(e)
+    else:
+        assert False
+    print(">>> OK <<<\n")
+
+
+def test_parallel_convert():
+    print("=== test_parallel_convert ===")
+    numbers = [randint(-10**12 + 1, 10**12 - 1) for _ in range(5000)]
+    strings = [c2i.int2chinese(n) for n in numbers]
+
+    print("1. list, generator, 文件对象, 结果按输入的顺序")
+    for workers in [1, 3]:
+        assert c2i.parallel_convert(strings, c2i.chinese2int, workers=workers,
+                                    chunksize=333) == numbers
+        assert list(c2i.parallel_convert(iter(numbers), c2i.int2chinese, workers=workers,
+                                         chunksize=333, lazy=True)) == strings
+        stream = io.StringIO("\r\n".join(strings))
+        assert c2i.parallel_convert(stream, c2i.chinese2int, workers=workers,
+                                    chunksize=333) == numbers
+
+    print("2. 文件路径")
+    path = os.path.join(tempfile.mkdtemp(), "input")
+    with open(path, "w", encoding="utf-8") as f:
+        f.write("\n".join(strings) + "\n")
+    for workers in [1, 2]:
+        assert c2i.parallel_convert(path, c2i.chinese2int, workers=workers,
+                                    chunksize=10) == numbers
+
+    print("3. NumPy数组, 共享内存")
+    if cn2int.array.np is None:
+        print("SKIP: numpy is not installed")
+    else:
+        np = cn2int.array.np
+        assert c2i.parallel_convert(np.array(numbers), c2i.int2chinese, workers=2,
+                                    chunksize=333) == strings
+        assert c2i.parallel_convert(np.array(strings), c2i.chinese2int, workers=2,
+                                    chunksize=333) == numbers
+
+    print("4. 转换失败时抛出异常")
+    try:
+        c2i.parallel_convert(["一", "十一十"], c2i.chinese2int, workers=2, chunksize=1)
+    except ValueError:
+        pass
+    else:
+        assert False
+    print(">>> OK <<<\n")
+
+
+def test_aio():
+    print("=== test_aio ===")
+    numbers = [randint(-10**12 + 1, 10**12 - 1) for _ in range(3000)]
+    strings = [c2i.int2chinese(n, lower=False) for n in numbers]
+
+    async def agenerate(items):
+        for item in items:
+            yield item
+
+    async def run():
+        print("1. 结果与批量转换一致")
+        assert await cn2int.aio.achinese2int_many(strings, chunksize=100) == numbers
+        assert await cn2int.aio.aint2chinese_many(numbers, chunksize=7, lower=False) == strings
+        assert await cn2int.aio.afloat2chinese_many([3.14], precision=2) == ["三点一四"]
+        assert await cn2int.aio.aroman2int_many(["XVI", "ABC"], errors="coerce") == [16, None]
+        assert await cn2int.aio.aconvert2int_many(["12", "十二"]) == [12, 12]
+
+        print("2. 异步迭代器输入和输出")
+        results = cn2int.aio.achinese2int_many(agenerate(strings), lazy=True, chunksize=64)
+        assert [n async for n in results] == numbers
+        assert await cn2int.aio.achinese2float_many(agenerate(["一", "x", "二点五"]),
+                                                    errors="ignore") == [1.0, 2.5]
+
+        print("3. 转换失败时抛出异常")
+        try:
+            await cn2int.aio.achinese2int_many(["一", "十一十"], chunksize=1)
+        except ValueError:
+            pass
+        else:
+            assert False
+
+    asyncio.run(run())
+    print(">>> OK <<<\n")
+
+
+def test_server():
+    print("=== test_server ===")
+    server = cn2int.server.make_server(port=0, max_delay=0.01)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    host, port = server.server_address[:2]
+
+    def post(mode, body, content_type="application/json"):
+        connection = http.client.HTTPConnection(host, port)
+        connection.request("POST", "/" + mode, body.encode("utf-8"),
+                           {"Content-Type": content_type})
+        response = connection.getresponse()
+        data = response.read().decode("utf-8")
+        connection.close()
+        return response.status, data
+
+    print("1. JSON, 每项的结果或错误")
+    status, data = post("chinese2int", '["一百二十三", "x", "十一十"]')
+    assert status == 200
+    assert json.loads(data) == {"results": [
+        {"value": 123},
+        {"error": "KeyError: invalid character in Chinese numerals"},
+        {"error": "ValueError: invalid Chinese numerals"}], "errors": 2}
+    status, data = post("int2chinese", '{"items": [12, 10000000000000, "1"],'
+                                       ' "options": {"lower": false}}')
+    assert [r.get("value") for r in json.loads(data)["results"]] == ["壹拾贰", None, None]
+    assert post("int2chinese", '{"items": [1], "options": {"x": 1}}')[0] == 400
+    assert post("foo", "[]")[0] == 404
+    # README中curl -d的例子, Content-Type为application/x-www-form-urlencoded
+    form = "application/x-www-form-urlencoded"
+    status, data = post("chinese2int", '["一百二十三", "x"]', form)
+    assert json.loads(data) == {"results": [
+        {"value": 123},
+        {"error": "KeyError: invalid character in Chinese numerals"}], "errors": 1}
+    status, data = post("int2chinese", '{"items": [123], "options": {"lower": false}}', form)
+    assert json.loads(data)["results"] == [{"value": "壹佰贰拾叁"}]
+
+    print("2. 按行分隔")
+    status, data = post("roman2int", "XVI\r\nABC\n", "text/plain")
+    lines = [json.loads(line) for line in data.splitlines()]
+    assert lines[0] == {"value": 16} and "error" in lines[1]
+    status, data = post("float2chinese", "3.5\n", "text/plain")
+    assert data == '{"value": "三点五零零零零零"}\n'
+
+    print("3. 并发请求合并成批次")
+    numbers = [randint(0, 10**12 - 1) for _ in range(400)]
+
+    def worker(i):
+        chunk = numbers[i * 40:(i + 1) * 40]
+        data = post("chinese2int", json.dumps([c2i.int2chinese(n) for n in chunk]))[1]
+        assert [r["value"] for r in json.loads(data)["results"]] == chunk
+    threads = [threading.Thread(target=worker, args=(i,)) for i in range(10)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert server.batcher.batches <= server.batcher.requests
+    server.shutdown()
+    server.server_close()
+
+    print("4. Unix socket")
+    if not hasattr(socket, "AF_UNIX"):
+        print("SKIP: unix socket is not supported")
+    else:
+        path = os.path.join(tempfile.mkdtemp(), "cn2int.sock")
+        server = cn2int.server.make_server(unix=path)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        result = cn2int.server.bench(unix=path, concurrency=2, requests=20, batch=3,
+                                     stream=io.StringIO())
+        assert result["requests"] == 20 and result["p99"] >= result["p50"]
+        server.shutdown()
+        server.server_close()
+    print(">>> OK <<<\n")
+
+
+def test_convert2int_column():
+    print("=== test_convert2int_column ===")
+    from cn2int.cn2int import column_format
+    numbers = [randint(-10**12 + 1, 10**12 - 1) for _ in range(1000)]
+    columns = {"arabic": [str(n) for n in numbers],
+               "roman": [c2i.int2roman(randint(1, 3999)) for _ in range(1000)],
+               "traditional": [c2i.int2chinese(n, use_liang=True) for n in numbers],
+               "enumeration": [c2i.int2chinese(n, enumeration=True, lower=False)
+                               for n in numbers]}
+    outliers = ["", "x", "十一十", "一2三", "1二", "xvi", "IIII", "一零", "负", "正一二",
+                "+一", " 12 ", "1_000", "零" * 13 + "一", "九" * 13, "１２"]
+
+    print("1. 推断格式")
+    for form, strings in columns.items():
+        assert column_format(strings) == form
+    assert column_format(columns["arabic"][:10] + columns["roman"][:10]) == "mixed"
+
+    print("2. 结果与convert2int_many一致, 包括异常值")
+    for form, strings in columns.items():
+        strings = strings + outliers * 2
+        for errors in ["coerce", "ignore"]:
+            assert c2i.convert2int_column(strings, errors=errors, default=-1) == \
+                c2i.convert2int_many(strings, errors=errors, default=-1)
+        assert c2i.convert2int_column(iter(strings[:100])) == c2i.convert2int_many(strings[:100])
+        try:
+            c2i.convert2int_column(strings[:1000] + ["十一十"])
+        except ValueError:
+            pass
+        else:
+            assert False
+    print(">>> OK <<<\n")
+
+
+def test_validate():
+    print("=== test_validate ===")
+    chars = "〇一二三四五六七八九十百千万亿零壹贰两萬负正点點1２a \0"
+    strings = ["".join(choice(chars) for _ in range(randint(0, 8))) for _ in range(3000)]
+    strings += [c2i.int2chinese(randint(-10**12 + 1, 10**12 - 1)) for _ in range(1000)]
+    strings += [c2i.float2chinese(randint(-10**6, 10**6) / 7) for _ in range(500)]
+    strings += ["一" * 5000, "一千" * 20, "零点" + "五" * 40]
+
+    print("1. 与try_chinese2int, try_chinese2float一致")
+    for decimal, try_convert in [(False, c2i.try_chinese2int), (True, c2i.try_chinese2float)]:
+        expected = [s for s in strings if not try_convert(s)[1]]
+        assert [s for s in strings if c2i.is_chinese_numeral(s, decimal)] == expected
+        assert c2i.filter_chinese_numerals(strings, decimal) == expected
+        assert c2i.filter_chinese_numerals(strings[:100], decimal) == \
+            [s for s in strings[:100] if not try_convert(s)[1]]
+        assert list(c2i.filter_chinese_numerals(iter(strings), decimal, lazy=True)) == expected
+    assert not c2i.is_chinese_numeral("三百二二")
+    assert not c2i.is_chinese_numeral(None) and not c2i.is_chinese_numeral(123)
+
+    print("2. 罗马数字")
+    romans = ["XIV", "xiv", "IIII", "", "MMMM", "ABC", 5, "MCMXCIV"]
+    assert [c2i.is_roman_numeral(s) for s in romans] == \
+        [True, True, False, False, False, False, False, True]
+    assert c2i.filter_roman_numerals(romans) == ["XIV", "xiv", "MCMXCIV"]
+    print(">>> OK <<<\n")
+
+
+def test_canonicalize():
+    print("=== test_canonicalize ===")
+    print("1. 同一个数的各种写法得到相同的规范形式")
+    assert c2i.canonicalize_many(["贰仟伍佰", "二千五百", "两千五", "二千五", "零二千五百",
+                                  "二五〇〇", "2500"]) == ["二千五百"] * 7
+    for i in range(2000):
+        number = randint(-10**12 + 1, 10**12 - 1)
+        expected = c2i.int2chinese(number)
+        for options in [{}, {"lower": False}, {"use_liang": True, "use_simple_zero_tail": True},
+                        {"use_simple_ten": True}, {"enumeration": True, "lower": False}]:
+            assert c2i.canonicalize(c2i.int2chinese(number, **options)) == expected
+
+    print("2. 与int2chinese(chinese2int(s))一致, 包括转换失败")
+    chars = "〇一二三四五六七八九十百千万亿零壹贰两萬億負负正点1２a"
+    for i in range(20000):
+        s = "".join(choice(chars) for _ in range(randint(0, 8)))
+        number, status = c2i.try_chinese2int(s)
+        expected = (None, status) if status else (c2i.int2chinese(number), status)
+        assert c2i.try_canonicalize(s) == expected, s
+    assert c2i.canonicalize_many(["一", "x", "一正"], errors="coerce", default="") == ["一", "", ""]
+    try:
+        c2i.canonicalize("三百二二")
+    except ValueError:
+        pass
+    else:
+        assert False
+    print(">>> OK <<<\n")
+
+
+def test_transcode():
+    print("=== test_transcode ===")
+    print("1. 各种格式之间转码")
+    assert c2i.transcode("二千五百", {"lower": False}) == "贰仟伍佰"
+    assert c2i.transcode("二千五百", {"use_liang": True, "use_simple_zero_tail": True}) == "两千五"
+    assert c2i.transcode("两千五") == "二千五百"
+    assert c2i.transcode("一十二万", {"use_simple_ten": True, "lower": False}) == "拾贰萬"
+    assert c2i.transcode("二亿零二万", {"use_liang": True}) == "两亿零两万"
+    assert c2i.transcode("一百二十三", {"enumeration": True}) == "一二三"
+    assert c2i.transcode("〇〇七", {"enumeration": True, "lower": False, "width": 2}) == "零柒"
+    assert c2i.transcode("负〇", {"enumeration": True}) == "〇"
+    options = [{}, {"lower": False}, {"use_liang": True}, {"use_simple_ten": True},
+               {"use_simple_zero_tail": True, "use_liang": True, "lower": False},
+               {"width": 8}, {"enumeration": True}, {"enumeration": True, "use_upper_zero": True},
+               {"enumeration": True, "lower": False, "width": 8}]
+    for i in range(2000):
+        number = randint(-10**12 + 1, 10**12 - 1) if i % 2 else randint(-30000, 30000)
+        for source in options:
+            s = c2i.int2chinese(number, **source)
+            for to in options:
+                expected = c2i.int2chinese(c2i.chinese2int(s), **to)
+                assert c2i.transcode(s, to) == expected, (s, to)
+
+    print("2. 与int2chinese(chinese2int(s), **to)一致, 包括转换失败")
+    chars = "〇一二三四五六七八九十百千万亿零壹贰两萬億負负正点1２a"
+    for i in range(5000):
+        s = "".join(choice(chars) for _ in range(randint(0, 10)))
+        number, status = c2i.try_chinese2int(s)
+        for to in options:
+            expected = (None, status) if status else (c2i.int2chinese(number, **to), status)
+            assert c2i.try_transcode(s, to) == expected, (s, to)
+
+    print("3. 批量转码")
+    formatter = c2i.Formatter(lower=False, precision=2)
+    assert c2i.transcode_many(["一", "二十", "x", "两百"], to=formatter, errors="coerce",
+                              default="") == ["壹", "贰拾", "", "贰佰"]
+    assert c2i.transcode_many(["一", "x", "三百二二"], errors="ignore") == ["一"]
+    assert list(c2i.transcode_many(["二", "三"], {"enumeration": True}, lazy=True)) == ["二", "三"]
+    try:
+        c2i.transcode_many(["一", "三百二二"])
+    except ValueError:
+        pass
+    else:
+        assert False
+    print(">>> OK <<<\n")
+
+
 if __name__ == "__main__":
     test_roman2int()
     test_chinese2int()
+    test_int2chinese()
     test_chinese2float()
     test_convert2int()
+    test_many()
+    test_formatter()
+    test_parser()
+    test_cache()
+    test_incremental_parser()
+    test_int2chinese_array()
+    test_chinese2int_array()
+    test_float2chinese_array()
+    test_arrow()
+    test_accessor()
+    test_try()
+    test_find_numerals()
+    test_normalize_text()
+    test_cli()
+    test_convert_file()
+    test_parallel_convert()
+    test_aio()
+    test_server()
+    test_convert2int_column()
+    test_validate()
+    test_canonicalize()
+    test_transcode()